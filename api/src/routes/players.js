@@ -1,8 +1,8 @@
 /**
  * Rotas de jogadores
  * GET /api/players/:name               — stats de temporada do jogador
- * GET /api/players/:name/boxscores     — últimos jogos
- * GET /api/players/:name/props         — análise de props para apostas
+ * GET /api/players/:name/boxscores     — últimos jogos (?jogos=N, padrão 20)
+ * GET /api/players/:name/props         — análise de props (?jogos=N, padrão: temporada)
  * GET /api/players/team/:team          — todos os jogadores de um time
  */
 const router = require('express').Router()
@@ -10,6 +10,30 @@ const pool = require('../db/pool')
 
 const round = (v, n = 1) => (v == null ? null : +parseFloat(v).toFixed(n))
 
+// Últimos N jogos de cada jogador cujo nome casa com $1, a partir do game
+// log da temporada. O LATERAL lê cada jogador pelo índice
+// (player_name, game_date DESC) e para após N linhas.
+const GAME_LOG_LAST_N = `
+  SELECT p.player_name, g.*
+  FROM (SELECT DISTINCT player_name FROM player_game_log
+        WHERE player_name ILIKE $1) p
+  CROSS JOIN LATERAL (
+    SELECT game_date, team, opponent, position, minutes,
+           points, total_reb, assists, steals, blocks, turnovers,
+           fg, fga, fg3, f3a, ft, fta
+    FROM player_game_log
+    WHERE player_name = p.player_name
+    ORDER BY game_date DESC
+    LIMIT $2
+  ) g
+  ORDER BY g.game_date DESC
+`
+
+const lastN = (value, fallback) => {
+  const n = parseInt(value, 10)
+  return Number.isInteger(n) && n > 0 ? n : fallback
+}
+
 // ── GET /api/players/team/:team ──────────────────────────────────────
 router.get('/team/:team', async (req, res) => {
   const team = req.params.team.toUpperCase()
@@ -98,17 +122,11 @@ router.get('/:name/boxscores', async (req, res) => {
   try {
     const { rows } = await pool.query(
       `
-      SELECT
-        game_date, team, opponent, position, minutes,
-        points, total_reb, assists, steals, blocks, turnovers,
-        fg, fga,
-        ROUND(fg::NUMERIC / NULLIF(fga, 0) * 100, 1)   AS fg_pct,
-        fg3, f3a, ft, fta
-      FROM latest_boxscore_lines
-      WHERE player_name ILIKE $1
-      ORDER BY game_date DESC
+      SELECT b.*, ROUND(b.fg::NUMERIC / NULLIF(b.fga, 0) * 100, 1) AS fg_pct
+      FROM (${GAME_LOG_LAST_N}) b
+      ORDER BY b.game_date DESC
     `,
-      [`%${name}%`]
+      [`%${name}%`, lastN(req.query.jogos, 20)]
     )
 
     res.json({ jogador: name, total_jogos: rows.length, boxscores: rows })
@@ -133,16 +151,22 @@ router.get('/:name/props', async (req, res) => {
       [`%${name}%`]
     )
 
-    // Últimos jogos para desvio padrão
-    const { rows: box } = await pool.query(
-      `
-      SELECT points, total_reb, assists, steals, blocks, turnovers, minutes
-      FROM latest_boxscore_lines
-      WHERE player_name ILIKE $1
-      ORDER BY game_date DESC
+    // Jogos da temporada (game log) para hit rates
+    const jogos = lastN(req.query.jogos, null)
+    const { rows: box } = await pool.query(GAME_LOG_LAST_N, [`%${name}%`, jogos])
+
+    // Agregados móveis (5/10/20 jogos e temporada) mantidos na ingestão:
+    // um lookup pela chave primária (player_name, window_size)
+    const { rows: rolling } = box.length
+      ? await pool.query(
+          `
+      SELECT * FROM player_rolling_averages
+      WHERE player_name = $1
+      ORDER BY window_size
     `,
-      [`%${name}%`]
-    )
+          [box[0].player_name]
+        )
+      : { rows: [] }
 
     if (!season[0])
       return res.status(404).json({ error: `Jogador "${name}" não encontrado` })
@@ -159,7 +183,7 @@ router.get('/:name/props', async (req, res) => {
     const topg = round(s.turnovers / g)
     const mpg = round(s.minutes / g)
 
-    // Desvio padrão a partir dos boxscores
+    // Desvio padrão a partir dos boxscores (janelas sem agregado)
     function stddev(arr, key) {
       const vals = arr.map(r => r[key]).filter(v => v != null)
       if (vals.length < 2) return null
@@ -175,9 +199,26 @@ router.get('/:name/props', async (req, res) => {
       return round((vals.filter(v => v > line).length / vals.length) * 100)
     }
 
-    const ptsStd = stddev(box, 'points')
-    const rebStd = stddev(box, 'total_reb')
-    const astStd = stddev(box, 'assists')
+    const agg = rolling.find(r => r.window_size === (jogos ?? 0))
+    const ptsStd = agg ? round(agg.pts_std) : stddev(box, 'points')
+    const rebStd = agg ? round(agg.reb_std) : stddev(box, 'total_reb')
+    const astStd = agg ? round(agg.ast_std) : stddev(box, 'assists')
+
+    const janelas = {}
+    for (const r of rolling) {
+      janelas[r.window_size ? `ultimos_${r.window_size}` : 'temporada'] = {
+        jogos: r.games,
+        pts_media: round(r.pts_avg),
+        pts_desvio_padrao: round(r.pts_std),
+        reb_media: round(r.reb_avg),
+        reb_desvio_padrao: round(r.reb_std),
+        ast_media: round(r.ast_avg),
+        ast_desvio_padrao: round(r.ast_std),
+        pra_media: round(r.pra_avg),
+        pra_desvio_padrao: round(r.pra_std),
+        pra_coef_variacao: round(r.pra_cv_pct)
+      }
+    }
 
     res.json({
       jogador: s.player_name,
@@ -203,6 +244,9 @@ router.get('/:name/props', async (req, res) => {
         ast_coef_variacao: apg ? round((astStd / apg) * 100) : null
       },
 
+      // Médias e desvios por janela (últimos 5/10/20 jogos e temporada)
+      janelas,
+
       // Hit rate para linhas comuns de apostas
       hit_rates: {
         pts_over_10: hitRate(box, 'points', 10),
@@ -0,0 +1,252 @@
+"""
+Suíte de benchmark dos parsers sobre o corpus de fixtures.
+
+benchmarks/fixtures/ tem um TXT por slug de CATEGORY_URLS. Para cada
+entrada do PARSER_MAP (slugs sem fixture própria usam a do mesmo formato,
+FIXTURE_ALIASES) e cada escala (o corpo do arquivo repetido N vezes) mede:
+  - linhas/s e registros/s (tempo de CPU do processo, melhor de --repeat
+    amostras; cada amostra repete o parse até somar ~0,2 s, como o
+    timeit, para os arquivos pequenos não ficarem dominados por ruído)
+  - pico de memória alocada durante o parse (tracemalloc, execução à parte)
+  - nº de registros (muda só se o comportamento do parser mudar)
+
+O resultado vai para um JSON (--output) e é comparado com o baseline
+versionado (benchmarks/baseline_corpus.json): vazão caindo ou memória
+subindo mais que --threshold, ou nº de registros diferente, é regressão e
+o processo sai com código 1. A vazão depende da máquina: gere o baseline
+no mesmo ambiente da comparação (--save-baseline). O "meta" do JSON
+guarda a máquina (CPU, núcleos, Python) e a configuração da medida; a
+comparação avisa quando ela difere da atual ou quando parser.py/layout.py
+mudaram depois do commit do baseline (baseline desatualizado, não
+regressão). Com --rounds N a suíte roda N vezes e fica o melhor de cada
+entrada, o que reduz o ruído em máquinas compartilhadas.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_corpus
+    python -m benchmarks.bench_corpus --scales 1,10 --rounds 3 --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime
+
+from parser import PARSER_MAP
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline_corpus.json")
+OUTPUT_FILE = os.path.join(BENCH_DIR, "results", "corpus.json")
+
+# Arquivos cuja mudança invalida o baseline
+PARSER_SOURCES = ("parser.py", "layout.py")
+# Campos do meta que precisam bater para a vazão ser comparável
+MACHINE_KEYS = ("cpu", "cpus", "python", "implementation", "machine")
+
+# Slugs do PARSER_MAP fora de CATEGORY_URLS → fixture com o mesmo formato
+FIXTURE_ALIASES = {
+    "team_boxscore_lines": "latest_boxscore_lines",
+    "team_cumulatives": "alphabetical_player_cumulatives",
+}
+
+
+# ── Corpus ─────────────────────────────────────────────────────────
+def load_fixture(slug: str) -> str:
+    path = os.path.join(FIXTURE_DIR, f"{FIXTURE_ALIASES.get(slug, slug)}.txt")
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def scaled(text: str, scale: int) -> str:
+    """Cópia ampliada: o arquivo repetido `scale` vezes (headers inclusos)."""
+    return text if scale == 1 else "\n".join([text] * scale)
+
+
+# ── Medições ───────────────────────────────────────────────────────
+def measure(slug: str, text: str, repeat: int) -> dict:
+    parse = PARSER_MAP[slug]
+    lines = text.count("\n") + 1
+
+    records = len(parse(text))
+    timer = timeit.Timer(lambda: parse(text), timer=time.process_time)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    parse(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "lines": lines,
+        "records": records,
+        "seconds": round(best, 6),
+        "lines_per_s": round(lines / best) if best else None,
+        "records_per_s": round(records / best) if best else None,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def _git(*args: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=os.path.dirname(BENCH_DIR), capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_meta() -> dict:
+    return {
+        "cpu": _cpu_model(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "platform": platform.platform(),
+    }
+
+
+def run_suite(slugs: list[str], scales: list[int], repeat: int, rounds: int = 1) -> dict:
+    results = {}
+    texts = {slug: load_fixture(slug) for slug in slugs}
+    for _ in range(rounds):
+        for slug in slugs:
+            for scale in scales:
+                key = f"{slug}@{scale}"
+                sample = measure(slug, scaled(texts[slug], scale), repeat)
+                best = results.get(key)
+                if best is None or sample["lines_per_s"] > best["lines_per_s"]:
+                    results[key] = sample
+    dirty = _git("status", "--porcelain", "--", *PARSER_SOURCES)
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git("rev-parse", "--short", "HEAD"),
+            "parser_dirty": bool(dirty),
+            **machine_meta(),
+            "timer": "process_time",
+            "repeat": repeat,
+            "rounds": rounds,
+            "scales": scales,
+        },
+        "results": results,
+    }
+
+
+def baseline_warnings(current: dict, baseline: dict) -> list[str]:
+    """Motivos para a vazão do baseline não ser comparável com a atual."""
+    meta, base = current["meta"], baseline.get("meta", {})
+    warnings = [
+        f"{key}: baseline {base.get(key)!r}, atual {meta.get(key)!r}"
+        for key in MACHINE_KEYS
+        if base.get(key) != meta.get(key)
+    ]
+    commit = base.get("commit")
+    if commit:
+        changed = _git("diff", "--name-only", commit, "--", *PARSER_SOURCES)
+        if changed:
+            warnings.append(
+                f"{', '.join(changed.split())} mudou desde o commit do baseline ({commit}) "
+                f"— regenere com --save-baseline se a mudança foi intencional"
+            )
+    if base.get("parser_dirty"):
+        warnings.append(f"baseline gerado com {'/'.join(PARSER_SOURCES)} alterados fora de um commit")
+    return warnings
+
+
+# ── Comparação com o baseline ──────────────────────────────────────
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Imprime a comparação e devolve as regressões encontradas."""
+    regressions = []
+    print(f"\n{'parser@escala':<40} {'linhas/s':>10} {'base':>10} {'Δ':>7} {'pico KiB':>9} {'base':>9}")
+    for key, cur in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            print(f"{key:<40} {cur['lines_per_s']:>10,} {'—':>10}")
+            continue
+        speed = cur["lines_per_s"] / base["lines_per_s"] - 1
+        memory = cur["peak_kib"] / base["peak_kib"] - 1 if base["peak_kib"] else 0.0
+        flags = []
+        if speed < -threshold:
+            flags.append(f"vazão {speed:+.0%}")
+        if memory > threshold:
+            flags.append(f"memória {memory:+.0%}")
+        if cur["records"] != base["records"]:
+            flags.append(f"registros {base['records']} → {cur['records']}")
+        if flags:
+            regressions.append(f"{key}: {', '.join(flags)}")
+        print(
+            f"{key:<40} {cur['lines_per_s']:>10,} {base['lines_per_s']:>10,} {speed:>+7.0%} "
+            f"{cur['peak_kib']:>9,.0f} {base['peak_kib']:>9,.0f}  {'REGRESSÃO' if flags else ''}"
+        )
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--scales", default="1,10", help="escalas do corpus (ex.: 1,10,100)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--rounds", type=int, default=1, help="execuções da suíte (fica o melhor)")
+    ap.add_argument("--slugs", default=",".join(PARSER_MAP))
+    ap.add_argument("--output", default=OUTPUT_FILE)
+    ap.add_argument("--baseline", default=BASELINE_FILE)
+    ap.add_argument("--threshold", type=float, default=0.15, help="variação tolerada (0.15 = 15%%)")
+    ap.add_argument("--save-baseline", action="store_true", help="grava o resultado como baseline")
+    args = ap.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",")]
+    current = run_suite(args.slugs.split(","), scales, args.repeat, args.rounds)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2)
+    print(f"Resultados salvos em {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline atualizado: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"Sem baseline em {args.baseline} — rode com --save-baseline")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    base_meta = baseline.get("meta", {})
+    print(f"\nBaseline: commit {base_meta.get('commit')} de {base_meta.get('created_at')} ({base_meta.get('cpu')})")
+    warnings = baseline_warnings(current, baseline)
+    for warning in warnings:
+        print(f"  AVISO: {warning}")
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressões (limite {args.threshold:.0%}):")
+        for item in regressions:
+            print(f"  - {item}")
+        if warnings:
+            print("Baseline possivelmente não comparável (ver avisos acima).")
+        sys.exit(1)
+    print("\nSem regressões.")
+
+
+if __name__ == "__main__":
+    main()
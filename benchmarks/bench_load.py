@@ -0,0 +1,79 @@
+"""
+Benchmark da carga de registros parsed: ORM vs INSERT (Core) vs COPY.
+
+Gera N linhas sintéticas de boxscore, faz o parse com o parser real e
+carrega cada lote na tabela do slug escolhido com os três métodos do
+loader. Cada método roda dentro de uma transação que é desfeita no fim,
+então o banco não é alterado.
+
+Uso (a partir da raiz do projeto, com o PostgreSQL do .env):
+    python -m benchmarks.bench_load --rows 20000
+"""
+
+import argparse
+import time
+from datetime import date
+
+from database import MODEL_MAP, engine, get_session, init_db
+from history import ensure_partition
+from loader import bulk_insert
+from parser import PARSER_MAP
+
+BOXSCORE_LINE = (
+    "02/11/2026 {tm} CHA Player{n:05d}, Test            (F  )  1  34   7  15"
+    "   2   5   3   4   1   8   9   5   2   0   1   3   1  19"
+)
+
+
+def build_records(slug: str, rows: int) -> list[dict]:
+    teams = ("ATL", "BOS", "DEN", "LAL", "MIA")
+    text = "\n".join(
+        BOXSCORE_LINE.format(tm=teams[n % len(teams)], n=n) for n in range(rows)
+    )
+    return PARSER_MAP[slug](text)
+
+
+def run(method: str, slug: str, records: list[dict]) -> float:
+    """Carrega os registros e desfaz a transação. Retorna linhas/s."""
+    session = get_session()
+    snapshot = {"scrape_run_id": 0, "scrape_date": date.today()}
+    try:
+        started = time.perf_counter()
+        inserted = bulk_insert(
+            session, MODEL_MAP[slug], records, method=method, extra=snapshot
+        )
+        session.flush()
+        elapsed = time.perf_counter() - started
+    finally:
+        session.rollback()
+        session.close()
+    return inserted / elapsed if elapsed else float("inf")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--rows", type=int, default=20000)
+    ap.add_argument("--slug", default="latest_boxscore_lines")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--methods", default="orm,insert,copy")
+    args = ap.parse_args()
+
+    init_db()
+    ensure_partition(engine, MODEL_MAP[args.slug].__tablename__, date.today())
+    records = build_records(args.slug, args.rows)
+    print(f"{len(records)} registros de '{args.slug}'")
+
+    results = {}
+    for method in args.methods.split(","):
+        best = max(run(method, args.slug, records) for _ in range(args.repeat))
+        results[method] = best
+        print(f"  {method:<7} {best:>12,.0f} linhas/s")
+
+    if "orm" in results:
+        for method, rate in results.items():
+            if method != "orm":
+                print(f"  {method} é {rate / results['orm']:.1f}x o caminho ORM")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Custo do logging no parse do corpus de fixtures.
+
+Parse completo de benchmarks/fixtures pelo PARSER_MAP (--scale cópias de
+cada arquivo; melhor de --repeat amostras) com três configurações:
+  sync-debug   a antiga do main.py: basicConfig em DEBUG, StreamHandler e
+               FileHandler síncronos na thread que loga
+  queue-debug  log_setup.setup_logging em DEBUG (fila + QueueListener)
+  queue-info   log_setup.setup_logging em INFO (padrão): o debug é
+               descartado antes de qualquer formatação
+O terminal vai para /dev/null e o arquivo de log para um diretório
+temporário. "esvaziar ms" é o tempo de parar o listener (escrever o que
+ficou na fila) depois da amostra.
+
+Também mede o custo de um logger.debug descartado (nível INFO) com
+f-string e com o estilo %, que é o que os caminhos quentes pagam por
+mensagem.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_logging --scale 10
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+import timeit
+
+from benchmarks.bench_corpus import load_fixture, scaled
+from log_setup import FORMAT, DATEFMT, setup_logging, stop_logging
+from parser import PARSER_MAP
+
+MODES = ("sync-debug", "queue-debug", "queue-info")
+
+
+def configure(mode: str, log_file: str, devnull) -> None:
+    if mode == "sync-debug":
+        stop_logging()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        formatter = logging.Formatter(FORMAT, datefmt=DATEFMT)
+        for handler in (logging.StreamHandler(devnull), logging.FileHandler(log_file, encoding="utf-8")):
+            handler.setFormatter(formatter)
+            root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+    else:
+        setup_logging(
+            level="DEBUG" if mode == "queue-debug" else "INFO",
+            levels="",
+            log_file=log_file,
+            stream=devnull,
+        )
+
+
+def teardown() -> float:
+    """Para o listener (ou fecha os handlers síncronos); devolve o tempo gasto."""
+    start = time.perf_counter()
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    return time.perf_counter() - start
+
+
+def parse_corpus(corpus: dict[str, str]) -> int:
+    return sum(len(PARSER_MAP[slug](text)) for slug, text in corpus.items())
+
+
+def run_mode(mode: str, corpus: dict[str, str], repeat: int, directory: str, devnull) -> dict:
+    samples, drains, records = [], [], 0
+    for i in range(repeat):
+        configure(mode, os.path.join(directory, f"{mode}-{i}.log"), devnull)
+        start = time.perf_counter()
+        records = parse_corpus(corpus)
+        samples.append(time.perf_counter() - start)
+        drains.append(teardown())
+    return {
+        "mode": mode,
+        "best_ms": min(samples) * 1000,
+        "drain_ms": min(drains) * 1000,
+        "records": records,
+    }
+
+
+def discarded_call_ns(number: int) -> tuple[float, float]:
+    """ns por logger.debug descartado: (f-string, estilo %)."""
+    logger = logging.getLogger("parser")
+    logger.setLevel(logging.INFO)
+    name, count = "iter_boxscore_lines", 1234
+    eager = timeit.timeit(lambda: logger.debug(f"[PARSER] {name}: {count} registros"), number=number)
+    lazy = timeit.timeit(lambda: logger.debug("[PARSER] %s: %d registros", name, count), number=number)
+    logger.setLevel(logging.NOTSET)
+    return eager / number * 1e9, lazy / number * 1e9
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--scale", type=int, default=10, help="cópias de cada fixture")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--calls", type=int, default=200_000, help="chamadas na medida por mensagem")
+    args = ap.parse_args()
+
+    corpus = {slug: scaled(load_fixture(slug), args.scale) for slug in PARSER_MAP}
+    rows = []
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        for mode in MODES:
+            print(f"[BENCH] {mode} ...", flush=True)
+            rows.append(run_mode(mode, corpus, args.repeat, directory, devnull))
+
+    baseline = rows[0]["best_ms"]
+    print(f"\n{'modo':<12} {'parse ms':>9} {'vs sync':>8} {'esvaziar ms':>12} {'registros':>10}")
+    for row in rows:
+        saved = (1 - row["best_ms"] / baseline) * 100
+        print(
+            f"{row['mode']:<12} {row['best_ms']:>9.1f} {saved:>+7.1f}% "
+            f"{row['drain_ms']:>12.1f} {row['records']:>10,}"
+        )
+
+    eager, lazy = discarded_call_ns(args.calls)
+    print(f"\nlogger.debug descartado: f-string {eager:.0f} ns, estilo % {lazy:.0f} ns por chamada")
+
+
+if __name__ == "__main__":
+    main()
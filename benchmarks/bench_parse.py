@@ -0,0 +1,213 @@
+"""
+Benchmark de vazão dos parsers: layouts declarativos vs regex.
+
+Gera um TXT sintético por categoria, no formato dos arquivos do Elias
+(linhas de exemplo dos comentários do parser.py, repetidas com nomes
+diferentes), e mede linhas/s do parser atual (PARSER_MAP, layout.py) e
+do parser com regex da versão anterior (benchmarks/regex_parsers.py).
+Com --workers N mede também o estágio de parse (parse_stage.py) com
+todas as categorias (--files cópias de cada), em série e com N processos.
+Com --builders compara o construtor de linha gerado por layout
+(layout._compile_builder) com uma dict comprehension sobre
+(nome, conversor, origem), trocando o _builder de todos os layouts do
+parser.py; as duas variantes rodam intercaladas para o ruído da máquina
+pesar igual nas duas. Não usa banco nem rede.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_parse --lines 20000
+    python -m benchmarks.bench_parse --lines 20000 --workers 4
+    python -m benchmarks.bench_parse --lines 20000 --builders
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+
+import parser as parser_module
+from benchmarks.regex_parsers import REGEX_PARSER_MAP
+from layout import FixedLayout, TokenLayout
+from parse_stage import ParseStage
+from parser import PARSER_MAP
+
+TEAMS = ("ATL", "BOS", "DEN", "LAL", "MIA")
+CITIES = ("Atlanta", "Boston", "Denver", "New Orleans", "Oklahoma City")
+
+
+def _boxscore(n: int) -> str:
+    return (
+        f"02/11/2026 {TEAMS[n % 5]} CHA Player{n:05d}, Test            (F  )  1  34   7  15"
+        "   2   5   3   4   1   8   9   5   2   0   1   3   1  19"
+    )
+
+
+def _cumulatives(n: int) -> str:
+    return (
+        f"Total {TEAMS[n % 5]} ACT Player{n:05d}, Test, Sac.  48 32  973  144  288 .500"
+        "  16  54 .296   63   80 .788   88  170  258   43   90    1   30   37   32  367  7.6   20"
+    )
+
+
+def _attendance(n: int) -> str:
+    return CITIES[n % 5].ljust(32) + "25    406,165 16,247    31    548,915 17,707"
+
+
+def _leaders(n: int) -> str:
+    if n % 20 == 0:
+        return (
+            "SCORING AVERAGE        G   FG  FT  PTS  AVG     "
+            "REBOUNDS PER GAME        G  OFF  DEF  TOT  AVG"
+        )
+    left = f"Player{n:05d}, LA-L".ljust(22) + "42  437 356 1379 32.8"
+    right = f"Player{n:05d}, Den.".ljust(24) + "39  112  371  483 12.4"
+    return left.ljust(48) + right
+
+
+def _ratios_players(n: int) -> str:
+    if n % 20 == 0:
+        return (
+            "Name                     AST   TO RATIO     "
+            "Name                     STL   TO RATIO"
+        )
+    left = f"Player{n:05d}, Bos.".ljust(25) + "283   63  4.49"
+    right = f"Player{n:05d}, OKC.".ljust(25) + "108   48  2.25"
+    return left.ljust(44) + right
+
+
+def _ratios_teams(n: int) -> str:
+    if n % 20 == 0:
+        return (
+            "Name                     AST   TO RATIO     "
+            "Name                     STL   TO RATIO"
+        )
+    left = CITIES[n % 5].ljust(24) + "1539  701  2.20"
+    right = CITIES[(n + 1) % 5].ljust(25) + "544  682  0.80"
+    return left.ljust(44) + right
+
+
+def _standings(n: int) -> str:
+    if n % 6 == 0:
+        return "ATLANTIC DIVISION".ljust(85) + "NORTHWEST DIVISION"
+    east = f"{CITIES[n % 5]}".ljust(20) + "35 19  .648    -  18- 9 17-10     0- 0  7-3   Won   1"
+    west = f"{CITIES[(n + 2) % 5]}".ljust(20) + "42 12  .778    -  22- 5 20- 7     0- 0  8-2   Won   2"
+    return east.ljust(85) + west
+
+
+def _opponent_points(n: int) -> str:
+    return CITIES[n % 5].ljust(22) + "3200   57.143   49.868     6417       56  114.589"
+
+
+SAMPLES = {
+    "latest_boxscore_lines": _boxscore,
+    "alphabetical_player_cumulatives": _cumulatives,
+    "attendance": _attendance,
+    "top_10_league_leaders": _leaders,
+    "ratios_players": _ratios_players,
+    "ratios_teams": _ratios_teams,
+    "standings": _standings,
+    "opponent_points_breakdown": _opponent_points,
+}
+
+
+def build_text(slug: str, lines: int) -> str:
+    return "\n".join(SAMPLES[slug](n) for n in range(lines))
+
+
+def run(parse, text: str, lines: int, repeat: int) -> tuple[float, int]:
+    """Melhor vazão (linhas/s) entre `repeat` execuções e nº de registros."""
+    best, count = 0.0, 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = len(parse(text))
+        elapsed = time.perf_counter() - started
+        best = max(best, lines / elapsed if elapsed else float("inf"))
+    return best, count
+
+
+def run_stage(jobs: list[tuple[str, str]], workers: int) -> tuple[float, int]:
+    """Tempo (s) para parsear todos os jobs no ParseStage e nº de registros."""
+    started = time.perf_counter()
+    count = 0
+    with ParseStage(workers) as stage:
+        for parsed in stage.map(jobs):
+            count += sum(1 for _ in parsed.records())
+    return time.perf_counter() - started, count
+
+
+def _comprehension_builder(layout):
+    """Construtor equivalente ao gerado: uma comprehension por linha."""
+    fields = tuple(zip(layout.names, layout.converters, layout.sources))
+
+    def build(v):
+        return {name: convert(v[source]) for name, convert, source in fields}
+
+    return build
+
+
+@contextmanager
+def comprehension_builders():
+    """Troca o _builder de todos os layouts do parser.py durante o bloco."""
+    layouts = [
+        obj for obj in vars(parser_module).values() if isinstance(obj, (FixedLayout, TokenLayout))
+    ]
+    generated = [layout._builder for layout in layouts]
+    for layout in layouts:
+        layout._builder = _comprehension_builder(layout)
+    try:
+        yield
+    finally:
+        for layout, builder in zip(layouts, generated):
+            layout._builder = builder
+
+
+def run_builders(slugs: list[str], lines: int, repeat: int):
+    """Vazão do parser com o construtor gerado vs a comprehension, intercalados."""
+    print(f"\n{'categoria':<34} {'comprehension':>14} {'gerado':>12} {'ganho':>7}")
+    for slug in slugs:
+        text = build_text(slug, lines)
+        parse = PARSER_MAP[slug]
+        generated = closure = 0.0
+        for _ in range(repeat):
+            generated = max(generated, run(parse, text, lines, 1)[0])
+            with comprehension_builders():
+                closure = max(closure, run(parse, text, lines, 1)[0])
+        print(f"{slug:<34} {closure:>14,.0f} {generated:>12,.0f} {generated / closure - 1:>+7.1%}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--lines", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--slugs", default=",".join(SAMPLES))
+    ap.add_argument("--workers", type=int, default=0, help="processos do estágio de parse")
+    ap.add_argument("--files", type=int, default=4, help="cópias de cada categoria no estágio")
+    ap.add_argument("--builders", action="store_true", help="construtor gerado vs comprehension")
+    args = ap.parse_args()
+
+    print(f"{'categoria':<34} {'regex':>12} {'layout':>12} {'speedup':>8}  registros (regex/layout)")
+    for slug in args.slugs.split(","):
+        text = build_text(slug, args.lines)
+        regex_rate, regex_count = run(REGEX_PARSER_MAP[slug], text, args.lines, args.repeat)
+        layout_rate, layout_count = run(PARSER_MAP[slug], text, args.lines, args.repeat)
+        print(
+            f"{slug:<34} {regex_rate:>12,.0f} {layout_rate:>12,.0f} "
+            f"{layout_rate / regex_rate:>7.1f}x  {regex_count}/{layout_count}"
+        )
+
+    if args.builders:
+        run_builders(args.slugs.split(","), args.lines, args.repeat)
+
+    if args.workers > 1:
+        jobs = [
+            (slug, build_text(slug, args.lines)) for slug in args.slugs.split(",")
+        ] * args.files
+        serial, serial_count = run_stage(jobs, 1)
+        parallel, parallel_count = run_stage(jobs, args.workers)
+        print(
+            f"\nEstágio de parse ({len(jobs)} arquivos): série {serial:.2f}s, "
+            f"{args.workers} processos {parallel:.2f}s ({serial / parallel:.1f}x) — "
+            f"registros {serial_count}/{parallel_count}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Download → parse → carga: sequencial vs. sobreposto (pipeline.run_pipelined).
+
+Os arquivos de benchmarks/synthetic.py são servidos pelo replay.py com
+latência por requisição (--latency), como se viessem do CDN, e baixados
+pelo ConcurrentDownloader com requests. Para cada modo o banco é recriado
+e recebe os mesmos --days dias (um run por dia):
+  sequencial  — baixa todas as categorias e depois save_to_database
+  pipeline    — run_pipelined: cada categoria baixada já vai para o parse
+                e a carga, com filas limitadas entre os estágios
+No modo sequencial os tempos de download e de carga são medidos à parte;
+o pipeline deve ficar perto do maior dos dois, e não da soma.
+
+ATENÇÃO: o schema public do banco de DB_NAME é apagado a cada modo.
+Use um banco descartável (o nome precisa conter "bench"; --force ignora).
+
+Uso (a partir da raiz do projeto):
+    DB_NAME=nba_bench python -m benchmarks.bench_pipeline --leagues 3 --latency 0.3
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import requests
+
+from benchmarks.bench_scaling import reset_database
+from benchmarks.synthetic import SyntheticLeague
+from config import CATEGORY_URLS, DB_NAME
+from downloader import ConcurrentDownloader
+from pipeline import run_pipelined, save_to_database, start_run
+from replay import Recorder, ReplayServer
+
+_CATEGORIES = {c["slug"]: c for c in CATEGORY_URLS}
+MODES = ("sequencial", "pipeline")
+
+
+def record_days(league: SyntheticLeague, root: str, season: int, day: int) -> list[dict]:
+    """Grava os arquivos do dia em `root` (formato do Recorder) e devolve os itens."""
+    recorder = Recorder(root)
+    items = []
+    for slug, content in league.day_files(season, day).items():
+        category = _CATEGORIES[slug]
+        recorder.save(category["url"], 200, {"Content-Type": "text/plain"}, content)
+        items.append(category)
+    return items
+
+
+def run_mode(mode: str, league: SyntheticLeague, args) -> dict:
+    reset_database()
+    totals = {"mode": mode, "total_s": 0.0, "download_s": 0.0, "load_s": 0.0, "categories": 0}
+
+    for season, day, game_date in league.iter_days():
+        with tempfile.TemporaryDirectory() as root:
+            items = record_days(league, root, season, day)
+            with ReplayServer(root, port=0, latency=args.latency) as server:
+                http = requests.Session()
+
+                def fetch(url: str):
+                    resp = http.get(server.local_url(url), timeout=30)
+                    return resp.text if resp.status_code == 200 else None
+
+                downloader = ConcurrentDownloader(
+                    fetch, workers=args.workers, per_host=args.workers, rate_limit=1000
+                )
+                run_id = start_run(
+                    datetime.combine(game_date + timedelta(days=1), datetime.min.time())
+                )
+
+                start = time.perf_counter()
+                if mode == "sequencial":
+                    results = downloader.download_all(items)
+                    downloaded = time.perf_counter()
+                    saved = save_to_database(results, run_id)
+                    totals["download_s"] += downloaded - start
+                    totals["load_s"] += time.perf_counter() - downloaded
+                else:
+                    _, saved = run_pipelined(
+                        lambda emit: downloader.download_all(items, on_result=emit), run_id
+                    )
+                totals["total_s"] += time.perf_counter() - start
+                totals["categories"] += saved
+
+    for key in ("total_s", "download_s", "load_s"):
+        totals[key] = round(totals[key], 3)
+    return totals
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--leagues", type=int, default=3, help="ligas de 30 times (volume por dia)")
+    ap.add_argument("--days", type=int, default=3, help="dias (um run por dia)")
+    ap.add_argument("--latency", type=float, default=0.3, help="latência por requisição (s)")
+    ap.add_argument("--workers", type=int, default=4, help="downloads simultâneos")
+    ap.add_argument("--seed", type=int, default=2026)
+    ap.add_argument("--force", action="store_true", help="aceita banco sem 'bench' no nome")
+    ap.add_argument("--verbose", action="store_true", help="mantém o log da carga")
+    args = ap.parse_args()
+
+    if "bench" not in DB_NAME and not args.force:
+        sys.exit(
+            f"DB_NAME={DB_NAME!r}: o schema é apagado a cada modo. "
+            f"Use um banco descartável (ex.: DB_NAME=nba_bench) ou --force."
+        )
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s │ %(levelname)-8s │ %(message)s", datefmt="%H:%M:%S")
+
+    league = SyntheticLeague(leagues=args.leagues, days=args.days, seed=args.seed)
+    rows = []
+    for mode in MODES:
+        print(f"[BENCH] {mode} ...", flush=True)
+        rows.append(run_mode(mode, league, args))
+
+    sequential, pipelined = rows
+    slowest = max(sequential["download_s"], sequential["load_s"])
+    print(f"\n{'modo':<12} {'total s':>8} {'download s':>11} {'carga s':>8} {'categorias':>11}")
+    for row in rows:
+        download = f"{row['download_s']:>11.2f}" if row["mode"] == "sequencial" else f"{'—':>11}"
+        load = f"{row['load_s']:>8.2f}" if row["mode"] == "sequencial" else f"{'—':>8}"
+        print(f"{row['mode']:<12} {row['total_s']:>8.2f} {download} {load} {row['categories']:>11}")
+    print(
+        f"\nPipeline: {pipelined['total_s']:.2f}s — estágio mais lento {slowest:.2f}s, "
+        f"soma {sequential['download_s'] + sequential['load_s']:.2f}s "
+        f"({sequential['total_s'] / pipelined['total_s']:.2f}× mais rápido que o sequencial)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Escalabilidade de parse + carga + consultas com dados sintéticos.
+
+Para cada eixo (--axes) e cada escala (--scales) o banco é recriado do
+zero e recebe os arquivos de benchmarks/synthetic.py, um run por dia,
+pelo mesmo caminho do scraper (save_to_database), sem download:
+  players  — escala × 30 times (e × 450 jogadores)
+  games    — escala × --days dias por temporada
+  seasons  — escala temporadas de --days dias
+Os outros eixos ficam em 1. Por escala são medidos:
+  - parse   — tempo dos parsers sobre todos os arquivos (só CPU, à parte)
+  - save    — save_to_database de todos os dias (parse + carga + game log,
+              agregados móveis e publicação)
+  - consultas representativas da API (mediana de --repeat execuções)
+  - tamanho do banco no fim
+O resultado vai para um JSON (--output) com uma linha por eixo/escala,
+pronto para plotar.
+
+ATENÇÃO: o schema public do banco de DB_NAME é apagado a cada escala.
+Use um banco descartável (o nome precisa conter "bench"; --force ignora).
+
+Uso (a partir da raiz do projeto):
+    DB_NAME=nba_bench python -m benchmarks.bench_scaling --scales 1,10
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from benchmarks.synthetic import SyntheticLeague
+from config import CATEGORY_URLS, DB_NAME
+from database import engine, init_db
+from parser import STREAM_PARSER_MAP
+from pipeline import save_to_database, start_run
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FILE = os.path.join(BENCH_DIR, "results", "scaling.json")
+
+AXES = ("players", "games", "seasons")
+_CATEGORIES = {c["slug"]: c for c in CATEGORY_URLS}
+
+# Consultas das rotas da API (api/src/routes) com parâmetros da liga sintética
+QUERIES = {
+    "standings": (
+        "SELECT team, wins, losses, pct FROM standings ORDER BY conference, pct DESC",
+        lambda lg: {},
+    ),
+    "scores": (
+        "SELECT * FROM latest_scores_and_leaders WHERE away_score IS NOT NULL "
+        "ORDER BY game_date DESC",
+        lambda lg: {},
+    ),
+    "leaders": (
+        "SELECT * FROM top_20_league_leaders ORDER BY stat_category, rank",
+        lambda lg: {},
+    ),
+    "h2h": (
+        "SELECT * FROM head_to_head_win_grid WHERE team = :team AND opponent = :opp",
+        lambda lg: {"team": lg.teams[0][0], "opp": lg.teams[1][0]},
+    ),
+    "team_boxscores": (
+        "SELECT * FROM latest_boxscore_lines WHERE team = :team "
+        "ORDER BY game_date DESC, points DESC LIMIT 50",
+        lambda lg: {"team": lg.teams[0][0]},
+    ),
+    "player_search": (
+        "SELECT * FROM alphabetical_player_cumulatives WHERE player_name ILIKE :name",
+        lambda lg: {"name": f"%{lg.players[0].split(',')[0]}%"},
+    ),
+    # GAME_LOG_LAST_N de api/src/routes/players.js
+    "game_log_last_n": (
+        """
+        SELECT p.player_name, g.*
+        FROM (SELECT DISTINCT player_name FROM player_game_log
+              WHERE player_name ILIKE :name) p
+        CROSS JOIN LATERAL (
+          SELECT game_date, team, opponent, points, total_reb, assists
+          FROM player_game_log
+          WHERE player_name = p.player_name
+          ORDER BY game_date DESC
+          LIMIT 20
+        ) g
+        ORDER BY g.game_date DESC
+        """,
+        lambda lg: {"name": f"%{lg.players[0]}%"},
+    ),
+    "rolling": (
+        "SELECT * FROM player_rolling_averages WHERE player_name = :name",
+        lambda lg: {"name": lg.players[0]},
+    ),
+}
+
+
+def league_for(axis: str, scale: int, days: int, seed: int) -> SyntheticLeague:
+    if axis == "players":
+        return SyntheticLeague(leagues=scale, days=days, seed=seed)
+    if axis == "games":
+        return SyntheticLeague(days=days * scale, seed=seed)
+    return SyntheticLeague(days=days, seasons=scale, seed=seed)
+
+
+# ── Banco ──────────────────────────────────────────────────────────
+def reset_database():
+    """Apaga o schema public inteiro e aplica as migrations do zero."""
+    engine.dispose()
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE"))
+        conn.execute(text("CREATE SCHEMA public"))
+    init_db()
+
+
+def database_mib() -> float:
+    with engine.connect() as conn:
+        size = conn.execute(text("SELECT pg_database_size(current_database())")).scalar()
+    return round(size / 2**20, 1)
+
+
+# ── Medições ───────────────────────────────────────────────────────
+def time_parse(files: dict[str, str]) -> float:
+    start = time.process_time()
+    for slug, content in files.items():
+        for _ in STREAM_PARSER_MAP[slug](content):
+            pass
+    return time.process_time() - start
+
+
+def time_queries(league: SyntheticLeague, repeat: int) -> dict[str, float]:
+    """Mediana em ms de cada consulta (a primeira execução aquece o cache)."""
+    timings = {}
+    with engine.connect() as conn:
+        for name, (sql, params) in QUERIES.items():
+            statement, values = text(sql), params(league)
+            conn.execute(statement, values).fetchall()
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(statement, values).fetchall()
+                samples.append(time.perf_counter() - start)
+            timings[name] = round(statistics.median(samples) * 1000, 2)
+    return timings
+
+
+def run_scale(axis: str, scale: int, days: int, repeat: int, seed: int) -> dict:
+    league = league_for(axis, scale, days, seed)
+    reset_database()
+
+    parse_s = save_s = 0.0
+    lines = runs = 0
+    for season, day, game_date in league.iter_days():
+        files = league.day_files(season, day)
+        lines += sum(content.count("\n") + 1 for content in files.values())
+        parse_s += time_parse(files)
+
+        # O run "acontece" na manhã seguinte aos jogos: scrape_date (e a
+        # partição de histórico) segue o calendário sintético
+        run_id = start_run(datetime.combine(game_date + timedelta(days=1), datetime.min.time()))
+        scraped = [
+            {
+                "category": _CATEGORIES[slug]["category"].upper(),
+                "slug": slug,
+                "url": _CATEGORIES[slug]["url"],
+                "content": content,
+                "status": "ok",
+            }
+            for slug, content in files.items()
+        ]
+        start = time.perf_counter()
+        save_to_database(scraped, run_id)
+        save_s += time.perf_counter() - start
+        runs += 1
+
+    with engine.connect() as conn:
+        game_log_rows = conn.execute(text("SELECT count(*) FROM player_game_log")).scalar()
+
+    return {
+        "axis": axis,
+        "scale": scale,
+        "teams": len(league.teams),
+        "players": len(league.players),
+        "days": league.days,
+        "seasons": league.seasons,
+        "runs": runs,
+        "lines": lines,
+        "game_log_rows": game_log_rows,
+        "parse_s": round(parse_s, 3),
+        "save_s": round(save_s, 3),
+        "lines_per_s": round(lines / save_s) if save_s else None,
+        "queries_ms": time_queries(league, repeat),
+        "database_mib": database_mib(),
+    }
+
+
+def print_table(rows: list[dict]):
+    names = list(QUERIES)
+    print(f"\n{'eixo@escala':<14} {'linhas':>9} {'parse s':>8} {'save s':>8} {'banco MiB':>9}  "
+          + " ".join(f"{n[:12]:>12}" for n in names))
+    for row in rows:
+        print(
+            f"{row['axis'] + '@' + str(row['scale']):<14} {row['lines']:>9,} {row['parse_s']:>8.2f} "
+            f"{row['save_s']:>8.2f} {row['database_mib']:>9.1f}  "
+            + " ".join(f"{row['queries_ms'][n]:>12.2f}" for n in names)
+        )
+    print("(consultas em ms, mediana)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--scales", default="1,10", help="escalas (ex.: 1,10,100)")
+    ap.add_argument("--axes", default=",".join(AXES), help="eixos: players,games,seasons")
+    ap.add_argument("--days", type=int, default=3, help="dias por temporada na escala 1")
+    ap.add_argument("--repeat", type=int, default=5, help="execuções de cada consulta")
+    ap.add_argument("--seed", type=int, default=2026)
+    ap.add_argument("--output", default=OUTPUT_FILE)
+    ap.add_argument("--force", action="store_true", help="aceita banco sem 'bench' no nome")
+    ap.add_argument("--verbose", action="store_true", help="mantém o log do save_to_database")
+    args = ap.parse_args()
+
+    if "bench" not in DB_NAME and not args.force:
+        sys.exit(
+            f"DB_NAME={DB_NAME!r}: o schema é apagado a cada escala. "
+            f"Use um banco descartável (ex.: DB_NAME=nba_bench) ou --force."
+        )
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s │ %(levelname)-8s │ %(message)s", datefmt="%H:%M:%S")
+
+    axes = args.axes.split(",")
+    unknown = set(axes) - set(AXES)
+    if unknown:
+        sys.exit(f"Eixos desconhecidos: {', '.join(sorted(unknown))}")
+
+    rows = []
+    for axis in axes:
+        for scale in (int(s) for s in args.scales.split(",")):
+            print(f"[BENCH] {axis} × {scale} ...", flush=True)
+            rows.append(run_scale(axis, scale, args.days, args.repeat, args.seed))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"created_at": datetime.now().isoformat(timespec="seconds"), "results": rows}, f, indent=2)
+    print_table(rows)
+    print(f"\nResultados salvos em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
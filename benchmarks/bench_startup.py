@@ -0,0 +1,90 @@
+"""
+Tempo de inicialização (cold start) de cada subcomando do cli.py.
+
+Cada subcomando roda em um processo novo com --startup-check, que importa
+o que o subcomando precisa e sai sem executar nada: o tempo medido é o do
+interpretador + imports (melhor e mediana de --repeat execuções). Também
+confere quantos módulos foram carregados e se o Selenium foi importado.
+
+Subcomandos que não são `scrape` devem ficar abaixo de --target-ms e não
+podem importar o Selenium; caso contrário o processo sai com código 1.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_startup
+    python cli.py bench startup --repeat 10 --target-ms 400
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "cli.py")
+
+# Argumentos mínimos para o parse de cada subcomando (nada é executado)
+COMMANDS = {
+    "scrape": ["scrape"],
+    "ingest": ["ingest", "downloads"],
+    "reparse": ["reparse"],
+    "backfill": ["backfill"],
+    "export": ["export", "standings"],
+    "bench": ["bench", "corpus"],
+}
+
+
+def measure(argv: list[str], repeat: int) -> dict:
+    samples, output = [], ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            argv, cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        samples.append(time.perf_counter() - start)
+        output = result.stdout.strip()
+    modules, selenium = (int(v) for v in output.split()) if output else (0, 0)
+    return {
+        "best_ms": round(min(samples) * 1000, 1),
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "modules": modules,
+        "selenium": bool(selenium),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--target-ms", type=float, default=400.0,
+                    help="limite da mediana para os subcomandos que não são scrape")
+    args = ap.parse_args()
+
+    baseline = measure([sys.executable, "-c", "pass"], args.repeat)
+    print(f"{'subcomando':<12} {'melhor ms':>10} {'mediana ms':>11} {'módulos':>8}  selenium")
+    print(f"{'(python)':<12} {baseline['best_ms']:>10} {baseline['median_ms']:>11}")
+
+    failures = []
+    for name, command in COMMANDS.items():
+        row = measure([sys.executable, CLI, "--startup-check", *command], args.repeat)
+        print(
+            f"{name:<12} {row['best_ms']:>10} {row['median_ms']:>11} {row['modules']:>8}  "
+            f"{'sim' if row['selenium'] else 'não'}"
+        )
+        if name == "scrape":
+            continue
+        if row["selenium"]:
+            failures.append(f"{name}: importa o Selenium")
+        if row["median_ms"] > args.target_ms:
+            failures.append(f"{name}: {row['median_ms']} ms > {args.target_ms:g} ms")
+
+    if failures:
+        print("\nAcima do alvo:")
+        for item in failures:
+            print(f"  - {item}")
+        sys.exit(1)
+    print(f"\nTodos os subcomandos (exceto scrape) abaixo de {args.target_ms:g} ms.")
+
+
+if __name__ == "__main__":
+    main()
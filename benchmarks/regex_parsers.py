@@ -0,0 +1,484 @@
+"""
+Parsers com regex da versão anterior do parser.py (antes dos layouts
+declarativos em layout.py), mantidos só como referência para o
+benchmark de vazão (benchmarks/bench_parse.py).
+"""
+
+import re
+import logging
+
+from parser import _parse_date, _safe_float, _safe_int
+
+logger = logging.getLogger(__name__)
+
+
+def _clean_lines(text: str) -> list[str]:
+    """Retorna linhas não vazias (versão em lista, como na versão anterior)."""
+    return [line for line in text.split("\n") if line.strip()]
+
+
+def parse_boxscore_lines(text: str) -> list[dict]:
+    """Parse de estatísticas diárias de jogadores (boxscore lines)."""
+    records = []
+    lines = _clean_lines(text)
+
+    pattern = re.compile(
+        r"(\d{2}/\d{2}/\d{4})\s+"  # DATA
+        r"(\S+)\s+"                 # TIME
+        r"(\S+)\s+"                 # ADVERSÁRIO
+        r"(.+?)\s+"                 # NOME
+        r"\((\S+\s*)\)\s+"          # POSIÇÃO
+        r"(\d+)\s+"                 # G
+        r"(\d+)\s+"                 # MIN
+        r"(\d+)\s+(\d+)\s+"         # FG FGA
+        r"(\d+)\s+(\d+)\s+"         # FG3 F3A
+        r"(\d+)\s+(\d+)\s+"         # FT FTA
+        r"(\d+)\s+(\d+)\s+(\d+)\s+" # OFF DEF TRB
+        r"(\d+)\s+"                 # AST
+        r"(\d+)\s+(\d+)\s+"         # PF DQ
+        r"(\d+)\s+(\d+)\s+(\d+)\s+" # STL TO BLK
+        r"(\d+)"                    # PTS
+    )
+    for line in lines:
+        m = pattern.search(line)
+        if m:
+            records.append({
+                "game_date": _parse_date(m.group(1)),
+                "team": m.group(2).strip(),
+                "opponent": m.group(3).strip(),
+                "player_name": m.group(4).strip().rstrip(",").strip(),
+                "position": m.group(5).strip(),
+                "games": _safe_int(m.group(6)),
+                "minutes": _safe_int(m.group(7)),
+                "fg": _safe_int(m.group(8)),
+                "fga": _safe_int(m.group(9)),
+                "fg3": _safe_int(m.group(10)),
+                "f3a": _safe_int(m.group(11)),
+                "ft": _safe_int(m.group(12)),
+                "fta": _safe_int(m.group(13)),
+                "off_reb": _safe_int(m.group(14)),
+                "def_reb": _safe_int(m.group(15)),
+                "total_reb": _safe_int(m.group(16)),
+                "assists": _safe_int(m.group(17)),
+                "pf": _safe_int(m.group(18)),
+                "dq": _safe_int(m.group(19)),
+                "steals": _safe_int(m.group(20)),
+                "turnovers": _safe_int(m.group(21)),
+                "blocks": _safe_int(m.group(22)),
+                "points": _safe_int(m.group(23)),
+            })
+
+    logger.debug(f"[PARSER] parse_boxscore_lines: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_player_cumulatives(text: str) -> list[dict]:
+    """Parse de estatísticas cumulativas de jogadores (season/rookies)."""
+    records = []
+    lines = _clean_lines(text)
+
+    pattern = re.compile(
+        r"^(Total|Team)\s+"        # SCOPE
+        r"(\S+)\s+"                # TM (sigla)
+        r"(\S+)\s+"                # RS (status: ACT, TR, NWT, TRC)
+        r"(.+?)\s+"                # NOME completo com time
+        r"(\d+)\s+"                # G
+        r"(\d+)\s+"                # GS
+        r"(\d+)\s+"                # MIN
+        r"(\d+)\s+(\d+)\s+"        # FG FGA
+        r"(\.\d+|1\.000|---)\s+"   # FG PCT
+        r"(\d+)\s+(\d+)\s+"        # FG3 FG3A
+        r"(\.\d+|1\.000|---)\s+"   # FG3 PCT
+        r"(\d+)\s+(\d+)\s+"        # FT FTA
+        r"(\.\d+|1\.000|---)\s+"   # FT PCT
+        r"(\d+)\s+(\d+)\s+(\d+)\s+"# OFF DEF TREB
+        r"(\d+)\s+"                # AST
+        r"(\d+)\s+(\d+)\s+"        # PF DQ
+        r"(\d+)\s+(\d+)\s+(\d+)\s+"# STL TO BLK
+        r"(\d+)\s+"                # PTS
+        r"([\d\.]+)\s+"            # PPG
+        r"(\d+)"                   # HI
+    )
+
+    for line in lines:
+        m = pattern.search(line)
+        if m:
+            name_raw = m.group(4).strip().rstrip(",").strip()
+            team_abbr = m.group(2).strip()
+            records.append({
+                "player_name": name_raw,
+                "team": team_abbr,
+                "position": None,
+                "games": _safe_int(m.group(5)),
+                "minutes": _safe_int(m.group(7)),
+                "fg": _safe_int(m.group(8)),
+                "fga": _safe_int(m.group(9)),
+                "fg3": _safe_int(m.group(11)),
+                "f3a": _safe_int(m.group(12)),
+                "ft": _safe_int(m.group(14)),
+                "fta": _safe_int(m.group(15)),
+                "off_reb": _safe_int(m.group(17)),
+                "def_reb": _safe_int(m.group(18)),
+                "total_reb": _safe_int(m.group(19)),
+                "assists": _safe_int(m.group(20)),
+                "pf": _safe_int(m.group(21)),
+                "dq": _safe_int(m.group(22)),
+                "steals": _safe_int(m.group(23)),
+                "turnovers": _safe_int(m.group(24)),
+                "blocks": _safe_int(m.group(25)),
+                "points": _safe_int(m.group(26)),
+            })
+
+    logger.debug(f"[PARSER] parse_player_cumulatives: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_attendance(text: str) -> list[dict]:
+    records = []
+    lines = _clean_lines(text)
+
+    pattern = re.compile(
+        r"^([A-Z][A-Za-z\s\.]+?)\s+"
+        r"(\d+)\s+"                 # HOME G
+        r"([\d,]+)\s+"              # HOME ATT
+        r"([\d,]+)\s+"              # HOME AVG
+        r"(\d+)\s+"                 # ROAD G
+        r"([\d,]+)\s+"              # ROAD ATT
+        r"([\d,]+)\s*$"             # ROAD AVG
+    )
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("TOTALS") or stripped.startswith("TEAM") or stripped.startswith("INCLUDES"):
+            continue
+        if "HOME ATTENDANCE" in stripped or "ROAD ATTENDANCE" in stripped:
+            continue
+
+        m = pattern.match(stripped)
+        if m:
+            team_name = m.group(1).strip()
+            home_g = _safe_int(m.group(2))
+            home_att = _safe_int(m.group(3))
+            home_avg = _safe_int(m.group(4))
+            road_g = _safe_int(m.group(5))
+            road_att = _safe_int(m.group(6))
+            road_avg = _safe_int(m.group(7))
+
+            overall_g = (home_g or 0) + (road_g or 0)
+            overall_att = (home_att or 0) + (road_att or 0)
+            overall_avg = overall_att // overall_g if overall_g else None
+
+            records.append({
+                "team": team_name,
+                "home_games": home_g,
+                "home_total": home_att,
+                "home_avg": home_avg,
+                "road_games": road_g,
+                "road_total": road_att,
+                "road_avg": road_avg,
+                "overall_games": overall_g,
+                "overall_total": overall_att,
+                "overall_avg": overall_avg,
+                "raw_line": stripped,
+            })
+
+    logger.debug(f"[PARSER] parse_attendance: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_league_leaders(text: str) -> list[dict]:
+    """Parse de league leaders. Formato multi-coluna com alinhamento fixo."""
+    records = []
+    lines = _clean_lines(text)
+
+    current_categories = []
+
+    header_pattern = re.compile(
+        r"(SCORING AVERAGE|REBOUNDS PER GAME|ASSISTS PER GAME|"
+        r"FIELD GOAL PCT\.|3-PT FIELD GOAL PCT\.|FREE THROW PCT\.|"
+        r"STEALS PER GAME|BLOCKS PER GAME|MINUTES PER GAME)"
+    )
+
+    for line in lines:
+        stripped = line.strip()
+
+        if stripped.startswith("INCLUDES") or stripped.startswith("ROOKIE LEADERS"):
+            continue
+
+        # Checa se é uma linha de header
+        headers = header_pattern.findall(stripped)
+        if headers:
+            current_categories = headers
+            continue
+
+        if not current_categories:
+            continue
+
+        # Divide a linha em segmentos por espaçamento largo (4+ espaços)
+        segments = re.split(r"\s{4,}", stripped)
+
+        for i, segment in enumerate(segments):
+            segment = segment.strip()
+            if not segment:
+                continue
+
+            cat = current_categories[i] if i < len(current_categories) else (
+                current_categories[-1] if current_categories else None
+            )
+
+            # Extrai: "Player, Team    NUM NUM ... AVG"
+            pm = re.match(r"(.+?)\s{2,}([\d\.\s]+)$", segment)
+            if pm:
+                player_part = pm.group(1).strip()
+                nums_part = pm.group(2).strip().split()
+
+                if nums_part:
+                    value = _safe_float(nums_part[-1])
+
+                    # Separa nome e time: "Doncic, LA-L" ou "G. Antetokounmpo, Mil"
+                    name_parts = player_part.rsplit(",", 1)
+                    if len(name_parts) == 2:
+                        player_name = name_parts[0].strip()
+                        team = name_parts[1].strip().rstrip(".")
+                    else:
+                        player_name = player_part
+                        team = None
+
+                    records.append({
+                        "stat_category": cat,
+                        "rank": None,
+                        "player_name": player_name,
+                        "team": team,
+                        "value": value,
+                        "raw_line": segment.strip(),
+                    })
+
+    logger.debug(f"[PARSER] parse_league_leaders: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_ratios_players(text: str) -> list[dict]:
+    records = []
+    lines = _clean_lines(text)
+
+    for line in lines:
+        stripped = line.strip()
+
+        if stripped.startswith("INCLUDES") or stripped.startswith("Name"):
+            continue
+        if stripped in ("Assists Per Turnover", "Steals Per Turnover"):
+            continue
+        if "Assists Per Turnover" in stripped and "Steals Per Turnover" in stripped:
+            continue
+
+        # Dados lado a lado; divide por 4+ espaços
+        segments = re.split(r"\s{4,}", stripped)
+
+        for seg in segments:
+            seg = seg.strip()
+            if not seg or seg.startswith("Name"):
+                continue
+
+            # "Pritchard, Bos.          283   63  4.49"
+            m = re.match(r"(.+?)\s{2,}(\d+)\s+(\d+)\s+([\d\.]+)", seg)
+            if m:
+                player_raw = m.group(1).strip()
+                val1 = _safe_int(m.group(2))
+                val2 = _safe_int(m.group(3))
+                ratio = _safe_float(m.group(4))
+
+                name_parts = player_raw.rsplit(",", 1)
+                if len(name_parts) == 2:
+                    player_name = name_parts[0].strip()
+                    team = name_parts[1].strip().rstrip(".")
+                else:
+                    player_name = player_raw
+                    team = None
+
+                records.append({
+                    "player_name": player_name,
+                    "team": team,
+                    "games": None,
+                    "minutes": None,
+                    "fg_pct": None,
+                    "fg3_pct": None,
+                    "ft_pct": None,
+                    "ppg": ratio,
+                    "rpg": _safe_float(str(val1)) if val1 else None,
+                    "apg": _safe_float(str(val2)) if val2 else None,
+                    "spg": None,
+                    "bpg": None,
+                    "topg": None,
+                    "raw_line": seg.strip(),
+                })
+
+    logger.debug(f"[PARSER] parse_ratios_players: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_ratios_teams(text: str) -> list[dict]:
+    records = []
+    lines = _clean_lines(text)
+
+    for line in lines:
+        stripped = line.strip()
+
+        if (stripped.startswith("INCLUDES") or stripped.startswith("Name")
+                or "Assists" in stripped or "Steals" in stripped):
+            continue
+
+        segments = re.split(r"\s{4,}", stripped)
+
+        for seg in segments:
+            seg = seg.strip()
+            if not seg or seg.startswith("Name"):
+                continue
+
+            m = re.match(r"([A-Z][A-Za-z\.\s]+?)\s{2,}(\d+)\s+(\d+)\s+([\d\.]+)", seg)
+            if m:
+                team_name = m.group(1).strip()
+                val1 = _safe_int(m.group(2))
+                val2 = _safe_int(m.group(3))
+                ratio = _safe_float(m.group(4))
+
+                records.append({
+                    "team": team_name,
+                    "games": None,
+                    "wins": None,
+                    "losses": None,
+                    "fg_pct": None,
+                    "fg3_pct": None,
+                    "ft_pct": None,
+                    "ppg": ratio,
+                    "rpg": _safe_float(str(val1)) if val1 else None,
+                    "apg": _safe_float(str(val2)) if val2 else None,
+                    "raw_line": seg.strip(),
+                })
+
+    logger.debug(f"[PARSER] parse_ratios_teams: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_standings(text: str) -> list[dict]:
+    records = []
+    lines = text.split("\n")
+
+    current_east_div = None
+    current_west_div = None
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        if "EASTERN CONFERENCE" in line and "WESTERN CONFERENCE" in line:
+            continue
+
+        # Detecta divisões
+        if "DIVISION" in line:
+            parts = re.findall(r"(\w[\w\s]+DIVISION)", line)
+            if len(parts) >= 2:
+                current_east_div = parts[0].strip()
+                current_west_div = parts[1].strip()
+            elif len(parts) == 1:
+                p = parts[0].strip()
+                if "ATLANTIC" in p or "CENTRAL" in p or "SOUTHEAST" in p:
+                    current_east_div = p
+                else:
+                    current_west_div = p
+            continue
+
+        if re.match(r"^\s*W\s+L\s+PCT", line.strip()) or line.strip().startswith("Scheduled"):
+            continue
+
+        team_pattern = re.compile(
+            r"([A-Z][A-Za-z\.\s]+?)\s+"
+            r"(\d+)\s+(\d+)\s+"           # W L
+            r"(\.\d+)\s+"                 # PCT
+            r"([\d\.]+|-+)\s+"            # GB
+            r"(\d+\s*-\s*\d+)\s+"         # HOME
+            r"(\d+\s*-\s*\d+)\s+"         # ROAD
+            r"(\d+\s*-\s*\d+)\s+"         # NEUTRAL
+            r"(\d+\s*-\s*\d+)\s+"         # LAST-10
+            r"(Won|Lost)\s+"              # STREAK direction
+            r"(\d+)"                      # STREAK count
+        )
+
+        # Divide a linha: cols 0-84 = East, cols 85+ = West
+        left_part = line[:85] if len(line) > 85 else line
+        right_part = line[85:] if len(line) > 85 else ""
+
+        for part, conference, division in [
+            (left_part, "EASTERN", current_east_div),
+            (right_part, "WESTERN", current_west_div),
+        ]:
+            if not part.strip():
+                continue
+
+            m = team_pattern.search(part)
+            if m:
+                records.append({
+                    "conference": conference,
+                    "division": division,
+                    "team": m.group(1).strip(),
+                    "wins": _safe_int(m.group(2)),
+                    "losses": _safe_int(m.group(3)),
+                    "pct": _safe_float(m.group(4)),
+                    "games_behind": m.group(5).strip() if m.group(5).strip() != "-" else "0",
+                    "home_record": m.group(6).strip(),
+                    "road_record": m.group(7).strip(),
+                    "last_10": m.group(9).strip(),
+                    "streak": f"{m.group(10)} {m.group(11)}",
+                    "raw_line": part.strip(),
+                })
+
+    logger.debug(f"[PARSER] parse_standings: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+def parse_opponent_points(text: str) -> list[dict]:
+    records = []
+    lines = _clean_lines(text)
+
+    skip_keywords = ("INCLUDES", "Team", "TOTALS", "Points-in", "Fast Break", "Second Chance")
+
+    for line in lines:
+        stripped = line.strip()
+
+        if any(stripped.startswith(kw) for kw in skip_keywords):
+            continue
+
+        m = re.match(
+            r"^([A-Z][A-Za-z\.\s]+?)\s{2,}(\d+)\s+([\d\.]+)\s+([\d\.]+)\s+(\d+)\s+(\d+)\s+([\d\.]+)",
+            stripped
+        )
+        if m:
+            records.append({
+                "team": m.group(1).strip(),
+                "opp_fg": _safe_int(m.group(2)),
+                "opp_fga": None,
+                "opp_fg_pct": _safe_float(m.group(3)),
+                "opp_fg3": None,
+                "opp_f3a": None,
+                "opp_fg3_pct": _safe_float(m.group(4)),
+                "opp_ft": None,
+                "opp_fta": None,
+                "opp_ft_pct": None,
+                "opp_points": _safe_int(m.group(5)),
+                "raw_line": stripped,
+            })
+
+    logger.debug(f"[PARSER] parse_opponent_points: {len(records)} registros de {len(lines)} linhas")
+    return records
+
+
+# slug → parser com regex equivalente ao de PARSER_MAP
+REGEX_PARSER_MAP = {
+    "latest_boxscore_lines": parse_boxscore_lines,
+    "alphabetical_player_cumulatives": parse_player_cumulatives,
+    "attendance": parse_attendance,
+    "top_10_league_leaders": parse_league_leaders,
+    "ratios_players": parse_ratios_players,
+    "ratios_teams": parse_ratios_teams,
+    "standings": parse_standings,
+    "opponent_points_breakdown": parse_opponent_points,
+}
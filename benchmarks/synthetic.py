@@ -0,0 +1,508 @@
+"""
+Gerador de TXT sintéticos no formato do NBA Elias Stats, em escala.
+
+Produz, para cada dia de cada temporada, um arquivo por categoria de
+CATEGORY_URLS no formato que os parsers do parser.py esperam (mesmos
+headers, painéis lado a lado e rodapés). A escala é controlada por:
+  - leagues  — blocos de 30 times (jogadores, times e linhas por arquivo
+               crescem juntos; 15 jogadores por time)
+  - days     — dias carregados por temporada (um run do scraper por dia)
+  - seasons  — temporadas
+O conteúdo é determinístico para (seed, temporada, dia) e muda de um dia
+para o outro (cumulativos, standings, ...), como os arquivos reais.
+
+Limitações: a grade head-to-head traz só a primeira liga (o parser lê uma
+grade por arquivo) e os leaders são sempre top 10/20.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.synthetic --leagues 10 --days 3 --out /tmp/elias
+"""
+
+import argparse
+import os
+import random
+from datetime import date, timedelta
+
+from config import CATEGORY_URLS
+
+CITIES = (
+    ("ATL", "Atlanta", "Atl."), ("BOS", "Boston", "Bos."), ("BKN", "Brooklyn", "Bkn."),
+    ("CHA", "Charlotte", "Cha."), ("CHI", "Chicago", "Chi."), ("CLE", "Cleveland", "Cle."),
+    ("DET", "Detroit", "Det."), ("IND", "Indiana", "Ind."), ("MIA", "Miami", "Mia."),
+    ("MIL", "Milwaukee", "Mil."), ("NY", "New York", "NY"), ("ORL", "Orlando", "Orl."),
+    ("PHI", "Philadelphia", "Phi."), ("TOR", "Toronto", "Tor."), ("WAS", "Washington", "Was."),
+    ("DAL", "Dallas", "Dal."), ("DEN", "Denver", "Den."), ("GS", "Golden State", "GS"),
+    ("HOU", "Houston", "Hou."), ("LAC", "LA Clippers", "LA-C"), ("LAL", "LA Lakers", "LA-L"),
+    ("MEM", "Memphis", "Mem."), ("MIN", "Minnesota", "Min."), ("NO", "New Orleans", "NO"),
+    ("OKC", "Oklahoma City", "OKC"), ("PHX", "Phoenix", "Phx."), ("POR", "Portland", "Por."),
+    ("SAC", "Sacramento", "Sac."), ("SA", "San Antonio", "SA"), ("UTA", "Utah", "Utah"),
+)
+# 15 primeiros = Leste, 15 últimos = Oeste; 3 divisões de 5 em cada
+DIVISIONS = (
+    ("EASTERN", ("ATLANTIC", "CENTRAL", "SOUTHEAST")),
+    ("WESTERN", ("NORTHWEST", "PACIFIC", "SOUTHWEST")),
+)
+LAST = (
+    "Adams Allen Anderson Bailey Baker Barnes Bell Brooks Brown Butler Campbell Carter "
+    "Clark Coleman Collins Cook Cooper Cox Davis Edwards Evans Fisher Flores Foster Garcia "
+    "Gray Green Griffin Hall Harris Hayes Henderson Hill Howard Hughes Jackson James "
+    "Jenkins Johnson Jones Kelly King Lee Lewis Long Martin Miller Mitchell Moore Morgan "
+    "Morris Murphy Nelson Parker Perry Peterson Phillips Powell Price Reed Richardson "
+    "Rivera Roberts Robinson Rogers Ross Russell Sanders Scott Simmons Smith Stewart "
+    "Sullivan Taylor Thomas Thompson Turner Walker Ward Watson White Williams Wilson Wood "
+    "Wright Young"
+).split()
+FIRST = (
+    "Aaron Alex Andre Anthony Ben Brandon Cam Chris Cole Darius Dean Derrick Devin Eric "
+    "Gary Isaiah Jalen Jamal Jaylen Jordan Josh Julian Keegan Kevin Kyle Lamar Malik "
+    "Marcus Mason Miles Nick Obi Paul Quentin Reggie Scottie Tyrese Trey Victor Zach"
+).split()
+POSITIONS = ("G", "F", "C", "G-F", "F-C")
+ROSTER = 15
+INCLUDES = "INCLUDES GAMES OF {}"
+
+_FILES = {c["slug"]: os.path.basename(c["url"]) for c in CATEGORY_URLS}
+
+
+def _pct(made: int, attempts: int) -> str:
+    """.456 (sem o zero, como nos TXT); 1.000 quando made == attempts."""
+    if attempts and made >= attempts:
+        return "1.000"
+    return f".{made * 1000 // attempts:03d}" if attempts else ".000"
+
+
+class SyntheticLeague:
+    """Times e jogadores sintéticos; cada método gera o texto de uma categoria."""
+
+    def __init__(self, leagues: int = 1, days: int = 1, seasons: int = 1, seed: int = 2026):
+        self.leagues = leagues
+        self.days = days
+        self.seasons = seasons
+        self.seed = seed
+        self.teams = []  # (abrev, nome, abrev. com ponto, conferência, divisão)
+        for league in range(leagues):
+            suffix = "" if league == 0 else self._league_suffix(league)
+            for i, (abbr, name, short) in enumerate(CITIES):
+                conference, divisions = DIVISIONS[i // 15]
+                division = divisions[(i % 15) // 5] + (f" {suffix}" if suffix else "")
+                self.teams.append((
+                    abbr + suffix,
+                    f"{name} {suffix}" if suffix else name,
+                    f"{short.rstrip('.')}{suffix}." if suffix else short,
+                    conference,
+                    division,
+                ))
+        self.players = [self._player_name(i) for i in range(len(self.teams) * ROSTER)]
+
+    @staticmethod
+    def _league_suffix(league: int) -> str:
+        # B..Z, depois BA, BB, ... (só letras: os parsers exigem siglas alfabéticas)
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        out = ""
+        while league:
+            league, rest = divmod(league, 26)
+            out = letters[rest] + out
+        return out
+
+    @staticmethod
+    def _player_name(i: int) -> str:
+        last = LAST[i % len(LAST)]
+        if i >= len(LAST):
+            last += "-" + LAST[(i // len(LAST)) % len(LAST)]
+        return f"{last}, {FIRST[(i // len(LAST) ** 2) % len(FIRST)]}"
+
+    # ── Calendário ─────────────────────────────────────────────────
+    def game_date(self, season: int, day: int) -> date:
+        """Temporadas terminam na atual; os dias começam em 21/10."""
+        year = 2025 - (self.seasons - 1 - season)
+        return date(year, 10, 21) + timedelta(days=day)
+
+    def _rng(self, season: int, day: int, slug: str) -> random.Random:
+        return random.Random(f"{self.seed}:{season}:{day}:{slug}")
+
+    def _includes(self, day_date: date) -> str:
+        return INCLUDES.format(day_date.strftime("%A, %B %d, %Y").upper())
+
+    def _matchups(self, rng: random.Random) -> list[tuple[int, int]]:
+        """Todos os times jogam: pares aleatórios dentro de cada liga."""
+        games = []
+        for start in range(0, len(self.teams), 30):
+            order = list(range(start, start + 30))
+            rng.shuffle(order)
+            games += list(zip(order[::2], order[1::2]))
+        return games
+
+    # ── Categorias ─────────────────────────────────────────────────
+    def boxscore(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "box")
+        d = self.game_date(season, day)
+        lines = [
+            f"NBA LATEST BOXSCORE LINES - GAMES OF {d.strftime('%B %d, %Y').upper()}", "",
+            "DATE       TM  OPP NAME                     (POS)  G MIN  FG FGA  3P 3PA  FT FTA "
+            "OFF DEF TOT AST  PF  DQ STL  TO BLK PTS", "",
+        ]
+        for a, b in self._matchups(rng):
+            for team, opp in ((a, b), (b, a)):
+                for k in range(13):
+                    name = self.players[team * ROSTER + k]
+                    minutes = max(1, int(rng.gauss(24, 9))) if k < 10 else rng.randint(1, 8)
+                    fga = minutes // 2 + rng.randint(0, 4)
+                    fg = rng.randint(0, fga)
+                    f3a = rng.randint(0, fga // 2)
+                    fg3 = rng.randint(0, min(f3a, fg))
+                    fta = rng.randint(0, 8)
+                    ft = rng.randint(0, fta)
+                    orb, drb = rng.randint(0, 4), rng.randint(0, 9)
+                    nums = (
+                        1, minutes, fg, fga, fg3, f3a, ft, fta, orb, drb, orb + drb,
+                        rng.randint(0, 10), rng.randint(0, 5), 0, rng.randint(0, 3),
+                        rng.randint(0, 5), rng.randint(0, 3), 2 * fg + fg3 + ft,
+                    )
+                    lines.append(
+                        f"{d:%m/%d/%Y} {self.teams[team][0]:<3} {self.teams[opp][0]:<3} "
+                        f"{name:<24} ({POSITIONS[k % 5]:<3})" + "".join(f"{n:>4}" for n in nums)[1:]
+                    )
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    def cumulatives(self, season: int, day: int, rookies: bool = False) -> str:
+        rng = self._rng(season, day, "rookies" if rookies else "cum")
+        d = self.game_date(season, day)
+        games_played = day + 1
+        lines = [
+            f"{2025 - (self.seasons - 1 - season)} NBA {'ROOKIE' if rookies else 'PLAYER'} "
+            "CUMULATIVE STATISTICS", "",
+            "                                           G GS  MIN  FGM  FGA  PCT 3PM 3PA  PCT  "
+            "FTM  FTA  PCT  OFF  DEF  TOT  AST   PF   DQ  STL   TO  BLK  PTS  AVG   HI", "",
+        ]
+        step = 5 if rookies else 1  # ~1 rookie a cada 5 jogadores
+        for i in range(0, len(self.players), step):
+            team = self.teams[i // ROSTER]
+            g = games_played
+            gs = rng.randint(0, g)
+            mn = g * rng.randint(8, 36)
+            fga = max(1, mn // 2)
+            fg = int(fga * rng.uniform(.38, .58))
+            f3a = fga // 3
+            fg3 = int(f3a * rng.uniform(.25, .42))
+            fta = g * rng.randint(0, 7)
+            ft = int(fta * rng.uniform(.6, .92))
+            orb, drb = g * rng.randint(0, 3), g * rng.randint(1, 8)
+            pts = 2 * fg + fg3 + ft
+            name = f"{self.players[i]}, {team[2]}"
+            lines.append(
+                f"Total {team[0]:<3} ACT {name:<24}{g:>4}{gs:>3}{mn:>5}{fg:>5}{fga:>5} "
+                f"{_pct(fg, fga)}{fg3:>4}{f3a:>4} {_pct(fg3, f3a)}{ft:>5}{fta:>5} {_pct(ft, fta)}"
+                f"{orb:>5}{drb:>5}{orb + drb:>5}{g * rng.randint(0, 8):>5}{g * 2:>5}{0:>5}"
+                f"{g:>5}{g * 2:>5}{g // 2:>5}{pts:>5}{pts / g:>5.1f}{rng.randint(10, 50):>5}"
+            )
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    def attendance(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "att")
+        d = self.game_date(season, day)
+        lines = [
+            "NBA ATTENDANCE", "",
+            "                                  HOME ATTENDANCE           ROAD ATTENDANCE",
+            "TEAM                             G      TOTAL    AVG      G      TOTAL    AVG", "",
+        ]
+        for team in self.teams:
+            hg = rg = max(1, (day + 1) // 2)
+            ha, ra = rng.randint(15500, 20500), rng.randint(16500, 19500)
+            lines.append(f"{team[1]:<32}{hg:>3}{hg * ha:>11,}{ha:>7,}{rg:>6}{rg * ra:>11,}{ra:>7,}")
+        lines += ["", f"{'TOTALS':<32}{len(self.teams):>3}", "", self._includes(d)]
+        return "\n".join(lines)
+
+    def scores(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "scores")
+        d = self.game_date(season, day)
+        lines = [
+            f"NBA SCORES AND LEADERS - GAMES OF {d.strftime('%A, %B %d, %Y').upper()}", "",
+            "                 TOT  Q1 Q2 Q3 Q4            POINTS           REBOUNDS         ASSISTS", "",
+        ]
+        for a, b in self._matchups(rng):
+            for team in (a, b):
+                qs = [rng.randint(20, 38) for _ in range(4)]
+                pts, reb, ast = (
+                    f"{self.players[team * ROSTER + k].split(',')[0]} {rng.randint(lo, hi)}"
+                    for k, (lo, hi) in enumerate(((18, 45), (6, 18), (4, 14)))
+                )
+                lines.append(
+                    f"{self.teams[team][1]:<15}{sum(qs):>5} {qs[0]:>2} {qs[1]:>2} {qs[2]:>2} {qs[3]:>2}"
+                    f"            {pts:<17}{reb:<17}{ast}"
+                )
+            lines.append("")
+        return "\n".join(lines)
+
+    def highs_lows(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "hl")
+        d = self.game_date(season, day)
+        categories = (
+            "Points", "Field Goals", "Field Goal Attempts", "3-Pt Field Goals", "Free Throws",
+            "Rebounds", "Offensive Rebounds", "Assists", "Steals", "Blocked Shots", "Minutes",
+        )
+        lines = ["NBA SINGLE-GAME HIGHS AND LOWS", "", "SINGLE-GAME HIGHS -- PLAYERS", ""]
+        for category in categories:
+            a, b = rng.sample(range(len(self.teams)), 2)
+            player = self.players[a * ROSTER].split(",")[0]
+            lines.append(
+                f"{category} -- {rng.randint(10, 60)}, {player}, {self.teams[a][0]} "
+                f"{rng.choice(('vs.', 'at'))} {self.teams[b][0]}, 10/{21 + rng.randint(0, 9)}"
+            )
+        lines += ["", "SINGLE-GAME LOWS -- TEAMS", ""]
+        for category in categories[:6]:
+            a, b = rng.sample(range(len(self.teams)), 2)
+            lines.append(
+                f"Fewest {category} -- {rng.randint(5, 80)}, {self.teams[a][1]} at "
+                f"{self.teams[b][0]}, 10/{21 + rng.randint(0, 9)}"
+            )
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    def leaders(self, season: int, day: int, rows: int = 10, rookies: bool = False) -> str:
+        rng = self._rng(season, day, f"leaders{rows}{rookies}")
+        d = self.game_date(season, day)
+        panels = (
+            ("SCORING AVERAGE", "REBOUNDS PER GAME"), ("ASSISTS PER GAME", "FIELD GOAL PCT."),
+            ("3-PT FIELD GOAL PCT.", "FREE THROW PCT."), ("STEALS PER GAME", "BLOCKS PER GAME"),
+        )
+        lines = ["ROOKIE LEADERS" if rookies else "NBA LEAGUE LEADERS", ""]
+        for left, right in panels:
+            lines.append(f"{left:<23}G   FG  FT  PTS  AVG     {right:<25}G  OFF  DEF  TOT  AVG")
+            picks = rng.sample(range(len(self.players)), rows * 2)
+            for r in range(rows):
+                lp, rp = picks[2 * r], picks[2 * r + 1]
+                ln = f"{self.players[lp].split(',')[0]}, {self.teams[lp // ROSTER][2]}"
+                rn = f"{self.players[rp].split(',')[0]}, {self.teams[rp // ROSTER][2]}"
+                left_col = f"{ln:<22}{day + 1:>2} {437:>4} {356:>3} {1379:>4} {33.0 - r * .7:>4.1f}"
+                right_col = f"{rn:<24}{day + 1:>2} {112:>4} {371:>4} {483:>4} {13.0 - r * .3:>4.1f}"
+                lines.append(f"{left_col:<48}{right_col}")
+            lines.append("")
+        lines.append(self._includes(d))
+        return "\n".join(lines)
+
+    def ratios(self, season: int, day: int, players: bool) -> str:
+        rng = self._rng(season, day, f"ratios{players}")
+        d = self.game_date(season, day)
+        lines = [
+            "NBA RATIOS", "",
+            f"{'Assists Per Turnover':<44}Steals Per Turnover",
+            f"{'Name                     AST   TO RATIO':<44}Name                     STL   TO RATIO",
+        ]
+        names = (
+            [f"{p.split(',')[0]}, {self.teams[i // ROSTER][2]}" for i, p in enumerate(self.players)][::10]
+            if players else [t[1] for t in self.teams]
+        )
+        for i in range(0, len(names) - 1, 2):
+            a, t = rng.randint(150, 1700), rng.randint(40, 900)
+            s, t2 = rng.randint(60, 600), rng.randint(30, 900)
+            left = f"{names[i]:<24}{a:>4} {t:>4}  {a / t:>4.2f}"
+            lines.append(f"{left:<44}{names[i + 1]:<24}{s:>4} {t2:>4}  {s / t2:>4.2f}")
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    def playoffs(self, season: int, day: int) -> str:
+        rng = self._rng(season, 0, "playoffs")  # muda só por temporada
+        lines = ["2024-2025 NBA POSTSEASON RESULTS", ""]
+        for start in range(0, len(self.teams), 30):
+            for round_name, series in (
+                ("FIRST ROUND", 8), ("CONFERENCE SEMIFINALS", 4),
+                ("CONFERENCE FINALS", 2), ("NBA FINALS", 1),
+            ):
+                lines += [round_name, ""]
+                for s in range(series):
+                    a, b = self.teams[start + s], self.teams[start + 15 + s]
+                    lines.append(f"{a[0]} vs. {b[1]}")
+                    for g in range(rng.randint(4, 7)):
+                        home, away = (a, b) if g % 2 == 0 else (b, a)
+                        lines.append(
+                            f"Apr {10 + g * 2:>2} {away[0]} {rng.randint(90, 130)} at "
+                            f"{home[0]} {rng.randint(90, 130)}"
+                        )
+                    lines += [f"({a[0]} WON SERIES 4-{rng.randint(0, 3)})", ""]
+        return "\n".join(lines)
+
+    def standings(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "standings")
+        header = "                     W  L   PCT   GB   HOME  ROAD   NEUTRAL  L-10  STREAK"
+        lines = [f"{'EASTERN CONFERENCE':<85}WESTERN CONFERENCE", ""]
+        games = day + 1
+
+        def row(team):
+            wins = rng.randint(0, games)
+            losses = games - wins
+            hw, hl = wins // 2, losses // 2
+            l10 = min(wins, 10)
+            gb = "-" if wins == games else f"{(games - wins) / 2:.1f}"
+            return (
+                f"{team[1]:<20}{wins:>2}{losses:>3}{_pct(wins, games):>6}{gb:>5}"
+                f"{hw:>4}-{hl:>2}{wins - hw:>3}-{losses - hl:>2}{0:>6}-{0:>2}"
+                f"{l10:>3}-{min(10, games) - l10}{rng.choice(('Won', 'Lost')):>7}{rng.randint(1, 6):>3}"
+            )
+
+        for start in range(0, len(self.teams), 30):
+            east, west = self.teams[start:start + 15], self.teams[start + 15:start + 30]
+            for div in range(3):
+                e_div, w_div = east[div * 5:div * 5 + 5], west[div * 5:div * 5 + 5]
+                lines.append(f"{e_div[0][4] + ' DIVISION':<85}{w_div[0][4]} DIVISION")
+                lines.append(f"{header:<85}{header}")
+                for e, w in zip(e_div, w_div):
+                    lines.append(f"{row(e):<85}{row(w)}")
+                lines.append("")
+        lines.append("Scheduled games remaining: 27")
+        return "\n".join(lines)
+
+    def head_to_head(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "h2h")
+        d = self.game_date(season, day)
+        abbrs = [t[0] for t in self.teams[:30]]
+        lines = [
+            "NBA HEAD-TO-HEAD WIN GRID", "",
+            "     " + " ".join(f"{a:>4}" for a in abbrs[:15]),
+            "     " + " ".join(f"{a:>4}" for a in abbrs[15:]), "",
+        ]
+        for i, abbr in enumerate(abbrs):
+            cells = "".join(
+                "  --" if i == j else f"{rng.randint(0, 2):>2}{rng.randint(0, 2):>2}"
+                for j in range(30)
+            )
+            wins = rng.randint(0, day + 1)
+            lines.append(
+                f"{abbr:<5}{cells}  {wins:>2} {day + 1 - wins:>2}  {_pct(wins, day + 1)}   -    7-3  Won   1"
+            )
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    def offensive_defensive(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "offdef")
+        d = self.game_date(season, day)
+        g = day + 1
+        lines = [
+            "TEAMS' STATISTICS", "",
+            "TEAM     G   MADE  ATT. PCT. MADE  ATT. PCT.  MADE  ATT. PCT.   OFF. DEF. TOT.  AST"
+            "   PF  DQ  STL   TO  BLK   PTS   AVG", "",
+        ]
+        for team in self.teams:
+            fg, fga = 42 * g, 90 * g
+            f3, f3a = 13 * g, 36 * g
+            ft, fta = rng.randint(15, 22) * g, 25 * g
+            o, d_ = rng.randint(8, 12) * g, rng.randint(30, 36) * g
+            pts = 2 * fg + f3 + ft
+            lines.append(
+                f"{team[2]:<6}{g:>4}{fg:>7}{fga:>5} {_pct(fg, fga)}{f3:>6}{f3a:>5} {_pct(f3, f3a)}"
+                f"{ft:>7}{fta:>5} {_pct(ft, fta)}{o:>7}{d_:>5}{o + d_:>5}{26 * g:>5}{20 * g:>5}"
+                f"{rng.randint(0, 3):>4}{8 * g:>5}{14 * g:>5}{5 * g:>5}{pts:>6}{pts / g:>6.1f}"
+            )
+        lines += [
+            "", "OPPONENTS' STATISTICS", "",
+            "TEAM     MADE  ATT. PCT. MADE  ATT. PCT.  MADE  ATT. PCT.   OFF. DEF. TOT.  AST   PF"
+            "  DQ   PTS   AVG  DIFF", "",
+        ]
+        for team in self.teams:
+            fg, fga = max(101, 42 * g), 90 * g
+            f3, f3a = 13 * g, 36 * g
+            ft, fta = rng.randint(15, 22) * g, 25 * g
+            o, d_ = rng.randint(8, 12) * g, rng.randint(30, 36) * g
+            pts = 2 * fg + f3 + ft
+            lines.append(
+                f"{team[2]:<6}{fg:>6}{fga:>5} {_pct(fg, fga)}{f3:>6}{f3a:>5} {_pct(f3, f3a)}"
+                f"{ft:>7}{fta:>5} {_pct(ft, fta)}{o:>7}{d_:>5}{o + d_:>5}{26 * g:>5}{20 * g:>5}"
+                f"{rng.randint(0, 3):>4}{pts:>6}{pts / g:>6.1f}{rng.uniform(-9, 9):>+6.1f}"
+            )
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    def miscellaneous(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "misc")
+        d = self.game_date(season, day)
+        lines = [
+            "NBA TEAM MISCELLANEOUS STATISTICS", "",
+            "TEAM                    OWN    OPP.    OWN   OPP.    OWN   OPP.    OFF.  DEF.  TOT.", "",
+        ]
+        for team in self.teams:
+            lines.append(
+                f"{team[1]:<22}{rng.uniform(105, 125):>6.1f}{rng.uniform(105, 125):>7.1f}"
+                f"    .{rng.randint(440, 500)}  .{rng.randint(440, 500)}{rng.uniform(11, 17):>8.1f}"
+                f"{rng.uniform(11, 17):>6.1f}{rng.uniform(20, 33):>8.1f}{rng.uniform(70, 80):>6.1f}"
+            )
+        lines += ["", "OVERTIME GAMES", "", self._includes(d)]
+        return "\n".join(lines)
+
+    def opponent_points(self, season: int, day: int) -> str:
+        rng = self._rng(season, day, "opp")
+        d = self.game_date(season, day)
+        g = day + 1
+        lines = [
+            "NBA OPPONENT POINTS BREAKDOWN", "", "Points-in-the-Paint", "",
+            "Team                  InPaint  PerGame PctofTot   TotPts    Games   Tot/Gm",
+        ]
+        for team in self.teams:
+            total = rng.randint(105, 122) * g
+            paint = rng.randint(44, 60) * g
+            lines.append(
+                f"{team[1]:<22}{paint:>7}{paint / g:>9.3f}{paint / total * 100:>9.3f}"
+                f"{total:>9}{g:>9}{total / g:>9.3f}"
+            )
+        lines += ["", self._includes(d)]
+        return "\n".join(lines)
+
+    # ── Dia completo ───────────────────────────────────────────────
+    def day_files(self, season: int, day: int) -> dict[str, str]:
+        """slug → texto de todas as categorias de CATEGORY_URLS para o dia."""
+        return {
+            "latest_boxscore_lines": self.boxscore(season, day),
+            "alphabetical_player_cumulatives": self.cumulatives(season, day),
+            "alphabetical_rookie_cumulatives": self.cumulatives(season, day, rookies=True),
+            "attendance": self.attendance(season, day),
+            "latest_scores_and_leaders": self.scores(season, day),
+            "single_game_highs_lows": self.highs_lows(season, day),
+            "top_10_league_leaders": self.leaders(season, day, 10),
+            "top_20_league_leaders": self.leaders(season, day, 20),
+            "rookie_league_leaders": self.leaders(season, day, 10, rookies=True),
+            "ratios_players": self.ratios(season, day, players=True),
+            "ratios_teams": self.ratios(season, day, players=False),
+            "playoff_schedule_results": self.playoffs(season, day),
+            "standings": self.standings(season, day),
+            "head_to_head_win_grid": self.head_to_head(season, day),
+            "offensive_defensive": self.offensive_defensive(season, day),
+            "miscellaneous": self.miscellaneous(season, day),
+            "opponent_points_breakdown": self.opponent_points(season, day),
+        }
+
+    def iter_days(self):
+        """(temporada, dia, data do jogo) em ordem cronológica."""
+        for season in range(self.seasons):
+            for day in range(self.days):
+                yield season, day, self.game_date(season, day)
+
+    def write(self, out_dir: str) -> int:
+        """Grava <out>/<temporada>/<dia>/<arquivo do CDN>. Retorna nº de arquivos."""
+        count = 0
+        for season, day, game_date in self.iter_days():
+            folder = os.path.join(out_dir, str(game_date.year), f"{game_date:%Y-%m-%d}")
+            os.makedirs(folder, exist_ok=True)
+            for slug, text in self.day_files(season, day).items():
+                with open(os.path.join(folder, _FILES[slug]), "w", encoding="utf-8") as f:
+                    f.write(text + "\n")
+                count += 1
+        return count
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--leagues", type=int, default=1, help="blocos de 30 times")
+    ap.add_argument("--days", type=int, default=1, help="dias por temporada")
+    ap.add_argument("--seasons", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=2026)
+    ap.add_argument("--out", required=True)
+    args = ap.parse_args()
+
+    league = SyntheticLeague(args.leagues, args.days, args.seasons, args.seed)
+    count = league.write(args.out)
+    print(f"{count} arquivos gravados em {args.out} ({len(league.teams)} times, "
+          f"{len(league.players)} jogadores)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Estado do navegador entre execuções: caminho do chromedriver e cookies.
+
+Uma partida a frio custa a checagem de versão do webdriver-manager (rede),
+a abertura do Chrome e os ~7s de navigate_to_page só para obter os
+cookies de sessão do site. Aqui ficam, em JSON:
+
+  DriverPathCache  o caminho resolvido por ChromeDriverManager().install(),
+                   reaproveitado por até DRIVER_CACHE_DAYS dias enquanto o
+                   binário existir
+  CookieJar        os cookies do Chrome após a navegação, o User-Agent e
+                   as categorias extras vistas na página; numa partida a
+                   quente (cookies ainda válidos) a sessão HTTP é montada
+                   direto deles e a página não é aberta
+
+Cookies sem expiração (de sessão) valem até COOKIE_MAX_AGE segundos após a
+navegação. Um 403 na partida a quente faz o scraper abrir a página e
+guardar cookies novos; um 403 mesmo com eles invalida o jar, e a próxima
+execução parte a frio.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+
+from config import COOKIE_JAR_FILE, COOKIE_MAX_AGE, DRIVER_CACHE_DAYS, DRIVER_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+# Cookies que expiram nos próximos segundos já contam como vencidos
+_EXPIRY_MARGIN = 60
+
+
+def _load_json(path: str, label: str) -> dict:
+    """Conteúdo do arquivo (ausente ou corrompido = {})."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"[BROWSER] {label} ignorado ({path}): {e}")
+        return {}
+
+
+def _save_json(path: str, data: dict):
+    """Grava de forma atômica (arquivo temporário + rename)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class DriverPathCache:
+    """Caminho do chromedriver resolvido pelo webdriver-manager."""
+
+    def __init__(self, path: str = DRIVER_CACHE_FILE, max_days: float = DRIVER_CACHE_DAYS):
+        self.path = path
+        self.max_age = max_days * 86400
+
+    def get(self) -> str | None:
+        """Caminho em cache, se ainda existe e não passou de max_days."""
+        entry = _load_json(self.path, "Cache do chromedriver")
+        driver = entry.get("path")
+        if not driver or not os.path.isfile(driver):
+            return None
+        if time.time() - entry.get("resolved_at", 0) > self.max_age:
+            return None
+        return driver
+
+    def resolve(self, install) -> str:
+        """Chama `install()` (ChromeDriverManager().install) e guarda o caminho."""
+        driver = install()
+        _save_json(self.path, {"path": driver, "resolved_at": time.time()})
+        return driver
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class CookieJar:
+    """Cookies do site (formato do Selenium) com expiração, persistidos em JSON."""
+
+    def __init__(self, path: str = COOKIE_JAR_FILE, max_age: float = COOKIE_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self.cookies: list[dict] = []
+        self.user_agent: str | None = None
+        self.extras: list[dict] = []
+        self.saved_at = 0.0
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Carrega o jar, descartando os cookies vencidos."""
+        data = _load_json(self.path, "Cookie jar")
+        self.saved_at = data.get("saved_at", 0.0)
+        self.user_agent = data.get("user_agent")
+        self.extras = data.get("extras", [])
+        now = time.time()
+        self.cookies = [c for c in data.get("cookies", []) if self._expiry(c) > now + _EXPIRY_MARGIN]
+        dropped = len(data.get("cookies", [])) - len(self.cookies)
+        if dropped:
+            logger.info(f"[BROWSER] {dropped} cookies vencidos descartados do jar")
+
+    def _expiry(self, cookie: dict) -> float:
+        # Cookie de sessão (sem "expiry"): vale max_age a partir da navegação
+        return cookie.get("expiry") or self.saved_at + self.max_age
+
+    def valid(self) -> bool:
+        """True se dá para montar a sessão HTTP sem abrir a página."""
+        return bool(self.cookies and self.user_agent)
+
+    def expires_in(self) -> float:
+        """Segundos até o primeiro cookie do jar vencer."""
+        if not self.cookies:
+            return 0.0
+        return min(self._expiry(c) for c in self.cookies) - time.time()
+
+    def store(self, cookies: list[dict], user_agent: str, extras: list[dict] | None = None):
+        """Guarda os cookies do browser logo após a navegação e grava em disco."""
+        with self.lock:
+            self.saved_at = time.time()
+            self.cookies = [dict(c) for c in cookies]
+            self.user_agent = user_agent
+            if extras is not None:
+                self.extras = extras
+            self._save()
+        logger.info(f"[BROWSER] {len(self.cookies)} cookies guardados em {self.path}")
+
+    def store_extras(self, extras: list[dict]):
+        """Atualiza as categorias extras vistas na página (usadas na partida a quente)."""
+        with self.lock:
+            self.extras = extras
+            if self.cookies:
+                self._save()
+
+    def invalidate(self):
+        """Esquece os cookies (ex.: 403 do CDN); a próxima execução parte a frio."""
+        with self.lock:
+            if not self.cookies:
+                return
+            self.cookies = []
+            self._save()
+        logger.warning("[BROWSER] Cookie jar invalidado — próxima execução abre a página")
+
+    def _save(self):
+        _save_json(self.path, {
+            "saved_at": self.saved_at,
+            "saved_at_iso": datetime.fromtimestamp(self.saved_at).isoformat(timespec="seconds"),
+            "user_agent": self.user_agent,
+            "cookies": self.cookies,
+            "extras": self.extras,
+        })
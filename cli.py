@@ -0,0 +1,145 @@
+"""
+Linha de comando do NBA Stats Scraper.
+
+    python cli.py scrape [--profile sample]       # fluxo completo (= python main.py)
+    python cli.py ingest downloads/ [--date D]    # TXT já baixados, sem navegador
+    python cli.py reparse [--run N] [--slugs a,b] # reparse do conteúdo salvo
+    python cli.py backfill --from-run N           # corrige o histórico no lugar
+    python cli.py export standings -o out.csv     # view/tabela para CSV ou JSONL
+    python cli.py bench corpus --scales 1,10      # benchmarks/bench_<nome>.py
+
+Este módulo só importa a biblioteca padrão: cada subcomando declara o módulo
+de que precisa e ele é importado depois do parse dos argumentos. Selenium e
+webdriver_manager só carregam no `scrape`; o engine do banco só é criado
+na primeira consulta. `python cli.py bench startup` mede o tempo de
+inicialização de cada subcomando.
+"""
+
+import sys
+import logging
+import argparse
+import importlib
+
+BENCHMARKS = ("parse", "corpus", "load", "scaling", "pipeline", "startup", "logging")
+
+
+# ── Subcomandos ────────────────────────────────────────────────────
+def run_scrape(main, args):
+    main.main(args.profile, args.profile_stages)
+
+
+def run_ingest(ingest, args):
+    if args.dry_run:
+        for path in args.paths:
+            ingest.dry_run(path)
+        return
+    from database import init_db
+
+    init_db()
+    total = sum(ingest.ingest(path, args.date) for path in args.paths)
+    logging.getLogger(__name__).info(
+        f"[CLI] Ingestão concluída — {len(args.paths)} execuções, {total} categorias salvas"
+    )
+
+
+def run_reparse(reparse, args):
+    slugs = args.slugs.split(",") if args.slugs else None
+    reparse.reparse(args.run, slugs)
+
+
+def run_backfill(reparse, args):
+    slugs = args.slugs.split(",") if args.slugs else None
+    options = {"restart": args.restart}
+    if args.workers is not None:
+        options["workers"] = args.workers
+    try:
+        reparse.backfill(slugs, args.from_run, args.to_run, **options)
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+def run_export(export, args):
+    if args.name not in export.exportable():
+        sys.exit(f"Não exportável: {args.name} (opções: {', '.join(export.exportable())})")
+    if args.output == "-":
+        export.export(args.name, sys.stdout, args.format)
+        return
+    with open(args.output, "w", encoding="utf-8", newline="") as out:
+        export.export(args.name, out, args.format)
+
+
+def run_bench(bench, args):
+    sys.argv = [f"bench {args.name}", *args.args]
+    bench.main()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="cli.py", description=__doc__.split("\n\n")[0])
+    ap.add_argument("-v", "--verbose", action="store_true", help="log em nível DEBUG")
+    ap.add_argument("--startup-check", action="store_true", help=argparse.SUPPRESS)
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scrape", help="fluxo completo com o Chrome (Selenium)")
+    p.add_argument("--profile", choices=("cprofile", "sample", "tracemalloc"),
+                   help="mede os estágios do run (relatórios em PROFILE_DIR/run_<id>/)")
+    p.add_argument("--profile-stages", type=lambda v: v.split(","),
+                   help="scrape_all,parsers,save_to_database (padrão: todos)")
+    p.set_defaults(module="main", handler=run_scrape)
+
+    p = sub.add_parser("ingest", help="carrega TXT baixados (diretório, .txt, .zip, .tar)")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--date", help="data da execução (AAAA-MM-DD)")
+    p.add_argument("--dry-run", action="store_true", help="só faz o parse (sem banco)")
+    p.set_defaults(module="ingest", handler=run_ingest)
+
+    p = sub.add_parser("reparse", help="parse + carga do conteúdo bruto já salvo")
+    p.add_argument("--run", type=int, help="run de origem (padrão: último de cada categoria)")
+    p.add_argument("--slugs", help="categorias separadas por vírgula (padrão: todas)")
+    p.set_defaults(module="reparse", handler=run_reparse)
+
+    p = sub.add_parser("backfill", help="reparse do raw_data de uma faixa de runs no histórico")
+    p.add_argument("--slugs", help="categorias separadas por vírgula (padrão: todas)")
+    p.add_argument("--from-run", type=int, help="primeiro run (inclusive)")
+    p.add_argument("--to-run", type=int, help="último run (inclusive)")
+    p.add_argument("--workers", type=int, help="processos de parse (padrão: PARSE_WORKERS)")
+    p.add_argument("--restart", action="store_true", help="ignora o checkpoint salvo")
+    p.set_defaults(module="reparse", handler=run_backfill)
+
+    p = sub.add_parser("export", help="exporta uma view/tabela para CSV ou JSONL")
+    p.add_argument("name", help="slug da categoria ou player_game_log / player_rolling_*")
+    p.add_argument("-f", "--format", choices=("csv", "jsonl"), default="csv")
+    p.add_argument("-o", "--output", default="-", help="arquivo de saída (- = stdout)")
+    p.set_defaults(module="export", handler=run_export)
+
+    p = sub.add_parser("bench", help="roda um script de benchmarks/")
+    p.add_argument("name", choices=BENCHMARKS)
+    p.add_argument("args", nargs=argparse.REMAINDER, help="argumentos do benchmark")
+    p.set_defaults(module=None, handler=run_bench)
+    return ap
+
+
+def main(argv: list[str] | None = None):
+    args = build_parser().parse_args(argv)
+    module_name = args.module or f"benchmarks.bench_{args.name}"
+    module = importlib.import_module(module_name)
+
+    if args.startup_check:
+        # Usado por benchmarks/bench_startup.py: só o custo dos imports
+        print(f"{len(sys.modules)} {int('selenium' in sys.modules)}")
+        return
+
+    if args.command not in ("scrape", "bench"):
+        # main.py e os benchmarks configuram o próprio log
+        from log_setup import setup_logging
+
+        options = {"level": "DEBUG"} if args.verbose else {}
+        setup_logging(
+            log_file=None,
+            stream=sys.stderr if args.command == "export" else sys.stdout,
+            **options,
+        )
+    args.handler(module, args)
+
+
+if __name__ == "__main__":
+    main()
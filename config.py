@@ -10,17 +10,78 @@ DB_NAME = os.getenv("DB_NAME", "nba_data")
 DB_USER = os.getenv("DB_USER", "meuusuario")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "minhasenha")
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# Método de carga dos registros parsed: copy (COPY FROM STDIN) | insert (Core executemany) | orm
+LOAD_METHOD = os.getenv("LOAD_METHOD", "copy").lower()
+# Registros por lote nos métodos insert/orm (o pico de memória da carga acompanha o lote)
+LOAD_BATCH_SIZE = int(os.getenv("LOAD_BATCH_SIZE", "5000"))
+# Processos para o parse das categorias (0 ou 1 = no próprio processo)
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))
+# Itens em espera entre os estágios download → parse → carga (back-pressure)
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+# Progresso do backfill (reparse do raw_data por faixa de runs), para retomar
+BACKFILL_CHECKPOINT_FILE = os.path.abspath(
+    os.getenv("BACKFILL_CHECKPOINT_FILE", "./.cache/backfill.json")
+)
+
+# Relatórios do --profile (um diretório run_<id> por execução) e intervalo da amostragem
+PROFILE_DIR = os.path.abspath(os.getenv("PROFILE_DIR", "./profiles"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+# Arquivo .prom para o coletor textfile do node_exporter ("" = desligado)
+PROMETHEUS_TEXTFILE = os.getenv("PROMETHEUS_TEXTFILE", "")
+
+# ── Logging ────────────────────────────────────────────────────────
+# Nível geral e por subsistema (módulo), ex.: "parser=WARNING,downloader=DEBUG"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FILE = os.getenv("LOG_FILE", "nba_scraper.log")
 
 # ── Selenium ───────────────────────────────────────────────────────
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 DOWNLOAD_DIR = os.path.abspath(os.getenv("DOWNLOAD_DIR", "./downloads"))
+# Perfil persistente do Chrome (cache de página e cookies entre runs; "" = perfil temporário)
+BROWSER_PROFILE_DIR = os.getenv("BROWSER_PROFILE_DIR", "./.cache/chrome-profile")
+# Caminho do chromedriver resolvido pelo webdriver-manager, reaproveitado por N dias
+DRIVER_CACHE_FILE = os.path.abspath(os.getenv("DRIVER_CACHE_FILE", "./.cache/chromedriver.json"))
+DRIVER_CACHE_DAYS = float(os.getenv("DRIVER_CACHE_DAYS", "7"))
+
+# Partida a quente: com cookies válidos no jar, a sessão HTTP não abre a página
+BROWSER_WARM_START = os.getenv("BROWSER_WARM_START", "true").lower() == "true"
+COOKIE_JAR_FILE = os.path.abspath(os.getenv("COOKIE_JAR_FILE", "./.cache/cookies.json"))
+# Validade (s) dos cookies de sessão (sem expiração) após a navegação
+COOKIE_MAX_AGE = float(os.getenv("COOKIE_MAX_AGE", "21600"))
+
+# ── Download dos TXT ───────────────────────────────────────────────
+# "http": navega uma vez e baixa os TXT direto com os cookies do Chrome
+# "browser": abre cada TXT em uma aba nova (modo antigo, mais lento)
+FETCH_MODE = os.getenv("FETCH_MODE", "http").lower()
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "20"))
+
+# Download concorrente (FETCH_MODE=http)
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "8"))
+FETCH_PER_HOST = int(os.getenv("FETCH_PER_HOST", "4"))        # conexões simultâneas por host
+FETCH_RATE_LIMIT = float(os.getenv("FETCH_RATE_LIMIT", "10"))  # requisições/s (0 = sem limite)
+FETCH_DEADLINE = float(os.getenv("FETCH_DEADLINE", "120"))     # segundos para a execução inteira
+
+# Cache de validadores HTTP (ETag / Last-Modified) — GET condicional
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_FILE = os.path.abspath(os.getenv("HTTP_CACHE_FILE", "./.cache/http_validators.json"))
+
+# Gravação das respostas (corpo + headers) para replay offline (replay.py)
+FETCH_RECORD = os.getenv("FETCH_RECORD", "false").lower() == "true"
+RECORD_DIR = os.path.abspath(os.getenv("RECORD_DIR", os.path.join(DOWNLOAD_DIR, "recordings")))
 
 # ── URL alvo ───────────────────────────────────────────────────────
-NBA_STATS_URL = "https://www.nba.com/stats/tools/media-central-game-stats"
+# NBA_STATS_URL e CDN_BASE podem apontar para o servidor de replay local
+NBA_STATS_URL = os.getenv(
+    "NBA_STATS_URL", "https://www.nba.com/stats/tools/media-central-game-stats"
+)
 
 # ── Base URL do CDN ────────────────────────────────────────────────
-CDN_BASE = "https://cdn.nba.com/static/json/staticData/EliasGameStats/00"
+CDN_BASE = os.getenv(
+    "CDN_BASE", "https://cdn.nba.com/static/json/staticData/EliasGameStats/00"
+).rstrip("/")
 
 # ── Mapeamento de categorias (League Wide Stats) ──────────────────
 # Chave: texto exibido na página → valor: slug para nome de tabela
@@ -650,6 +650,8 @@ LIMIT 20;
 -- │  §11  CONSISTÊNCIA DO JOGADOR (análise de variância)            │
 -- └─────────────────────────────────────────────────────────────────┘
 
+-- (player_game_log: todos os jogos da temporada acumulados entre execuções)
+
 -- 11.1  Variância de pontos por jogo (consistência de jogadores)
 -- Maior variância = maior risco em props de pontos
 SELECT
@@ -664,7 +666,7 @@ SELECT
     ROUND(
         STDDEV(lbl.points) / NULLIF(AVG(lbl.points), 0) * 100, 1
     )                                          AS coef_variacao_pct
-FROM latest_boxscore_lines lbl
+FROM player_game_log lbl
 GROUP BY lbl.player_name, lbl.team
 HAVING COUNT(*) >= 3
 ORDER BY coef_variacao_pct ASC;
@@ -680,7 +682,7 @@ SELECT
     ROUND(
         STDDEV(lbl.total_reb) / NULLIF(AVG(lbl.total_reb), 0) * 100, 1
     )                                               AS coef_var_reb_pct
-FROM latest_boxscore_lines lbl
+FROM player_game_log lbl
 GROUP BY lbl.player_name, lbl.team
 HAVING COUNT(*) >= 3
 ORDER BY media_reb DESC;
@@ -696,12 +698,28 @@ SELECT
     ROUND(
         STDDEV(lbl.assists) / NULLIF(AVG(lbl.assists), 0) * 100, 1
     )                                               AS coef_var_ast_pct
-FROM latest_boxscore_lines lbl
+FROM player_game_log lbl
 GROUP BY lbl.player_name, lbl.team
 HAVING COUNT(*) >= 3
 ORDER BY media_ast DESC;
 
 
+-- 11.4  Consistência pré-calculada na ingestão (player_rolling_averages)
+-- window_size: 5 / 10 / 20 últimos jogos, 0 = temporada
+SELECT
+    player_name,
+    team,
+    window_size,
+    games,
+    pts_avg, pts_std, pts_cv_pct,
+    reb_avg, reb_std,
+    ast_avg, ast_std,
+    pra_avg, pra_std, pra_cv_pct
+FROM player_rolling_averages
+WHERE player_name ILIKE '%Trae Young%'    -- ← nome do jogador
+ORDER BY window_size;
+
+
 -- ┌─────────────────────────────────────────────────────────────────┐
 -- │  §12  RECORDES E HIGHS/LOWS — ANÁLISE DE EXTREMOS               │
 -- └─────────────────────────────────────────────────────────────────┘
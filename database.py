@@ -1,6 +1,11 @@
 """
 Modelos do banco de dados PostgreSQL para armazenar os dados do NBA Stats.
 Usa SQLAlchemy ORM com 19+ tabelas — uma por categoria de dados.
+
+Cada categoria guarda o histórico de todas as execuções em uma tabela
+particionada por data de coleta (<slug>_history, uma partição por mês) e
+expõe os dados atuais na view <slug>, usada pela API. A view aponta para
+o scrape_run registrado em category_current (ver history.py).
 """
 
 from datetime import datetime, date
@@ -14,7 +19,10 @@ from sqlalchemy import (
     Date,
     DateTime,
     Boolean,
+    Index,
+    UniqueConstraint,
     create_engine,
+    text,
 )
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -22,6 +30,21 @@ from config import DATABASE_URL
 
 Base = declarative_base()
 
+HISTORY_SUFFIX = "_history"
+
+
+class RunSnapshot:
+    """
+    Colunas de histórico das tabelas de categoria: cada linha pertence a um
+    scrape_run. A tabela é particionada por RANGE (scrape_date), que por
+    isso faz parte da chave primária.
+    """
+
+    scrape_run_id = Column(Integer, nullable=False, index=True)
+    scrape_date = Column(Date, primary_key=True)
+
+    __table_args__ = {"postgresql_partition_by": "RANGE (scrape_date)"}
+
 
 # ══════════════════════════════════════════════════════════════════════
 #  Tabela de controle de execuções do scraper
@@ -37,6 +60,27 @@ class ScrapeRun(Base):
     error_message = Column(Text, nullable=True)
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  Métricas por categoria e estágio de cada execução (ver metrics.py)
+# ══════════════════════════════════════════════════════════════════════
+class ScrapeRunStage(Base):
+    __tablename__ = "scrape_run_stages"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    scrape_run_id = Column(Integer, nullable=False)
+    category_slug = Column(String(100), nullable=False)
+    stage = Column(String(20), nullable=False)  # fetch | parse | load | cold_start | warm_start
+    wall_seconds = Column(Float, nullable=True)
+    bytes = Column(Integer, nullable=True)  # baixados (fetch)
+    lines = Column(Integer, nullable=True)  # linhas do TXT (parse)
+    records = Column(Integer, nullable=True)  # registros parsed
+    rows_written = Column(Integer, nullable=True)  # linhas gravadas (load)
+    peak_rss_mb = Column(Float, nullable=True)  # pico do processo até o fim do estágio
+    recorded_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (Index("ix_scrape_run_stages_run", "scrape_run_id", "stage"),)
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  Dados brutos — armazena o conteúdo TXT original de cada categoria
 # ══════════════════════════════════════════════════════════════════════
@@ -48,15 +92,30 @@ class RawData(Base):
     category_slug = Column(String(100), nullable=False)
     source_url = Column(Text, nullable=True)
     raw_content = Column(Text, nullable=False)
+    content_hash = Column(String(64), nullable=True)  # SHA-256 do raw_content
     scraped_at = Column(DateTime, default=datetime.utcnow)
     scrape_run_id = Column(Integer, nullable=True)
 
+    __table_args__ = (Index("ix_raw_data_slug_run", "category_slug", "scrape_run_id"),)
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Snapshot atual de cada categoria — base das views usadas pela API
+# ══════════════════════════════════════════════════════════════════════
+class CategoryCurrent(Base):
+    __tablename__ = "category_current"
+
+    table_name = Column(String(100), primary_key=True)  # tabela <slug>_history
+    scrape_run_id = Column(Integer, nullable=False)
+    scrape_date = Column(Date, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
 
 # ══════════════════════════════════════════════════════════════════════
 #  1. LATEST BOXSCORE LINES — Estatísticas diárias de jogadores
 # ══════════════════════════════════════════════════════════════════════
-class LatestBoxscoreLines(Base):
-    __tablename__ = "latest_boxscore_lines"
+class LatestBoxscoreLines(RunSnapshot, Base):
+    __tablename__ = "latest_boxscore_lines_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     game_date = Column(Date, nullable=False)
@@ -88,8 +147,8 @@ class LatestBoxscoreLines(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  2. ALPHABETICAL PLAYER CUMULATIVES — Acumulados por jogador
 # ══════════════════════════════════════════════════════════════════════
-class AlphabeticalPlayerCumulatives(Base):
-    __tablename__ = "alphabetical_player_cumulatives"
+class AlphabeticalPlayerCumulatives(RunSnapshot, Base):
+    __tablename__ = "alphabetical_player_cumulatives_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     player_name = Column(String(100), nullable=False)
@@ -119,8 +178,8 @@ class AlphabeticalPlayerCumulatives(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  3. ALPHABETICAL ROOKIE CUMULATIVES
 # ══════════════════════════════════════════════════════════════════════
-class AlphabeticalRookieCumulatives(Base):
-    __tablename__ = "alphabetical_rookie_cumulatives"
+class AlphabeticalRookieCumulatives(RunSnapshot, Base):
+    __tablename__ = "alphabetical_rookie_cumulatives_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     player_name = Column(String(100), nullable=False)
@@ -150,8 +209,8 @@ class AlphabeticalRookieCumulatives(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  4. ATTENDANCE
 # ══════════════════════════════════════════════════════════════════════
-class Attendance(Base):
-    __tablename__ = "attendance"
+class Attendance(RunSnapshot, Base):
+    __tablename__ = "attendance_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     team = Column(String(50), nullable=True)
@@ -171,8 +230,8 @@ class Attendance(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  5. LATEST SCORES AND LEADERS
 # ══════════════════════════════════════════════════════════════════════
-class LatestScoresAndLeaders(Base):
-    __tablename__ = "latest_scores_and_leaders"
+class LatestScoresAndLeaders(RunSnapshot, Base):
+    __tablename__ = "latest_scores_and_leaders_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     game_date = Column(Date, nullable=True)
@@ -190,8 +249,8 @@ class LatestScoresAndLeaders(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  6. SINGLE-GAME HIGHS/LOWS
 # ══════════════════════════════════════════════════════════════════════
-class SingleGameHighsLows(Base):
-    __tablename__ = "single_game_highs_lows"
+class SingleGameHighsLows(RunSnapshot, Base):
+    __tablename__ = "single_game_highs_lows_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     category = Column(String(100), nullable=True)
@@ -208,8 +267,8 @@ class SingleGameHighsLows(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  7. TOP 10 LEAGUE LEADERS
 # ══════════════════════════════════════════════════════════════════════
-class Top10LeagueLeaders(Base):
-    __tablename__ = "top_10_league_leaders"
+class Top10LeagueLeaders(RunSnapshot, Base):
+    __tablename__ = "top_10_league_leaders_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     stat_category = Column(String(100), nullable=True)
@@ -224,8 +283,8 @@ class Top10LeagueLeaders(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  8. TOP 20 LEAGUE LEADERS
 # ══════════════════════════════════════════════════════════════════════
-class Top20LeagueLeaders(Base):
-    __tablename__ = "top_20_league_leaders"
+class Top20LeagueLeaders(RunSnapshot, Base):
+    __tablename__ = "top_20_league_leaders_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     stat_category = Column(String(100), nullable=True)
@@ -240,8 +299,8 @@ class Top20LeagueLeaders(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  9. ROOKIE LEAGUE LEADERS
 # ══════════════════════════════════════════════════════════════════════
-class RookieLeagueLeaders(Base):
-    __tablename__ = "rookie_league_leaders"
+class RookieLeagueLeaders(RunSnapshot, Base):
+    __tablename__ = "rookie_league_leaders_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     stat_category = Column(String(100), nullable=True)
@@ -256,8 +315,8 @@ class RookieLeagueLeaders(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  10. RATIOS - PLAYERS
 # ══════════════════════════════════════════════════════════════════════
-class RatiosPlayers(Base):
-    __tablename__ = "ratios_players"
+class RatiosPlayers(RunSnapshot, Base):
+    __tablename__ = "ratios_players_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     player_name = Column(String(100), nullable=True)
@@ -280,8 +339,8 @@ class RatiosPlayers(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  11. RATIOS - TEAMS
 # ══════════════════════════════════════════════════════════════════════
-class RatiosTeams(Base):
-    __tablename__ = "ratios_teams"
+class RatiosTeams(RunSnapshot, Base):
+    __tablename__ = "ratios_teams_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     team = Column(String(50), nullable=True)
@@ -301,8 +360,8 @@ class RatiosTeams(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  12. PLAYOFF SCHEDULE/RESULTS
 # ══════════════════════════════════════════════════════════════════════
-class PlayoffScheduleResults(Base):
-    __tablename__ = "playoff_schedule_results"
+class PlayoffScheduleResults(RunSnapshot, Base):
+    __tablename__ = "playoff_schedule_results_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     round_name = Column(String(100), nullable=True)
@@ -319,8 +378,8 @@ class PlayoffScheduleResults(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  13. STANDINGS
 # ══════════════════════════════════════════════════════════════════════
-class Standings(Base):
-    __tablename__ = "standings"
+class Standings(RunSnapshot, Base):
+    __tablename__ = "standings_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     conference = Column(String(50), nullable=True)
@@ -341,8 +400,8 @@ class Standings(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  14. HEAD-TO-HEAD WIN GRID
 # ══════════════════════════════════════════════════════════════════════
-class HeadToHeadWinGrid(Base):
-    __tablename__ = "head_to_head_win_grid"
+class HeadToHeadWinGrid(RunSnapshot, Base):
+    __tablename__ = "head_to_head_win_grid_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     team = Column(String(50), nullable=True)
@@ -356,8 +415,8 @@ class HeadToHeadWinGrid(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  15. OFFENSIVE/DEFENSIVE
 # ══════════════════════════════════════════════════════════════════════
-class OffensiveDefensive(Base):
-    __tablename__ = "offensive_defensive"
+class OffensiveDefensive(RunSnapshot, Base):
+    __tablename__ = "offensive_defensive_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     team = Column(String(50), nullable=True)
@@ -387,8 +446,8 @@ class OffensiveDefensive(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  16. MISCELLANEOUS
 # ══════════════════════════════════════════════════════════════════════
-class Miscellaneous(Base):
-    __tablename__ = "miscellaneous"
+class Miscellaneous(RunSnapshot, Base):
+    __tablename__ = "miscellaneous_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     stat_category = Column(String(200), nullable=True)
@@ -401,8 +460,8 @@ class Miscellaneous(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  17. OPPONENT POINTS BREAKDOWN
 # ══════════════════════════════════════════════════════════════════════
-class OpponentPointsBreakdown(Base):
-    __tablename__ = "opponent_points_breakdown"
+class OpponentPointsBreakdown(RunSnapshot, Base):
+    __tablename__ = "opponent_points_breakdown_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     team = Column(String(50), nullable=True)
@@ -423,8 +482,8 @@ class OpponentPointsBreakdown(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  18. TEAM BOXSCORE LINES (aba TEAM)
 # ══════════════════════════════════════════════════════════════════════
-class TeamBoxscoreLines(Base):
-    __tablename__ = "team_boxscore_lines"
+class TeamBoxscoreLines(RunSnapshot, Base):
+    __tablename__ = "team_boxscore_lines_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     game_date = Column(Date, nullable=True)
@@ -455,8 +514,8 @@ class TeamBoxscoreLines(Base):
 # ══════════════════════════════════════════════════════════════════════
 #  19. TEAM CUMULATIVES (aba TEAM)
 # ══════════════════════════════════════════════════════════════════════
-class TeamCumulatives(Base):
-    __tablename__ = "team_cumulatives"
+class TeamCumulatives(RunSnapshot, Base):
+    __tablename__ = "team_cumulatives_history"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     team = Column(String(50), nullable=True)
@@ -482,8 +541,75 @@ class TeamCumulatives(Base):
     scraped_at = Column(DateTime, default=datetime.utcnow)
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  GAME LOG DA TEMPORADA — acumulado a partir do Latest Boxscore Lines
+#  Append-only: uma linha por (game_date, team, player_name), gravada pelo
+#  primeiro run que viu o jogo (ver game_log.py)
+# ══════════════════════════════════════════════════════════════════════
+class PlayerGameLog(Base):
+    __tablename__ = "player_game_log"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_date = Column(Date, nullable=False)
+    team = Column(String(5), nullable=False)
+    opponent = Column(String(5), nullable=False)
+    player_name = Column(String(100), nullable=False)
+    position = Column(String(10), nullable=True)
+    minutes = Column(Integer, nullable=True)
+    fg = Column(Integer, nullable=True)
+    fga = Column(Integer, nullable=True)
+    fg3 = Column(Integer, nullable=True)
+    f3a = Column(Integer, nullable=True)
+    ft = Column(Integer, nullable=True)
+    fta = Column(Integer, nullable=True)
+    off_reb = Column(Integer, nullable=True)
+    def_reb = Column(Integer, nullable=True)
+    total_reb = Column(Integer, nullable=True)
+    assists = Column(Integer, nullable=True)
+    pf = Column(Integer, nullable=True)
+    dq = Column(Integer, nullable=True)
+    steals = Column(Integer, nullable=True)
+    turnovers = Column(Integer, nullable=True)
+    blocks = Column(Integer, nullable=True)
+    points = Column(Integer, nullable=True)
+    scrape_run_id = Column(Integer, nullable=True)  # run que trouxe o jogo
+    scraped_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("game_date", "team", "player_name", name="uq_player_game_log_game"),
+        # "últimos N jogos do jogador X": busca pelo nome + leitura em ordem
+        Index("ix_player_game_log_player_date", "player_name", text("game_date DESC")),
+        Index("ix_player_game_log_team_date", "team", text("game_date DESC")),
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  AGREGADOS MÓVEIS POR JOGADOR — últimos 5/10/20 jogos e temporada
+#  Somas e somas de quadrados mantidas na ingestão (ver rolling.py);
+#  médias e desvios ficam na view player_rolling_averages
+# ══════════════════════════════════════════════════════════════════════
+class PlayerRollingStats(Base):
+    __tablename__ = "player_rolling_stats"
+
+    player_name = Column(String(100), primary_key=True)
+    window_size = Column(Integer, primary_key=True)  # 5 | 10 | 20 | 0 = temporada
+    team = Column(String(5), nullable=True)  # time do jogo mais recente
+    games = Column(Integer, nullable=False, default=0)
+    last_game_date = Column(Date, nullable=True)
+    pts_sum = Column(Integer, nullable=False, default=0)
+    pts_sq = Column(Integer, nullable=False, default=0)
+    reb_sum = Column(Integer, nullable=False, default=0)
+    reb_sq = Column(Integer, nullable=False, default=0)
+    ast_sum = Column(Integer, nullable=False, default=0)
+    ast_sq = Column(Integer, nullable=False, default=0)
+    pra_sum = Column(Integer, nullable=False, default=0)
+    pra_sq = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  Mapeamento rápido: slug → classe do modelo
+#  (o slug também é o nome da view com os dados atuais)
 # ══════════════════════════════════════════════════════════════════════
 MODEL_MAP = {
     "latest_boxscore_lines": LatestBoxscoreLines,
@@ -511,23 +637,54 @@ MODEL_MAP = {
 # ══════════════════════════════════════════════════════════════════════
 #  Engine e Session
 # ══════════════════════════════════════════════════════════════════════
-engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine)
+# Criados no primeiro uso: importar os modelos não abre conexão nem
+# carrega o driver (comandos que não usam o banco iniciam mais rápido)
+_engine = None
+_session_factory = None
+
+
+def get_engine():
+    """Engine do PostgreSQL (criado na primeira chamada)."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
+    return _engine
+
+
+def __getattr__(name):
+    # Compatibilidade: `from database import engine` continua funcionando
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db(drop_existing: bool = False):
-    """Cria todas as tabelas no banco de dados.
+    """Aplica as migrations pendentes (ver migrations/).
 
     Args:
-        drop_existing: Se True, remove e recria todas as tabelas.
+        drop_existing: Se True, remove todas as tabelas (e o schema_version)
+            antes de migrar — apenas para desenvolvimento.
     """
+    from migrations import apply_pending
+
+    engine = get_engine()
     if drop_existing:
         Base.metadata.drop_all(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS schema_version"))
         print("[DB] Tabelas existentes removidas")
-    Base.metadata.create_all(engine)
+    apply_pending(engine)
     print(f"[DB] Tabelas criadas/verificadas com sucesso em {DATABASE_URL}")
 
 
+def current_view_name(model_class) -> str:
+    """Nome da view de dados atuais de uma tabela de histórico."""
+    return model_class.__tablename__.removesuffix(HISTORY_SUFFIX)
+
+
 def get_session():
     """Retorna uma nova sessão do banco."""
-    return SessionLocal()
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=get_engine())
+    return _session_factory()
@@ -0,0 +1,196 @@
+"""
+Download concorrente das categorias do CDN.
+
+Recebe a lista de categorias ({"category", "slug", "url"}) e uma função de
+download (url → texto) e baixa tudo em um pool de threads, respeitando:
+  - limite de conexões simultâneas por host
+  - limite global de requisições por segundo
+  - prazo máximo (deadline) para a execução inteira
+
+Os resultados voltam na mesma ordem e no mesmo formato de scrape_all():
+    [{"category": "...", "slug": "...", "url": "...", "content": "...",
+      "status": "ok" | "unchanged" | "error", "fetch_seconds": 0.42}]
+
+"unchanged" indica que o CDN respondeu 304 (ver http_cache.py); nesse caso
+content é None e a categoria não precisa ser recarregada.
+
+Com `on_result`, cada resultado também é entregue assim que o download
+termina (na ordem de conclusão), para o parse/carga começar sem esperar
+as demais categorias (ver pipeline.run_pipelined).
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from config import FETCH_WORKERS, FETCH_PER_HOST, FETCH_RATE_LIMIT, FETCH_DEADLINE
+from http_cache import NOT_MODIFIED
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket simples e thread-safe (requisições por segundo)."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Bloqueia até haver um token. Retorna False se o deadline passar."""
+        if self.rate <= 0:
+            return True
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait_for = (1 - self.tokens) / self.rate
+
+            if deadline is not None and time.monotonic() + wait_for > deadline:
+                return False
+            time.sleep(wait_for)
+
+
+class ConcurrentDownloader:
+    """Baixa várias URLs em paralelo com limite por host, rate limit e deadline."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], object],
+        workers: int = FETCH_WORKERS,
+        per_host: int = FETCH_PER_HOST,
+        rate_limit: float = FETCH_RATE_LIMIT,
+        deadline: float = FETCH_DEADLINE,
+    ):
+        self.fetch = fetch
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.deadline_seconds = deadline
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+        # Tempo de cada requisição (sem as esperas por conexão/rate limit)
+        self.fetch_seconds: dict[str, float] = {}
+
+    def _slot_for(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _download_one(self, item: dict, deadline: float):
+        url = item["url"]
+        slot = self._slot_for(url)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not slot.acquire(timeout=remaining):
+            logger.warning(f"[FETCH] Deadline atingido esperando conexão: {url}")
+            return None
+
+        try:
+            if not self.rate_limiter.acquire(deadline):
+                logger.warning(f"[FETCH] Deadline atingido no rate limit: {url}")
+                return None
+            start = time.perf_counter()
+            try:
+                return self.fetch(url)
+            finally:
+                self.fetch_seconds[url] = time.perf_counter() - start
+        finally:
+            slot.release()
+
+    def _result(self, item: dict, content) -> dict:
+        if content is NOT_MODIFIED:
+            content, status = None, "unchanged"
+        else:
+            status = "ok" if content else "error"
+        return {
+            "category": item["category"].upper(),
+            "slug": item["slug"],
+            "url": item["url"],
+            "content": content,
+            "status": status,
+            "fetch_seconds": self.fetch_seconds.get(item["url"]),
+        }
+
+    def download_all(
+        self, items: list[dict], on_result: Optional[Callable[[dict], None]] = None
+    ) -> list[dict]:
+        """
+        Baixa todas as categorias e devolve os resultados na ordem de entrada.
+        Categorias não concluídas até o deadline voltam com content=None.
+        `on_result` recebe cada resultado assim que fica pronto (os que
+        estouraram o deadline são entregues no fim). Se o callback
+        bloquear, os downloads já iniciados continuam; o deadline vale só
+        para os downloads.
+        """
+        started = time.monotonic()
+        deadline = started + self.deadline_seconds
+        results: list = [None] * len(items)
+
+        def deliver(i: int, content):
+            results[i] = self._result(items[i], content)
+            if on_result:
+                on_result(results[i])
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="fetch"
+        )
+        try:
+            futures = {
+                pool.submit(self._download_one, item, deadline): i
+                for i, item in enumerate(items)
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                for future in done:
+                    i = futures[future]
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        logger.error(f"[FETCH] Erro ao baixar {items[i]['url']}: {e}")
+                        content = None
+                    deliver(i, content)
+
+            for future in pending:
+                logger.warning(
+                    f"[FETCH] Deadline de {self.deadline_seconds:g}s excedido: "
+                    f"{items[futures[future]]['url']}"
+                )
+            for i, result in enumerate(results):
+                if result is None:
+                    deliver(i, None)
+        finally:
+            # Não espera downloads que estouraram o deadline
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        ok = sum(1 for r in results if r["status"] == "ok")
+        unchanged = sum(1 for r in results if r["status"] == "unchanged")
+        logger.info(
+            f"[FETCH] {ok}/{len(results)} categorias baixadas "
+            f"({unchanged} inalteradas) em "
+            f"{time.monotonic() - started:.2f}s "
+            f"(workers={self.workers}, por host={self.per_host})"
+        )
+        return results
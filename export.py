@@ -0,0 +1,63 @@
+"""
+Exportação dos dados atuais para CSV ou JSON Lines.
+
+Exporta a view de uma categoria (<slug>, o snapshot publicado) ou uma das
+tabelas derivadas (player_game_log, player_rolling_stats,
+player_rolling_averages):
+  - csv    COPY (SELECT ...) TO STDOUT direto do PostgreSQL (psycopg2),
+           sem passar as linhas pelo Python
+  - jsonl  cursor no servidor (stream_results), em lotes: a memória não
+           cresce com o tamanho da tabela
+"""
+
+import json
+import logging
+from typing import TextIO
+
+from sqlalchemy import text
+
+from database import MODEL_MAP, current_view_name, get_engine
+
+logger = logging.getLogger(__name__)
+
+DERIVED = ("player_game_log", "player_rolling_stats", "player_rolling_averages")
+FORMATS = ("csv", "jsonl")
+
+
+def exportable() -> list[str]:
+    """Nomes aceitos por export(): views das categorias + tabelas derivadas."""
+    return [current_view_name(model) for model in MODEL_MAP.values()] + list(DERIVED)
+
+
+def export(name: str, out: TextIO, fmt: str = "csv", batch_size: int = 5000) -> int:
+    """Grava `name` em `out`; retorna o nº de linhas exportadas."""
+    if name not in exportable():
+        raise ValueError(f"Não exportável: {name} (opções: {', '.join(exportable())})")
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato desconhecido: {fmt} (opções: {', '.join(FORMATS)})")
+
+    # `name` vem da lista acima: seguro para compor o SQL
+    query = f"SELECT * FROM {name}"
+    engine = get_engine()
+
+    if fmt == "csv":
+        raw = engine.raw_connection()
+        try:
+            with raw.cursor() as cur:
+                cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", out)
+                rows = cur.rowcount
+        finally:
+            raw.close()
+    else:
+        rows = 0
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+                text(query)
+            )
+            for row in result.mappings():
+                out.write(json.dumps(dict(row), default=str, ensure_ascii=False))
+                out.write("\n")
+                rows += 1
+
+    logger.info(f"[EXPORT] {rows} linhas de '{name}' ({fmt})")
+    return rows
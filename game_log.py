@@ -0,0 +1,98 @@
+"""
+Game log da temporada (player_game_log), acumulado entre execuções.
+
+O all_players_day.txt (Latest Boxscore Lines) só traz o último dia de
+jogos. A cada carga dessa categoria as linhas gravadas no histórico também
+são acrescentadas em player_game_log, deduplicadas por
+(game_date, team, player_name): um jogo já registrado não é regravado.
+
+Com isso a análise de props (hit rate, desvio padrão, últimos N jogos)
+usa a temporada inteira sem reler o TXT bruto de execuções anteriores.
+"""
+
+import logging
+from datetime import date
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# Categoria de origem do game log
+SOURCE_SLUG = "latest_boxscore_lines"
+
+
+def _game_log_columns() -> list[str]:
+    from database import PlayerGameLog
+
+    return [
+        col.name for col in PlayerGameLog.__table__.columns
+        if col.name not in ("id", "scraped_at")
+    ]
+
+
+def _insert_from_history(bind, where: str = "", params: dict | None = None, returning: bool = False):
+    """
+    INSERT ... SELECT do histórico do boxscore para o game log, uma linha
+    por jogo (a última carregada vence) e ON CONFLICT DO NOTHING.
+    """
+    from database import MODEL_MAP
+
+    history = MODEL_MAP[SOURCE_SLUG].__tablename__
+    game_columns = _game_log_columns()
+    columns = ", ".join(f'"{c}"' for c in game_columns + ["scraped_at"])
+    sql = (
+        f"INSERT INTO player_game_log ({columns}) "
+        f"SELECT DISTINCT ON (game_date, team, player_name) {columns} "
+        f'FROM "{history}" {where} '
+        f"ORDER BY game_date, team, player_name, scrape_run_id DESC, id DESC "
+        f"ON CONFLICT ON CONSTRAINT uq_player_game_log_game DO NOTHING"
+    )
+    if returning:
+        sql += " RETURNING " + ", ".join(f'"{c}"' for c in game_columns)
+    return bind.execute(text(sql), params or {})
+
+
+def append_game_log(bind, run_id: int, day: date) -> list[dict]:
+    """
+    Acrescenta no game log os boxscores que o run acabou de carregar no
+    histórico (partição de `day`). Roda no banco, sem reler os registros
+    parsed (que chegam ao loader como gerador, consumidos uma vez). Usa a
+    conexão/transação de quem chamou. Retorna só os jogos novos (base
+    para os agregados móveis em rolling.py).
+    """
+    result = _insert_from_history(
+        bind,
+        "WHERE scrape_date = :day AND scrape_run_id = :run_id",
+        {"day": day, "run_id": run_id},
+        returning=True,
+    )
+    new_games = [dict(r) for r in result.mappings()]
+    logger.info(f"[GAMELOG] {len(new_games)} jogos novos (run #{run_id})")
+    return new_games
+
+
+def backfill_from_history(conn) -> int:
+    """Preenche o game log com os boxscores já guardados no histórico."""
+    return _insert_from_history(conn).rowcount
+
+
+def replace_game_dates(bind, game_dates) -> set[str]:
+    """
+    Refaz o game log dos dias informados a partir do histórico, depois que
+    um backfill regravou os boxscores (ver reparse.backfill): as linhas
+    desses dias são apagadas e inseridas de novo pelo run mais recente de
+    cada jogo. Usa a conexão/transação de quem chamou. Retorna os
+    jogadores afetados (antes e depois), base para rolling.rebuild_rolling.
+    """
+    dates = sorted(set(game_dates))
+    if not dates:
+        return set()
+    params = {"dates": dates}
+    players = set(bind.execute(
+        text("DELETE FROM player_game_log WHERE game_date = ANY(:dates) RETURNING player_name"),
+        params,
+    ).scalars())
+    result = _insert_from_history(bind, "WHERE game_date = ANY(:dates)", params, returning=True)
+    players.update(r["player_name"] for r in result.mappings())
+    logger.info(f"[GAMELOG] {len(dates)} dias refeitos a partir do histórico")
+    return players
@@ -0,0 +1,191 @@
+"""
+Histórico das categorias: partições por data de coleta e snapshot atual.
+
+Cada tabela <slug>_history é particionada por RANGE (scrape_date), com uma
+partição por mês (<slug>_history_yYYYYmMM). Uma execução:
+  1. garante a partição do mês da coleta (ensure_partition)
+  2. acrescenta as linhas com scrape_run_id/scrape_date
+  3. publica o run em category_current (publish), na mesma transação
+
+A view <slug> mostra só as linhas do run publicado; como a publicação é um
+UPSERT no commit, a API passa do snapshot anterior para o novo de uma vez,
+sem tabela vazia e sem locks exclusivos. Um run com scrape_date anterior
+ao do publicado (ex.: ingest de um arquivo antigo) entra no histórico mas
+não move o ponteiro: a API não volta para dados velhos.
+
+Consultas "point-in-time" filtram scrape_date (e scrape_run_id) na tabela
+de histórico e só leem uma partição. Partições antigas podem ser
+desanexadas (e opcionalmente removidas) com:
+    python -m history detach --before 2025-10-01 [--drop]
+"""
+
+import argparse
+import logging
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+# ── Partições ──────────────────────────────────────────────────────
+def month_bounds(day: date) -> tuple[date, date]:
+    """Primeiro dia do mês e primeiro dia do mês seguinte."""
+    start = day.replace(day=1)
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+    return start, start.replace(month=start.month + 1)
+
+
+def partition_name(table_name: str, day: date) -> str:
+    return f"{table_name}_y{day.year:04d}m{day.month:02d}"
+
+
+def ensure_partition(bind, table_name: str, day: date) -> str:
+    """Cria (se preciso) a partição do mês de `day`. Aceita Engine ou Connection."""
+    start, end = month_bounds(day)
+    name = partition_name(table_name, day)
+    sql = text(
+        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table_name}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            conn.execute(sql)
+    else:
+        bind.execute(sql)
+    return name
+
+
+def list_partitions(conn, table_name: str) -> list[tuple[str, date]]:
+    """Partições (nome, início do mês) de uma tabela de histórico."""
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :t ORDER BY c.relname"
+        ),
+        {"t": table_name},
+    ).scalars().all()
+
+    partitions = []
+    prefix = f"{table_name}_y"
+    for name in rows:
+        suffix = name[len(prefix):] if name.startswith(prefix) else ""
+        try:
+            partitions.append((name, datetime.strptime(suffix, "%Ym%m").date()))
+        except ValueError:
+            continue
+    return partitions
+
+
+# ── Snapshot atual ─────────────────────────────────────────────────
+def create_current_view(conn, table_name: str, view_name: str):
+    """(Re)cria a view com as linhas do run publicado em category_current."""
+    conn.execute(text(
+        f'CREATE OR REPLACE VIEW "{view_name}" AS '
+        f'SELECT * FROM "{table_name}" '
+        f"WHERE scrape_date = (SELECT scrape_date FROM category_current WHERE table_name = '{table_name}') "
+        f"AND scrape_run_id = (SELECT scrape_run_id FROM category_current WHERE table_name = '{table_name}')"
+    ))
+
+
+def publish(session, table_names: Iterable[str], run_id: int, day: date) -> int:
+    """
+    Aponta category_current para o run informado (efetiva no commit), só
+    nas categorias cujo snapshot publicado não é de uma data mais recente.
+    Retorna quantas categorias foram publicadas.
+    """
+    from database import CategoryCurrent
+
+    rows = [
+        {
+            "table_name": name,
+            "scrape_run_id": run_id,
+            "scrape_date": day,
+            "updated_at": datetime.utcnow(),
+        }
+        for name in table_names
+    ]
+    if not rows:
+        return 0
+
+    table = CategoryCurrent.__table__
+    stmt = pg_insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["table_name"],
+        set_={
+            "scrape_run_id": stmt.excluded.scrape_run_id,
+            "scrape_date": stmt.excluded.scrape_date,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=table.c.scrape_date <= stmt.excluded.scrape_date,
+    )
+    published = session.execute(stmt).rowcount
+    logger.info(f"[HISTORY] Run #{run_id} publicado em {published} categorias")
+    if published < len(rows):
+        logger.info(
+            f"[HISTORY] {len(rows) - published} categorias mantêm um snapshot "
+            f"mais recente que {day} (run #{run_id} só no histórico)"
+        )
+    return published
+
+
+# ── Manutenção ─────────────────────────────────────────────────────
+def detach_before(engine, cutoff: date, drop: bool = False) -> list[str]:
+    """
+    Desanexa as partições com mês inteiro anterior a `cutoff`. As tabelas
+    desanexadas ficam disponíveis para pg_dump/arquivamento; com drop=True
+    são removidas. Partições do run publicado nunca são desanexadas.
+    """
+    from database import MODEL_MAP
+
+    detached = []
+    with engine.begin() as conn:
+        current = dict(conn.execute(
+            text("SELECT table_name, scrape_date FROM category_current")
+        ).all())
+
+        for model_class in MODEL_MAP.values():
+            table_name = model_class.__tablename__
+            current_month = current.get(table_name)
+            for name, start in list_partitions(conn, table_name):
+                if month_bounds(start)[1] > cutoff:
+                    continue
+                if current_month and month_bounds(current_month)[0] == start:
+                    continue
+                conn.execute(text(f'ALTER TABLE "{table_name}" DETACH PARTITION "{name}"'))
+                if drop:
+                    conn.execute(text(f'DROP TABLE "{name}"'))
+                detached.append(name)
+
+    action = "removidas" if drop else "desanexadas"
+    logger.info(f"[HISTORY] {len(detached)} partições {action} (antes de {cutoff})")
+    return detached
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Manutenção do histórico particionado")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    detach = sub.add_parser("detach", help="Desanexa partições antigas")
+    detach.add_argument("--before", required=True, help="Data de corte (YYYY-MM-DD)")
+    detach.add_argument("--drop", action="store_true", help="Remove as partições desanexadas")
+
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s │ %(levelname)-8s │ %(message)s")
+
+    from database import engine
+
+    if args.command == "detach":
+        cutoff = datetime.strptime(args.before, "%Y-%m-%d").date()
+        for name in detach_before(engine, cutoff, drop=args.drop):
+            print(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Cache persistente de validadores HTTP (ETag / Last-Modified) por URL.
+
+A maioria dos TXT do CDN muda no máximo uma vez por dia. Guardando o ETag,
+o Last-Modified e o hash do conteúdo de cada URL, as próximas execuções
+enviam If-None-Match / If-Modified-Since e, quando o CDN responde 304,
+a categoria é marcada como "unchanged" — sem download, parse ou escrita
+no banco.
+
+Os validadores de um download só são gravados em disco (commit) depois que
+o conteúdo foi publicado no banco (ver pipeline.save_to_database, parâmetro
+`published`); os de uma categoria cujo parse ou carga falhou são
+descartados, e assim um 304 nunca esconde um dado que não chegou a ser
+carregado.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+
+from config import HTTP_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+
+class NotModified:
+    """Sentinela retornada pelo download quando o CDN responde 304."""
+
+    def __repr__(self):
+        return "NOT_MODIFIED"
+
+
+NOT_MODIFIED = NotModified()
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 (hex) do conteúdo TXT."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ValidatorCache:
+    """Validadores HTTP por URL, persistidos em JSON."""
+
+    def __init__(self, path: str = HTTP_CACHE_FILE):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.pending: dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Carrega o cache do disco (arquivo ausente ou corrompido = cache vazio)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"[CACHE] Cache de validadores ignorado ({self.path}): {e}")
+            self.entries = {}
+
+    def save(self):
+        """Grava o cache de forma atômica (arquivo temporário + rename)."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self.lock:
+            data = json.dumps(self.entries, indent=2, sort_keys=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def conditional_headers(self, url: str) -> dict:
+        """Headers If-None-Match / If-Modified-Since para a URL, se houver."""
+        with self.lock:
+            entry = self.entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, response_headers, content: str):
+        """Registra (pendente) os validadores de um download 200."""
+        entry = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "content_hash": content_hash(content),
+            "updated_at": datetime.utcnow().isoformat(timespec="seconds"),
+        }
+        with self.lock:
+            self.pending[url] = entry
+
+    def retain(self, urls):
+        """Descarta validadores de URLs que não estão mais no banco."""
+        urls = set(urls)
+        with self.lock:
+            dropped = [u for u in self.entries if u not in urls]
+            for u in dropped:
+                del self.entries[u]
+        if dropped:
+            logger.info(f"[CACHE] {len(dropped)} validadores descartados (sem dados no banco)")
+
+    def commit(self, urls=None):
+        """
+        Efetiva os validadores pendentes e grava o cache em disco. Com
+        `urls`, só os dessas URLs (categorias publicadas); os demais
+        pendentes são descartados.
+        """
+        with self.lock:
+            pending = self.pending
+            if urls is not None:
+                urls = set(urls)
+                pending = {u: entry for u, entry in pending.items() if u in urls}
+            dropped = len(self.pending) - len(pending)
+            self.entries.update(pending)
+            self.pending = {}
+        self.save()
+        logger.info(f"[CACHE] {len(pending)} validadores atualizados em {self.path}")
+        if dropped:
+            logger.info(f"[CACHE] {dropped} validadores descartados (categoria não publicada)")
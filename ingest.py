@@ -0,0 +1,186 @@
+"""
+Ingestão offline — carrega TXT já baixados, sem navegador.
+
+Aceita diretórios, arquivos .txt soltos e pacotes .zip / .tar(.gz). Cada
+argumento vira uma execução (scrape_run) com parse + carga pelo mesmo
+caminho do main.py (pipeline.save_to_database). O nome de cada arquivo
+define a categoria:
+  - <slug>.txt, como grava o scraper em DOWNLOAD_DIR
+  - o nome do arquivo no CDN (stand.txt, all_players_day.txt, ...)
+Arquivos com outros nomes são ignorados.
+
+A data da execução (scrape_date, partição do histórico) vem de --date,
+ou de uma data AAAA-MM-DD no caminho (ex.: .../2026-02-11/), ou é a de
+agora. Categorias com snapshot publicado mais recente que essa data não
+são republicadas (ver history.publish): o arquivo antigo fica só no
+histórico. Não importa Selenium nem webdriver_manager; o banco (SQLAlchemy)
+só é carregado quando há algo para gravar, então --dry-run inicia rápido.
+
+Uso:
+    python ingest.py downloads/
+    python ingest.py dia1.zip dia2.tar.gz --date 2026-02-11
+    python ingest.py /tmp/elias/*/*          # um run por diretório
+    python ingest.py downloads/ --dry-run    # só parse, sem banco
+"""
+
+import os
+import re
+import logging
+import argparse
+import tarfile
+import zipfile
+from datetime import datetime
+from typing import Iterator
+
+from config import CATEGORY_URLS
+from parser import STREAM_PARSER_MAP
+from spool import SpooledText, read_text
+
+logger = logging.getLogger(__name__)
+
+# Nome do arquivo no CDN → categoria
+_BY_FILENAME = {os.path.basename(c["url"]): c for c in CATEGORY_URLS}
+_BY_SLUG = {c["slug"]: c for c in CATEGORY_URLS}
+_DATE_IN_PATH = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def category_for(filename: str) -> dict | None:
+    """{"category", "slug", "url"} para o nome do arquivo, ou None."""
+    name = os.path.basename(filename)
+    if name in _BY_FILENAME:
+        return _BY_FILENAME[name]
+    slug, ext = os.path.splitext(name)
+    if ext.lower() != ".txt":
+        return None
+    if slug in _BY_SLUG:
+        return _BY_SLUG[slug]
+    if slug in STREAM_PARSER_MAP:
+        return {"category": slug.replace("_", " ").title(), "slug": slug}
+    return None
+
+
+# ── Leitura ────────────────────────────────────────────────────────
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+def iter_files(path: str) -> Iterator[tuple[str, "str | SpooledText"]]:
+    """
+    (nome, conteúdo) de cada arquivo do diretório / pacote / arquivo.
+    Arquivos soltos voltam como SpooledText, lidos só no parse; membros
+    de pacotes são lidos na hora.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            full = os.path.join(path, name)
+            if os.path.isfile(full):
+                yield name, SpooledText(full)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                if not info.is_dir():
+                    yield info.filename, _decode(archive.read(info))
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path) as archive:
+            for member in sorted(archive.getmembers(), key=lambda m: m.name):
+                if member.isfile():
+                    yield member.name, _decode(archive.extractfile(member).read())
+    else:
+        yield os.path.basename(path), SpooledText(path)
+
+
+def read_categories(path: str) -> list[dict]:
+    """Itens no formato de scrape_all() para os TXT reconhecidos em `path`."""
+    items, seen = [], set()
+    for name, content in iter_files(path):
+        category = category_for(name)
+        if category is None:
+            logger.info(f"[INGEST] Ignorado (nome desconhecido): {name}")
+            continue
+        if category["slug"] in seen:
+            logger.warning(f"[INGEST] {category['slug']} repetido em {path}: {name} ignorado")
+            continue
+        seen.add(category["slug"])
+        items.append({
+            "category": category["category"].upper(),
+            "slug": category["slug"],
+            "url": f"file://{os.path.abspath(path)}#{name}",
+            "content": content,
+            "status": "ok" if content else "error",
+        })
+    return items
+
+
+def run_date(path: str, date: str | None) -> datetime:
+    if date:
+        return datetime.strptime(date, "%Y-%m-%d")
+    match = _DATE_IN_PATH.findall(os.path.abspath(path))
+    if match:
+        return datetime.strptime(match[-1], "%Y-%m-%d")
+    return datetime.utcnow()
+
+
+# ── Ingestão ───────────────────────────────────────────────────────
+def ingest(path: str, date: str | None = None) -> int:
+    """Carrega os TXT de `path` em um novo run; retorna as categorias salvas."""
+    from metrics import StageMetrics
+    from pipeline import finish_run, save_to_database, start_run
+
+    items = read_categories(path)
+    if not items:
+        logger.warning(f"[INGEST] Nenhum TXT reconhecido em {path}")
+        return 0
+
+    started_at = run_date(path, date)
+    run_id = start_run(started_at)
+    logger.info(
+        f"[INGEST] Execução #{run_id} ({started_at:%Y-%m-%d}): "
+        f"{len(items)} categorias de {path}"
+    )
+    stages = StageMetrics()
+    try:
+        categories_ok = save_to_database(items, run_id, stages=stages)
+    except Exception as e:
+        finish_run(run_id, "error", error=str(e), stages=stages)
+        raise
+    finish_run(run_id, "success", categories_ok, stages=stages)
+    return categories_ok
+
+
+def dry_run(path: str) -> int:
+    """Só o parse: registros por categoria, sem tocar no banco."""
+    items = read_categories(path)
+    for item in items:
+        parse = STREAM_PARSER_MAP.get(item["slug"])
+        count = sum(1 for _ in parse(read_text(item["content"]))) if parse else 0
+        logger.info(f"[INGEST] {item['slug']:<36} {count:>7} registros")
+    return len(items)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("paths", nargs="+", help="diretórios, .txt, .zip ou .tar(.gz)")
+    ap.add_argument("--date", help="data da execução (AAAA-MM-DD) para todos os caminhos")
+    ap.add_argument("--dry-run", action="store_true", help="só faz o parse (sem banco)")
+    args = ap.parse_args()
+
+    from log_setup import setup_logging
+
+    setup_logging(log_file=None)
+
+    if args.dry_run:
+        for path in args.paths:
+            dry_run(path)
+        return
+
+    from database import init_db
+
+    init_db()
+    total = 0
+    for path in args.paths:
+        total += ingest(path, args.date)
+    logger.info(f"[INGEST] Concluído — {len(args.paths)} execuções, {total} categorias salvas")
+
+
+if __name__ == "__main__":
+    main()
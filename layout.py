@@ -0,0 +1,207 @@
+"""
+Layouts declarativos de colunas para os TXT do NBA Elias Stats.
+
+Cada categoria declara suas colunas uma vez (nome + conversor) e as linhas
+são quebradas só com fatias e split/rsplit — sem regex por linha:
+
+  FixedLayout   colunas por posição (fatias contíguas; cada coluna vai do
+                fim da anterior até a posição declarada). Serve para
+                colunas alinhadas à direita cujo conteúdo tem espaços
+                (ex.: recordes "18- 9" do standings).
+  TokenLayout   tokens iniciais + texto livre no meio + tokens finais.
+                O bloco numérico é lido da direita (rsplit), então a
+                largura exata das colunas numéricas não importa.
+  Panels        divide linhas com painéis lado a lado (standings, ratios,
+                leaders) em segmentos, por posições fixas ou pelas
+                posições dos rótulos no header.
+
+Conversores são callables que levantam ValueError para valores inválidos
+(int, float, str.strip, ...): a linha inteira é descartada, como quando a
+regex não casava. parse() devolve um dict ou None; `required` lista campos
+que não podem ficar None (para conversores tolerantes) e `post` recebe o
+dict e pode completá-lo ou rejeitar a linha (retornando None).
+
+Cada layout é compilado uma vez em uma função que monta o dict direto
+(como o namedtuple faz), sem laço por campo em Python. O fonte gerado
+fica no linecache com o nome "<layout N>", então tracebacks e perfis
+mostram a linha real.
+"""
+
+import itertools
+import linecache
+from typing import Callable, Iterable, Iterator, Sequence
+
+Converter = Callable[[str], object]
+Column = tuple[str, Converter]
+
+
+# Numera os fontes gerados ("<layout N>") no linecache
+_serial = itertools.count(1)
+
+
+def _expression(source: int | slice) -> str:
+    if isinstance(source, slice):
+        stop = "" if source.stop is None else source.stop
+        return f"v[{source.start}:{stop}]"
+    return f"v[{source}]"
+
+
+def _compile_builder(names: Sequence[str], converters: Sequence[Converter],
+                     sources: Sequence[int | slice]) -> Callable:
+    """
+    Gera `build(v)` que devolve {nome: conversor(v[origem])} para cada
+    campo; `sources` são índices ou fatias de `v` (ex.: 3 ou slice(20, 22)).
+    """
+    items = ",\n        ".join(
+        f"{name!r}: c{i}({_expression(source)})"
+        for i, (name, source) in enumerate(zip(names, sources))
+    )
+    source = f"def build(v):\n    return {{\n        {items},\n    }}\n"
+    filename = f"<layout {next(_serial)}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace = {f"c{i}": conv for i, conv in enumerate(converters)}
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["build"]
+
+
+class _Layout:
+    """Base: nomes/conversores, obrigatórios e pós-processamento."""
+
+    def __init__(self, names: Sequence[str], converters: Sequence[Converter],
+                 sources: Sequence[int | slice], required: Iterable[str] | None, post):
+        self.names = tuple(names)
+        self.converters = tuple(converters)
+        self.sources = tuple(sources)
+        self.required = tuple(required or ())
+        self.post = post
+        self._builder = _compile_builder(self.names, self.converters, self.sources)
+
+    def _build(self, values) -> dict | None:
+        try:
+            record = self._builder(values)
+        except (ValueError, TypeError, IndexError):
+            return None
+        for name in self.required:
+            if record[name] is None:
+                return None
+        return self.post(record) if self.post else record
+
+    def iter_all(self, lines: Iterable[str]) -> Iterator[dict]:
+        """Aplica o layout linha a linha, descartando as que não casam."""
+        return (record for record in map(self.parse, lines) if record is not None)
+
+
+class FixedLayout(_Layout):
+    """
+    Colunas de largura fixa. `columns` é uma sequência de
+    (nome, fim, conversor): a coluna vai do fim da anterior (ou `start`)
+    até `fim`. A última coluna pode ter fim None (até o final da linha).
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[tuple[str, int | None, Converter]],
+        start: int = 0,
+        required: Iterable[str] | None = None,
+        post=None,
+    ):
+        sources = []
+        begin = start
+        for _, end, _ in columns:
+            sources.append(slice(begin, end))
+            begin = end
+        self.width = begin
+        super().__init__(
+            [name for name, _, _ in columns], [conv for _, _, conv in columns],
+            sources, required, post,
+        )
+
+    def parse(self, line: str) -> dict | None:
+        return self._build(line)
+
+
+class TokenLayout(_Layout):
+    """
+    `lead` tokens no início, `text` (texto livre, pode ter espaços) e
+    `tail` tokens no fim. Sem `text`, a linha deve ter exatamente
+    len(lead) + len(tail) tokens.
+    """
+
+    def __init__(
+        self,
+        lead: Sequence[Column] = (),
+        text: str | None = None,
+        tail: Sequence[Column] = (),
+        required: Iterable[str] | None = None,
+        post=None,
+    ):
+        columns = list(lead) + ([(text, str.strip)] if text else []) + list(tail)
+        super().__init__(
+            [n for n, _ in columns], [c for _, c in columns],
+            range(len(columns)), required, post,
+        )
+        self.n_lead = len(lead)
+        self.n_tail = len(tail)
+        self.has_text = text is not None
+
+    def parse(self, line: str) -> dict | None:
+        n_lead, n_tail = self.n_lead, self.n_tail
+
+        if not self.has_text:
+            tokens = line.split()
+            if len(tokens) != n_lead + n_tail:
+                return None
+            return self._build(tokens)
+
+        tokens = line.split(None, n_lead) if n_lead else [line]
+        if len(tokens) <= n_lead:
+            return None
+        if n_tail:
+            parts = tokens.pop().rsplit(None, n_tail)
+            if len(parts) <= n_tail:
+                return None
+            tokens += parts
+        return self._build(tokens)
+
+
+class Panels:
+    """Painéis lado a lado: cada linha vira um segmento por painel."""
+
+    def __init__(self, offsets: Sequence[int], labels: Sequence[str] | None = None):
+        self.offsets = tuple(offsets)
+        self.labels = tuple(labels) if labels is not None else (None,) * len(self.offsets)
+        self._bounds = list(zip(self.labels, self.offsets, self.offsets[1:] + (None,)))
+
+    @classmethod
+    def from_header(cls, header: str, labels: Sequence[str]) -> "Panels | None":
+        """
+        Painéis a partir das posições dos rótulos no header (em ordem de
+        coluna). Cada ocorrência de um rótulo abre um painel; um rótulo
+        contido em outro mais longo (ex.: "FIELD GOAL PCT." dentro de
+        "3-PT FIELD GOAL PCT.") é ignorado.
+        """
+        found = []
+        for label in labels:
+            pos = header.find(label)
+            while pos >= 0:
+                found.append((pos, label))
+                pos = header.find(label, pos + len(label))
+        found.sort(key=lambda item: (item[0], -len(item[1])))
+
+        offsets, names, end = [], [], -1
+        for pos, label in found:
+            if pos < end:
+                continue
+            offsets.append(pos)
+            names.append(label)
+            end = pos + len(label)
+        return cls(offsets, names) if offsets else None
+
+    def split(self, line: str) -> list[tuple[str | None, str]]:
+        """(rótulo, segmento) de cada painel não vazio da linha."""
+        segments = []
+        for label, begin, end in self._bounds:
+            segment = line[begin:end]
+            if segment and not segment.isspace():
+                segments.append((label, segment))
+        return segments
@@ -0,0 +1,184 @@
+"""
+Carga em massa dos registros parsed no PostgreSQL.
+
+Substitui o caminho ORM (um objeto + session.add por registro) por:
+  1. COPY ... FROM STDIN via psycopg2 (padrão) — os registros são
+     convertidos em linhas no formato texto do COPY sob demanda, sem
+     montar o arquivo inteiro em memória
+  2. Fallback: INSERT do SQLAlchemy Core em executemany, quando o driver
+     não suporta COPY (ou LOAD_METHOD=insert), em lotes de LOAD_BATCH_SIZE
+
+Os registros podem vir de um gerador (parser.STREAM_PARSER_MAP): são
+consumidos uma vez, sob demanda, e o pico de memória acompanha o lote, não
+o tamanho do arquivo.
+
+bulk_insert() usa a mesma conexão/transação da Session (ou Connection)
+recebida; os dados só ficam visíveis no commit de quem chamou.
+"""
+
+import io
+import itertools
+import logging
+from datetime import date, datetime
+from typing import Iterable, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from config import LOAD_BATCH_SIZE, LOAD_METHOD
+
+logger = logging.getLogger(__name__)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+# ── Utilitários ────────────────────────────────────────────────────
+def _column_defaults(table) -> dict:
+    """Valores default (lado Python) das colunas, ex.: scraped_at=utcnow()."""
+    defaults = {}
+    for col in table.columns:
+        if col.default is None or col.primary_key:
+            continue
+        if col.default.is_scalar:
+            defaults[col.name] = col.default.arg
+        elif col.default.is_callable:
+            defaults[col.name] = col.default.arg(None)
+    return defaults
+
+
+def _insert_columns(table) -> list[str]:
+    """Colunas carregadas pelo loader (todas exceto o id autoincrement)."""
+    return [col.name for col in table.columns if col.name != "id"]
+
+
+def _copy_value(value) -> str:
+    """Formata um valor Python para o formato texto do COPY."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class _CopyStream(io.TextIOBase):
+    """Arquivo somente-leitura que gera as linhas do COPY sob demanda."""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = ""
+
+    def readable(self):
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._lines)
+            except StopIteration:
+                break
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def batched(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """Lotes de até `size` registros, consumindo o iterável sob demanda."""
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, max(size, 1))):
+        yield batch
+
+
+def _connection(bind):
+    """Aceita Session ou Connection e devolve a Connection em uso."""
+    return bind.connection() if isinstance(bind, Session) else bind
+
+
+def _supports_copy(bind) -> bool:
+    return _connection(bind).dialect.driver == "psycopg2"
+
+
+# ── Métodos de carga ───────────────────────────────────────────────
+def copy_records(bind, model_class, records: Iterable[dict], extra: dict | None = None) -> int:
+    """Carrega os registros com COPY FROM STDIN (psycopg2). Retorna o total."""
+    table = model_class.__table__
+    columns = _insert_columns(table)
+    defaults = _column_defaults(table) | (extra or {})
+    count = 0
+
+    def lines():
+        nonlocal count
+        for record in records:
+            row = defaults | record
+            count += 1
+            yield "\t".join(_copy_value(row.get(c)) for c in columns) + "\n"
+
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    sql = f'COPY "{table.name}" ({column_list}) FROM STDIN'
+
+    dbapi_conn = _connection(bind).connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(sql, _CopyStream(lines()))
+    return count
+
+
+def insert_records(
+    bind,
+    model_class,
+    records: Iterable[dict],
+    extra: dict | None = None,
+    batch_size: int = LOAD_BATCH_SIZE,
+) -> int:
+    """Carrega os registros com INSERT do SQLAlchemy Core (executemany por lote)."""
+    table = model_class.__table__
+    defaults = _column_defaults(table) | (extra or {})
+    stmt = insert(table)
+    count = 0
+    for batch in batched(records, batch_size):
+        bind.execute(stmt, [defaults | record for record in batch])
+        count += len(batch)
+    return count
+
+
+def orm_records(
+    session,
+    model_class,
+    records: Iterable[dict],
+    extra: dict | None = None,
+    batch_size: int = LOAD_BATCH_SIZE,
+) -> int:
+    """Caminho antigo: um objeto ORM por registro (usado para comparação)."""
+    extra = extra or {}
+    count = 0
+    for batch in batched(records, batch_size):
+        session.add_all([model_class(**(extra | record)) for record in batch])
+        # flush por lote: os objetos já gravados podem ser liberados
+        session.flush()
+        count += len(batch)
+    return count
+
+
+def bulk_insert(
+    bind,
+    model_class,
+    records: Iterable[dict],
+    method: str = LOAD_METHOD,
+    extra: dict | None = None,
+) -> int:
+    """
+    Carrega os registros na tabela do modelo usando o método configurado
+    (copy | insert | orm). `extra` define colunas comuns a todas as linhas
+    (ex.: scrape_run_id e scrape_date). COPY só é usado com o driver
+    psycopg2; nos outros casos cai para o INSERT do Core. `records` pode
+    ser um gerador e é consumido uma única vez.
+    """
+    if method == "orm" and isinstance(bind, Session):
+        return orm_records(bind, model_class, records, extra)
+    if method == "copy" and _supports_copy(bind):
+        return copy_records(bind, model_class, records, extra)
+    return insert_records(bind, model_class, records, extra)
@@ -0,0 +1,88 @@
+"""
+Configuração do logging: fila + thread de escrita, nível por subsistema.
+
+Os loggers só colocam o registro em uma fila (QueueHandler); a formatação
+final e a escrita no terminal e em LOG_FILE acontecem na thread do
+QueueListener, fora do download, do parse e da carga. O nível geral vem
+de LOG_LEVEL e cada subsistema (nome do módulo) pode ter o seu em
+LOG_LEVELS, ex.: "parser=WARNING,downloader=DEBUG,pipeline=INFO".
+Mensagens abaixo do nível são descartadas antes de qualquer formatação —
+por isso os caminhos quentes usam o estilo %, ex.:
+    logger.debug("[PARSER] %s: %d registros", name, count)
+"""
+
+import sys
+import atexit
+import logging
+import logging.handlers
+import queue
+
+from config import LOG_FILE, LOG_LEVEL, LOG_LEVELS
+
+FORMAT = "%(asctime)s │ %(levelname)-8s │ %(message)s"
+DATEFMT = "%H:%M:%S"
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def parse_levels(spec: str) -> dict[str, str]:
+    """"parser=WARNING,scraper=DEBUG" → {"parser": "WARNING", "scraper": "DEBUG"}."""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        if not level:
+            raise ValueError(f"LOG_LEVELS inválido: {item!r} (use modulo=NIVEL)")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    levels: str | dict[str, str] = LOG_LEVELS,
+    log_file: str | None = LOG_FILE,
+    stream=None,
+) -> logging.handlers.QueueListener:
+    """
+    Instala o QueueHandler no logger raiz e inicia o listener (parado no
+    atexit, ou por stop_logging()). `stream` é o terminal (padrão stdout);
+    log_file=None ou "" não grava arquivo.
+    """
+    global _listener
+    stop_logging()
+
+    formatter = logging.Formatter(FORMAT, datefmt=DATEFMT)
+    handlers: list[logging.Handler] = [logging.StreamHandler(stream or sys.stdout)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level.upper())
+
+    if isinstance(levels, str):
+        levels = parse_levels(levels)
+    for name, subsystem_level in levels.items():
+        logging.getLogger(name).setLevel(subsystem_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging():
+    """Esvazia a fila, para o listener e fecha os arquivos."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_logging)
@@ -2,47 +2,57 @@
 NBA Stats Scraper — Ponto de entrada principal.
 
 Executa o fluxo completo:
-  1. Inicializa o banco de dados PostgreSQL (cria tabelas)
+  1. Inicializa o banco de dados PostgreSQL (aplica migrations pendentes)
   2. Abre o Chrome com Selenium
-  3. Navega até a página do NBA Media Central Game Stats
+  3. Navega até a página do NBA Media Central Game Stats (partida a frio;
+     com cookies válidos no jar, os passos 2–3 são pulados — partida a
+     quente, ver browser_cache.py)
   4. Captura os links de download de cada categoria
-  5. Baixa o conteúdo TXT de cada link
+  5. Baixa o conteúdo TXT de cada link (GET condicional: 304 = inalterado)
   6. Faz o parse dos dados
-  7. Salva tudo no PostgreSQL (dados brutos + parsed)
+  7. Salva no PostgreSQL (dados brutos + parsed) um novo snapshot das
+     categorias que mudaram e publica esse snapshot para a API
+
+Os passos 5–7 se sobrepõem (pipeline.run_pipelined): cada categoria é
+parseada e carregada enquanto as seguintes ainda estão sendo baixadas.
+
+    python main.py [--profile cprofile|sample|tracemalloc] [--profile-stages parsers,...]
+
+Com --profile, os estágios são medidos e os relatórios ficam em
+PROFILE_DIR/run_<id>/ (ver profiling.py).
 """
 
 import os
-import sys
 import shutil
 import logging
-from datetime import datetime
+import argparse
+import contextlib
 
-from config import CATEGORY_SLUG_MAP, DOWNLOAD_DIR
-from database import init_db, get_session, engine, Base, ScrapeRun, RawData, MODEL_MAP
+from config import BROWSER_WARM_START, DOWNLOAD_DIR, FETCH_RECORD, HTTP_CACHE_ENABLED, RECORD_DIR
+from database import init_db
 from scraper import NBAStatsScraper
-from parser import PARSER_MAP
-from sqlalchemy import text
+from browser_cache import CookieJar
+from http_cache import ValidatorCache
+from log_setup import setup_logging
+from metrics import StageMetrics
+from pipeline import finish_run, loaded_source_urls, run_pipelined, start_run
+from replay import Recorder
+from spool import peak_rss_mb
 
 # ── Logging ────────────────────────────────────────────────────────
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s │ %(levelname)-8s │ %(message)s",
-    datefmt="%H:%M:%S",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("nba_scraper.log", encoding="utf-8"),
-    ],
-)
+# Terminal + LOG_FILE por uma fila (ver log_setup.py); níveis no .env
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
 def cleanup_before_run():
     """
-    Limpeza pré-execução:
-      1. Remove todos os arquivos da pasta downloads/
-      2. Trunca todas as tabelas de dados (preserva scrape_runs)
+    Limpeza pré-execução: remove todos os arquivos da pasta downloads/.
+
+    As tabelas não são mais truncadas aqui: cada categoria baixada é
+    substituída em save_to_database(), e categorias inalteradas (304)
+    mantêm os dados atuais.
     """
-    # ── 1. Limpar pasta de downloads ──
     if os.path.exists(DOWNLOAD_DIR):
         count = 0
         for f in os.listdir(DOWNLOAD_DIR):
@@ -58,187 +68,122 @@ def cleanup_before_run():
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
         logger.info(f"[CLEANUP] Pasta criada: {DOWNLOAD_DIR}")
 
-    # ── 2. Truncar tabelas de dados ──
-    tables_to_truncate = [
-        "raw_data",
-        "latest_boxscore_lines",
-        "alphabetical_player_cumulatives",
-        "alphabetical_rookie_cumulatives",
-        "attendance",
-        "latest_scores_and_leaders",
-        "single_game_highs_lows",
-        "top_10_league_leaders",
-        "top_20_league_leaders",
-        "rookie_league_leaders",
-        "ratios_players",
-        "ratios_teams",
-        "playoff_schedule_results",
-        "standings",
-        "head_to_head_win_grid",
-        "offensive_defensive",
-        "miscellaneous",
-        "opponent_points_breakdown",
-        "team_boxscore_lines",
-        "team_cumulatives",
-    ]
-
-    with engine.connect() as conn:
-        for table_name in tables_to_truncate:
-            try:
-                conn.execute(text(f'TRUNCATE TABLE "{table_name}" CASCADE'))
-                conn.commit()
-                logger.debug(f"[CLEANUP] Tabela '{table_name}' truncada")
-            except Exception as e:
-                conn.rollback()
-                logger.warning(f"[CLEANUP] Erro ao truncar '{table_name}': {e}")
-
-    logger.info(f"[CLEANUP] {len(tables_to_truncate)} tabelas truncadas")
 
-
-def save_to_database(scraped_data: list[dict], run_id: int):
+def main(profile: str | None = None, profile_stages: list[str] | None = None):
     """
-    Salva os dados coletados no banco de dados.
-
-    Para cada categoria:
-      - Salva o conteúdo bruto na tabela `raw_data`
-      - Faz parse e salva os dados estruturados na tabela específica
+    Função principal — orquestra todo o fluxo. `profile` (cprofile |
+    sample | tracemalloc) mede os estágios `profile_stages` (padrão:
+    todos) deste run; ver profiling.py.
     """
-    session = get_session()
-    categories_ok = 0
-
-    try:
-        for item in scraped_data:
-            category = item["category"]
-            slug = item["slug"]
-            url = item.get("url", "")
-            content = item.get("content")
-
-            if not content:
-                logger.warning(f"[DB] Sem conteúdo para: {category}")
-                continue
-
-            # ── 1. Salva dado bruto ────────────────────────────────
-            raw = RawData(
-                category=category,
-                category_slug=slug,
-                source_url=url,
-                raw_content=content,
-                scrape_run_id=run_id,
-            )
-            session.add(raw)
-            session.flush()
-            logger.info(f"[DB] Dado bruto salvo: {category} ({len(content)} chars)")
-
-            # ── 2. Parse e salva dados estruturados ────────────────
-            parser_func = PARSER_MAP.get(slug)
-            model_class = MODEL_MAP.get(slug)
-
-            if parser_func and model_class:
-                try:
-                    parsed_records = parser_func(content)
-                    if parsed_records:
-                        for record in parsed_records:
-                            obj = model_class(**record)
-                            session.add(obj)
-                        logger.info(
-                            f"[DB] {len(parsed_records)} registros parsed salvos em '{slug}'"
-                        )
-                        categories_ok += 1
-                    else:
-                        logger.warning(f"[DB] Parser retornou 0 registros para: {category}")
-                except Exception as e:
-                    logger.error(f"[DB] Erro no parse de {category}: {e}")
-                    # Ainda salva o dado bruto (já adicionado acima)
-            else:
-                logger.info(
-                    f"[DB] Sem parser/modelo específico para '{slug}' — "
-                    f"dado bruto salvo"
-                )
-                categories_ok += 1
-
-        session.commit()
-        logger.info(f"[DB] Commit realizado — {categories_ok} categorias processadas")
-
-    except Exception as e:
-        session.rollback()
-        logger.error(f"[DB] Erro geral ao salvar: {e}")
-        raise
-    finally:
-        session.close()
-
-    return categories_ok
-
-
-def main():
-    """Função principal — orquestra todo o fluxo."""
     logger.info("=" * 60)
     logger.info("  NBA STATS SCRAPER — Iniciando")
     logger.info("=" * 60)
 
     # ── 1. Inicializa banco ────────────────────────────────────────
-    logger.info("[INIT] Criando/verificando tabelas no PostgreSQL...")
-    init_db(drop_existing=True)
+    logger.info("[INIT] Verificando schema do PostgreSQL (migrations)...")
+    init_db()
 
     # ── 1.5. Limpeza pré-execução ─────────────────────────────────
     logger.info("[CLEANUP] Limpando dados anteriores...")
     cleanup_before_run()
 
     # ── 2. Registra execução ───────────────────────────────────────
-    session = get_session()
-    run = ScrapeRun(started_at=datetime.utcnow(), status="running")
-    session.add(run)
-    session.commit()
-    run_id = run.id
-    session.close()
+    run_id = start_run()
     logger.info(f"[INIT] Execução #{run_id} registrada")
 
-    # ── 3. Scraping com Selenium ───────────────────────────────────
-    scraper = NBAStatsScraper()
+    # ── 3. Scraping com Selenium + carga no banco ──────────────────
+    validators = None
+    if HTTP_CACHE_ENABLED:
+        validators = ValidatorCache()
+        # Sem dado bruto no banco, um 304 esconderia a categoria
+        validators.retain(loaded_source_urls())
+
+    recorder = None
+    if FETCH_RECORD:
+        recorder = Recorder()
+        logger.info(f"[INIT] Gravando as respostas em {RECORD_DIR} (replay.py)")
+
+    # Gravando, a página precisa ser aberta (o replay serve o HTML dela)
+    cookie_jar = CookieJar() if BROWSER_WARM_START and not recorder else None
+
+    scraper = NBAStatsScraper(validators=validators, recorder=recorder, cookie_jar=cookie_jar)
     scraped_data = []
+    # URLs publicadas no banco: só os validadores delas são gravados
+    published: set[str] = set()
+    # Tempo/volume por categoria e estágio (scrape_run_stages + Prometheus)
+    stages = StageMetrics()
+
+    profiler = contextlib.nullcontext()
+    if profile:
+        from profiling import StageProfiler
+
+        profiler = StageProfiler(profile, run_id, profile_stages)
 
     try:
-        scraper.start_browser()
-        scraped_data = scraper.scrape_all()
+        # O Chrome só abre se preciso (partida a frio, FETCH_MODE=browser, 403)
+        # Cada categoria baixada já segue para parse + carga
+        with profiler:
+            scraped_data, categories_ok = run_pipelined(
+                lambda emit: scraper.scrape_all(on_result=emit), run_id,
+                stages=stages, published=published,
+            )
+        if scraper.startup:
+            stages.record(
+                "_browser", f"{scraper.startup['mode']}_start", scraper.startup["seconds"]
+            )
     except Exception as e:
         logger.error(f"[SCRAPER] Erro fatal: {e}")
         # Atualiza status da execução
-        session = get_session()
-        run = session.query(ScrapeRun).get(run_id)
-        if run:
-            run.status = "error"
-            run.finished_at = datetime.utcnow()
-            run.error_message = str(e)
-            session.commit()
-        session.close()
+        finish_run(run_id, "error", error=str(e), stages=stages)
         raise
     finally:
         scraper.stop_browser()
 
-    # ── 4. Salva no banco ──────────────────────────────────────────
+    # ── 4. Validadores HTTP só valem após o commit no banco ────────
+    # (categoria com erro no parse/carga: validador descartado, e o
+    # próximo run baixa de novo em vez de receber 304)
     if scraped_data:
-        logger.info(f"[SAVE] Salvando {len(scraped_data)} categorias no banco...")
-        categories_ok = save_to_database(scraped_data, run_id)
+        if validators:
+            validators.commit(published)
     else:
         logger.warning("[SAVE] Nenhum dado coletado!")
-        categories_ok = 0
 
     # ── 5. Atualiza status da execução ─────────────────────────────
-    session = get_session()
-    run = session.query(ScrapeRun).get(run_id)
-    if run:
-        run.status = "success"
-        run.finished_at = datetime.utcnow()
-        run.categories_scraped = categories_ok
-        session.commit()
-    session.close()
+    finish_run(run_id, "success", categories_ok, stages=stages)
 
     # ── Resumo final ───────────────────────────────────────────────
     logger.info("=" * 60)
     logger.info(f"  CONCLUÍDO — Execução #{run_id}")
     logger.info(f"  Categorias coletadas: {len(scraped_data)}")
+    logger.info(
+        f"  Categorias inalteradas: "
+        f"{sum(1 for d in scraped_data if d.get('status') == 'unchanged')}"
+    )
     logger.info(f"  Categorias salvas com sucesso: {categories_ok}")
+    if scraper.startup:
+        logger.info(
+            f"  Partida: a {'quente' if scraper.startup['mode'] == 'warm' else 'frio'} "
+            f"({scraper.startup['seconds']:.1f}s até o primeiro download)"
+        )
+    peak = peak_rss_mb()
+    if peak is not None:
+        logger.info(f"  Pico de memória (RSS): {peak:.1f} MiB")
     logger.info("=" * 60)
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="NBA Stats Scraper — fluxo completo")
+    ap.add_argument(
+        "--profile", choices=("cprofile", "sample", "tracemalloc"),
+        help="mede os estágios do run (relatórios em PROFILE_DIR/run_<id>/)",
+    )
+    ap.add_argument(
+        "--profile-stages", type=lambda v: v.split(","),
+        help="scrape_all,parsers,save_to_database (padrão: todos)",
+    )
+    return ap.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(args.profile, args.profile_stages)
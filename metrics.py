@@ -0,0 +1,150 @@
+"""
+Métricas por categoria e estágio de uma execução.
+
+O pipeline registra, para cada categoria:
+  fetch  — tempo do download e bytes baixados
+  parse  — tempo do parser, linhas do TXT e registros gerados
+  load   — tempo da carga e linhas gravadas
+com o pico de RSS do processo ao fim de cada estágio. No fim do run
+(pipeline.finish_run) as medidas vão para a tabela scrape_run_stages e,
+com PROMETHEUS_TEXTFILE, para um arquivo no formato texto do Prometheus
+(coletor textfile do node_exporter), reescrito a cada execução.
+
+Nos estágios que se sobrepõem (ver pipeline.run_pipelined) o tempo
+esperando as filas não entra na medida do estágio.
+"""
+
+import os
+import time
+import logging
+import threading
+from datetime import datetime
+
+from config import PROMETHEUS_TEXTFILE
+from spool import peak_rss_mb
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("fetch", "parse", "load")
+
+# Medida → (métrica do Prometheus, descrição)
+_PROMETHEUS = {
+    "wall_seconds": ("nba_scraper_stage_seconds", "Tempo do estágio por categoria no último run"),
+    "bytes": ("nba_scraper_stage_bytes", "Bytes baixados por categoria no último run"),
+    "lines": ("nba_scraper_stage_lines", "Linhas do TXT por categoria no último run"),
+    "records": ("nba_scraper_stage_records", "Registros parsed por categoria no último run"),
+    "rows_written": ("nba_scraper_stage_rows_written", "Linhas gravadas por categoria no último run"),
+    "peak_rss_mb": ("nba_scraper_stage_peak_rss_mebibytes", "Pico de RSS do processo ao fim do estágio"),
+}
+
+# Medidas em que duas entradas da mesma categoria/estágio ficam com o
+# maior valor (as demais são somadas)
+_MAX_FIELDS = {"peak_rss_mb"}
+
+
+def _per_label(rows: list[dict], field: str) -> dict[tuple[str, str], float]:
+    """
+    Valor de `field` por (estágio, categoria). Um slug pode aparecer mais
+    de uma vez no run (categorias extras); o coletor textfile rejeita
+    séries repetidas, então as entradas são somadas (ou o máximo, no pico
+    de RSS).
+    """
+    merged: dict[tuple[str, str], float] = {}
+    for r in rows:
+        value = r[field]
+        if value is None:
+            continue
+        key = (r["stage"], r["category_slug"])
+        if key not in merged:
+            merged[key] = value
+        elif field in _MAX_FIELDS:
+            merged[key] = max(merged[key], value)
+        else:
+            merged[key] += value
+    return merged
+
+
+class StageMetrics:
+    """Medidas de um run, thread-safe (download, parse e carga em threads)."""
+
+    def __init__(self):
+        self.rows: list[dict] = []
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, slug: str, stage: str, wall_seconds: float | None = None, **values):
+        """Registra um estágio de uma categoria (bytes, lines, records, rows_written)."""
+        row = {
+            "category_slug": slug,
+            "stage": stage,
+            "wall_seconds": None if wall_seconds is None else round(wall_seconds, 6),
+            "bytes": values.get("bytes"),
+            "lines": values.get("lines"),
+            "records": values.get("records"),
+            "rows_written": values.get("rows_written"),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        with self._lock:
+            self.rows.append(row)
+
+    def totals(self) -> dict[str, float]:
+        """Tempo somado de cada estágio."""
+        totals = dict.fromkeys(STAGES, 0.0)
+        with self._lock:
+            for row in self.rows:
+                totals[row["stage"]] = totals.get(row["stage"], 0.0) + (row["wall_seconds"] or 0.0)
+        return totals
+
+    # ── Persistência ───────────────────────────────────────────────
+    def save(self, session, run_id: int) -> int:
+        """Grava as medidas em scrape_run_stages (na transação da sessão)."""
+        from sqlalchemy import insert
+
+        from database import ScrapeRunStage
+
+        with self._lock:
+            rows = [{"scrape_run_id": run_id, "recorded_at": datetime.utcnow()} | r for r in self.rows]
+        if rows:
+            session.execute(insert(ScrapeRunStage.__table__), rows)
+        return len(rows)
+
+    def write_textfile(self, run_id: int, status: str, path: str = PROMETHEUS_TEXTFILE):
+        """Reescreve o arquivo do Prometheus (atômico: temporário + rename)."""
+        if not path:
+            return
+        with self._lock:
+            rows = list(self.rows)
+
+        lines = []
+        for field, (name, help_text) in _PROMETHEUS.items():
+            samples = _per_label(rows, field)
+            if not samples:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for (stage, slug), value in samples.items():
+                if isinstance(value, float):
+                    value = round(value, 6)
+                lines.append(f'{name}{{stage="{stage}",category="{slug}"}} {value}')
+        lines += [
+            "# HELP nba_scraper_last_run_id Id (scrape_runs) do último run",
+            "# TYPE nba_scraper_last_run_id gauge",
+            f"nba_scraper_last_run_id {run_id}",
+            "# HELP nba_scraper_last_run_success 1 se o último run terminou com sucesso",
+            "# TYPE nba_scraper_last_run_success gauge",
+            f"nba_scraper_last_run_success {int(status == 'success')}",
+            "# HELP nba_scraper_last_run_seconds Duração do último run",
+            "# TYPE nba_scraper_last_run_seconds gauge",
+            f"nba_scraper_last_run_seconds {time.time() - self.started:.3f}",
+            "# HELP nba_scraper_last_run_timestamp_seconds Fim do último run (epoch)",
+            "# TYPE nba_scraper_last_run_timestamp_seconds gauge",
+            f"nba_scraper_last_run_timestamp_seconds {time.time():.0f}",
+        ]
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+        logger.info(f"[METRICS] {len(rows)} medidas exportadas para {path}")
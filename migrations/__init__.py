@@ -0,0 +1,95 @@
+"""
+Migrations versionadas do schema PostgreSQL.
+
+Cada script em migrations/ se chama vNNNN_<descricao>.py e define:
+    VERSION     — número inteiro, crescente e único
+    DESCRIPTION — texto curto
+    upgrade(conn) — aplica a mudança usando a Connection recebida
+
+A tabela `schema_version` guarda as versões já aplicadas. Em um banco
+atualizado, apply_pending() faz uma única consulta e retorna — não há
+drop/create de tabelas a cada execução, então o histórico, os índices e
+as estatísticas do planner são preservados.
+
+Todas as migrations pendentes rodam em uma única transação, protegida por
+advisory lock (duas execuções simultâneas não aplicam a mesma versão).
+"""
+
+import time
+import logging
+import importlib
+import pkgutil
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+_ADVISORY_LOCK_KEY = 7_365_001  # chave arbitrária e fixa do lock de migração
+
+
+def discover() -> list:
+    """Retorna os módulos de migration ordenados por VERSION."""
+    modules = [
+        importlib.import_module(f"{__name__}.{info.name}")
+        for info in pkgutil.iter_modules(__path__)
+        if info.name.startswith("v")
+    ]
+    modules.sort(key=lambda m: m.VERSION)
+
+    versions = [m.VERSION for m in modules]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"[MIGRATE] Versões duplicadas: {versions}")
+    return modules
+
+
+def current_version(conn) -> int:
+    """Versão aplicada no banco (0 se schema_version ainda não existe)."""
+    exists = conn.execute(text("SELECT to_regclass('schema_version') IS NOT NULL")).scalar()
+    if not exists:
+        return 0
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar()
+
+
+def apply_pending(engine) -> list[int]:
+    """Aplica as migrations pendentes. Retorna as versões aplicadas."""
+    started = time.perf_counter()
+    migrations = discover()
+    latest = migrations[-1].VERSION if migrations else 0
+
+    with engine.begin() as conn:
+        version = current_version(conn)
+        if version >= latest:
+            logger.info(
+                f"[MIGRATE] Schema na versão {version} — nada a aplicar "
+                f"({(time.perf_counter() - started) * 1000:.1f} ms)"
+            )
+            return []
+
+        conn.execute(text("SELECT pg_advisory_xact_lock(:k)"), {"k": _ADVISORY_LOCK_KEY})
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_version ("
+            "  version     INTEGER PRIMARY KEY,"
+            "  description VARCHAR(200) NOT NULL,"
+            "  applied_at  TIMESTAMP NOT NULL DEFAULT NOW()"
+            ")"
+        ))
+        # Relê após o lock: outra execução pode ter migrado enquanto esperávamos
+        version = current_version(conn)
+
+        applied = []
+        for migration in migrations:
+            if migration.VERSION <= version:
+                continue
+            logger.info(f"[MIGRATE] Aplicando v{migration.VERSION:04d}: {migration.DESCRIPTION}")
+            migration.upgrade(conn)
+            conn.execute(
+                text("INSERT INTO schema_version (version, description) VALUES (:v, :d)"),
+                {"v": migration.VERSION, "d": migration.DESCRIPTION},
+            )
+            applied.append(migration.VERSION)
+
+    logger.info(
+        f"[MIGRATE] {len(applied)} migrations aplicadas — schema na versão {latest} "
+        f"({(time.perf_counter() - started) * 1000:.1f} ms)"
+    )
+    return applied
@@ -0,0 +1,9 @@
+"""Aplica as migrations pendentes: python -m migrations"""
+
+import logging
+
+from database import engine
+from migrations import apply_pending
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s │ %(levelname)-8s │ %(message)s")
+apply_pending(engine)
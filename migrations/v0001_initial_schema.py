@@ -0,0 +1,419 @@
+"""
+Schema inicial: scrape_runs, raw_data e as tabelas de cada categoria.
+
+DDL congelado do schema anterior ao sistema de migrations (uma tabela
+<slug> por categoria, sem raw_data.content_hash): as migrations seguintes
+partem exatamente dele, num banco novo ou num já existente. Não use os
+modelos de database.py aqui — eles descrevem o schema da última versão.
+CREATE TABLE IF NOT EXISTS também adota bancos criados antes do sistema de
+migrations sem recriar nenhuma tabela.
+"""
+
+from sqlalchemy import text
+
+VERSION = 1
+DESCRIPTION = "schema inicial (tabelas dos modelos)"
+
+_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS scrape_runs (
+        id SERIAL NOT NULL,
+        started_at TIMESTAMP WITHOUT TIME ZONE,
+        finished_at TIMESTAMP WITHOUT TIME ZONE,
+        status VARCHAR(20),
+        categories_scraped INTEGER,
+        error_message TEXT,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS raw_data (
+        id SERIAL NOT NULL,
+        category VARCHAR(100) NOT NULL,
+        category_slug VARCHAR(100) NOT NULL,
+        source_url TEXT,
+        raw_content TEXT NOT NULL,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        scrape_run_id INTEGER,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS latest_boxscore_lines (
+        id SERIAL NOT NULL,
+        game_date DATE NOT NULL,
+        team VARCHAR(5) NOT NULL,
+        opponent VARCHAR(5) NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        position VARCHAR(10),
+        games INTEGER,
+        minutes INTEGER,
+        fg INTEGER,
+        fga INTEGER,
+        fg3 INTEGER,
+        f3a INTEGER,
+        ft INTEGER,
+        fta INTEGER,
+        off_reb INTEGER,
+        def_reb INTEGER,
+        total_reb INTEGER,
+        assists INTEGER,
+        pf INTEGER,
+        dq INTEGER,
+        steals INTEGER,
+        turnovers INTEGER,
+        blocks INTEGER,
+        points INTEGER,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS alphabetical_player_cumulatives (
+        id SERIAL NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        team VARCHAR(5),
+        position VARCHAR(10),
+        games INTEGER,
+        minutes INTEGER,
+        fg INTEGER,
+        fga INTEGER,
+        fg3 INTEGER,
+        f3a INTEGER,
+        ft INTEGER,
+        fta INTEGER,
+        off_reb INTEGER,
+        def_reb INTEGER,
+        total_reb INTEGER,
+        assists INTEGER,
+        pf INTEGER,
+        dq INTEGER,
+        steals INTEGER,
+        turnovers INTEGER,
+        blocks INTEGER,
+        points INTEGER,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS alphabetical_rookie_cumulatives (
+        id SERIAL NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        team VARCHAR(5),
+        position VARCHAR(10),
+        games INTEGER,
+        minutes INTEGER,
+        fg INTEGER,
+        fga INTEGER,
+        fg3 INTEGER,
+        f3a INTEGER,
+        ft INTEGER,
+        fta INTEGER,
+        off_reb INTEGER,
+        def_reb INTEGER,
+        total_reb INTEGER,
+        assists INTEGER,
+        pf INTEGER,
+        dq INTEGER,
+        steals INTEGER,
+        turnovers INTEGER,
+        blocks INTEGER,
+        points INTEGER,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS attendance (
+        id SERIAL NOT NULL,
+        team VARCHAR(50),
+        home_games INTEGER,
+        home_total INTEGER,
+        home_avg INTEGER,
+        road_games INTEGER,
+        road_total INTEGER,
+        road_avg INTEGER,
+        overall_games INTEGER,
+        overall_total INTEGER,
+        overall_avg INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS latest_scores_and_leaders (
+        id SERIAL NOT NULL,
+        game_date DATE,
+        away_team VARCHAR(50),
+        home_team VARCHAR(50),
+        away_score INTEGER,
+        home_score INTEGER,
+        leader_points VARCHAR(200),
+        leader_rebounds VARCHAR(200),
+        leader_assists VARCHAR(200),
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS single_game_highs_lows (
+        id SERIAL NOT NULL,
+        category VARCHAR(100),
+        stat_type VARCHAR(50),
+        player_name VARCHAR(100),
+        team VARCHAR(50),
+        opponent VARCHAR(50),
+        game_date DATE,
+        value INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS top_10_league_leaders (
+        id SERIAL NOT NULL,
+        stat_category VARCHAR(100),
+        rank INTEGER,
+        player_name VARCHAR(100),
+        team VARCHAR(50),
+        value FLOAT,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS top_20_league_leaders (
+        id SERIAL NOT NULL,
+        stat_category VARCHAR(100),
+        rank INTEGER,
+        player_name VARCHAR(100),
+        team VARCHAR(50),
+        value FLOAT,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rookie_league_leaders (
+        id SERIAL NOT NULL,
+        stat_category VARCHAR(100),
+        rank INTEGER,
+        player_name VARCHAR(100),
+        team VARCHAR(50),
+        value FLOAT,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ratios_players (
+        id SERIAL NOT NULL,
+        player_name VARCHAR(100),
+        team VARCHAR(50),
+        games INTEGER,
+        minutes INTEGER,
+        fg_pct FLOAT,
+        fg3_pct FLOAT,
+        ft_pct FLOAT,
+        ppg FLOAT,
+        rpg FLOAT,
+        apg FLOAT,
+        spg FLOAT,
+        bpg FLOAT,
+        topg FLOAT,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ratios_teams (
+        id SERIAL NOT NULL,
+        team VARCHAR(50),
+        games INTEGER,
+        wins INTEGER,
+        losses INTEGER,
+        fg_pct FLOAT,
+        fg3_pct FLOAT,
+        ft_pct FLOAT,
+        ppg FLOAT,
+        rpg FLOAT,
+        apg FLOAT,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS playoff_schedule_results (
+        id SERIAL NOT NULL,
+        round_name VARCHAR(100),
+        game_date DATE,
+        away_team VARCHAR(50),
+        home_team VARCHAR(50),
+        away_score INTEGER,
+        home_score INTEGER,
+        series_status VARCHAR(100),
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS standings (
+        id SERIAL NOT NULL,
+        conference VARCHAR(50),
+        division VARCHAR(255),
+        team VARCHAR(100),
+        wins INTEGER,
+        losses INTEGER,
+        pct FLOAT,
+        games_behind VARCHAR(30),
+        home_record VARCHAR(30),
+        road_record VARCHAR(30),
+        last_10 VARCHAR(30),
+        streak VARCHAR(30),
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS head_to_head_win_grid (
+        id SERIAL NOT NULL,
+        team VARCHAR(50),
+        opponent VARCHAR(50),
+        wins INTEGER,
+        losses INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS offensive_defensive (
+        id SERIAL NOT NULL,
+        team VARCHAR(50),
+        stat_type VARCHAR(20),
+        games INTEGER,
+        fg INTEGER,
+        fga INTEGER,
+        fg_pct FLOAT,
+        fg3 INTEGER,
+        f3a INTEGER,
+        fg3_pct FLOAT,
+        ft INTEGER,
+        fta INTEGER,
+        ft_pct FLOAT,
+        off_reb INTEGER,
+        def_reb INTEGER,
+        total_reb INTEGER,
+        assists INTEGER,
+        steals INTEGER,
+        blocks INTEGER,
+        turnovers INTEGER,
+        points INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS miscellaneous (
+        id SERIAL NOT NULL,
+        stat_category VARCHAR(200),
+        value VARCHAR(200),
+        description TEXT,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS opponent_points_breakdown (
+        id SERIAL NOT NULL,
+        team VARCHAR(50),
+        opp_fg INTEGER,
+        opp_fga INTEGER,
+        opp_fg_pct FLOAT,
+        opp_fg3 INTEGER,
+        opp_f3a INTEGER,
+        opp_fg3_pct FLOAT,
+        opp_ft INTEGER,
+        opp_fta INTEGER,
+        opp_ft_pct FLOAT,
+        opp_points INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS team_boxscore_lines (
+        id SERIAL NOT NULL,
+        game_date DATE,
+        team VARCHAR(50),
+        opponent VARCHAR(50),
+        fg INTEGER,
+        fga INTEGER,
+        fg_pct FLOAT,
+        fg3 INTEGER,
+        f3a INTEGER,
+        fg3_pct FLOAT,
+        ft INTEGER,
+        fta INTEGER,
+        ft_pct FLOAT,
+        off_reb INTEGER,
+        def_reb INTEGER,
+        total_reb INTEGER,
+        assists INTEGER,
+        steals INTEGER,
+        blocks INTEGER,
+        turnovers INTEGER,
+        pf INTEGER,
+        points INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS team_cumulatives (
+        id SERIAL NOT NULL,
+        team VARCHAR(50),
+        games INTEGER,
+        fg INTEGER,
+        fga INTEGER,
+        fg_pct FLOAT,
+        fg3 INTEGER,
+        f3a INTEGER,
+        fg3_pct FLOAT,
+        ft INTEGER,
+        fta INTEGER,
+        ft_pct FLOAT,
+        off_reb INTEGER,
+        def_reb INTEGER,
+        total_reb INTEGER,
+        assists INTEGER,
+        steals INTEGER,
+        blocks INTEGER,
+        turnovers INTEGER,
+        points INTEGER,
+        raw_line TEXT,
+        scraped_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+)
+
+
+def upgrade(conn):
+    for ddl in _TABLES:
+        conn.execute(text(ddl))
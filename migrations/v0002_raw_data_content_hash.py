@@ -0,0 +1,12 @@
+"""Hash SHA-256 do conteúdo bruto, usado para pular categorias sem mudança."""
+
+from sqlalchemy import text
+
+VERSION = 2
+DESCRIPTION = "raw_data.content_hash"
+
+
+def upgrade(conn):
+    conn.execute(text(
+        "ALTER TABLE raw_data ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)"
+    ))
@@ -0,0 +1,536 @@
+"""
+Histórico particionado por data de coleta + views com os dados atuais.
+
+Para cada categoria:
+  - cria <slug>_history (PARTITION BY RANGE (scrape_date)), se não existir
+  - move as linhas da antiga tabela <slug> para o histórico, atribuídas ao
+    último scrape_run conhecido, e publica esse run em category_current
+    (tabela antiga vazia: nada é movido nem publicado)
+  - remove a tabela antiga (e sobras de <slug>__staging)
+  - cria a view <slug>, lida pela API
+
+DDL, partições, publicação e views congelados como nesta versão: não use
+os modelos de database.py nem history.py aqui — eles descrevem o schema e
+o comportamento da última versão.
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import text
+
+VERSION = 3
+DESCRIPTION = "histórico particionado por scrape_date + views atuais"
+
+_CATEGORY_CURRENT = """
+    CREATE TABLE IF NOT EXISTS category_current (
+        table_name VARCHAR(100) NOT NULL,
+        scrape_run_id INTEGER NOT NULL,
+        scrape_date DATE NOT NULL,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (table_name)
+    )
+"""
+
+# view <slug> → DDL da tabela <slug>_history (o índice de scrape_run_id é
+# criado no upgrade)
+_HISTORY_TABLES = {
+    "latest_boxscore_lines": """
+        CREATE TABLE IF NOT EXISTS latest_boxscore_lines_history (
+            id SERIAL NOT NULL,
+            game_date DATE NOT NULL,
+            team VARCHAR(5) NOT NULL,
+            opponent VARCHAR(5) NOT NULL,
+            player_name VARCHAR(100) NOT NULL,
+            position VARCHAR(10),
+            games INTEGER,
+            minutes INTEGER,
+            fg INTEGER,
+            fga INTEGER,
+            fg3 INTEGER,
+            f3a INTEGER,
+            ft INTEGER,
+            fta INTEGER,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            pf INTEGER,
+            dq INTEGER,
+            steals INTEGER,
+            turnovers INTEGER,
+            blocks INTEGER,
+            points INTEGER,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "alphabetical_player_cumulatives": """
+        CREATE TABLE IF NOT EXISTS alphabetical_player_cumulatives_history (
+            id SERIAL NOT NULL,
+            player_name VARCHAR(100) NOT NULL,
+            team VARCHAR(5),
+            position VARCHAR(10),
+            games INTEGER,
+            minutes INTEGER,
+            fg INTEGER,
+            fga INTEGER,
+            fg3 INTEGER,
+            f3a INTEGER,
+            ft INTEGER,
+            fta INTEGER,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            pf INTEGER,
+            dq INTEGER,
+            steals INTEGER,
+            turnovers INTEGER,
+            blocks INTEGER,
+            points INTEGER,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "alphabetical_rookie_cumulatives": """
+        CREATE TABLE IF NOT EXISTS alphabetical_rookie_cumulatives_history (
+            id SERIAL NOT NULL,
+            player_name VARCHAR(100) NOT NULL,
+            team VARCHAR(5),
+            position VARCHAR(10),
+            games INTEGER,
+            minutes INTEGER,
+            fg INTEGER,
+            fga INTEGER,
+            fg3 INTEGER,
+            f3a INTEGER,
+            ft INTEGER,
+            fta INTEGER,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            pf INTEGER,
+            dq INTEGER,
+            steals INTEGER,
+            turnovers INTEGER,
+            blocks INTEGER,
+            points INTEGER,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "attendance": """
+        CREATE TABLE IF NOT EXISTS attendance_history (
+            id SERIAL NOT NULL,
+            team VARCHAR(50),
+            home_games INTEGER,
+            home_total INTEGER,
+            home_avg INTEGER,
+            road_games INTEGER,
+            road_total INTEGER,
+            road_avg INTEGER,
+            overall_games INTEGER,
+            overall_total INTEGER,
+            overall_avg INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "latest_scores_and_leaders": """
+        CREATE TABLE IF NOT EXISTS latest_scores_and_leaders_history (
+            id SERIAL NOT NULL,
+            game_date DATE,
+            away_team VARCHAR(50),
+            home_team VARCHAR(50),
+            away_score INTEGER,
+            home_score INTEGER,
+            leader_points VARCHAR(200),
+            leader_rebounds VARCHAR(200),
+            leader_assists VARCHAR(200),
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "single_game_highs_lows": """
+        CREATE TABLE IF NOT EXISTS single_game_highs_lows_history (
+            id SERIAL NOT NULL,
+            category VARCHAR(100),
+            stat_type VARCHAR(50),
+            player_name VARCHAR(100),
+            team VARCHAR(50),
+            opponent VARCHAR(50),
+            game_date DATE,
+            value INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "top_10_league_leaders": """
+        CREATE TABLE IF NOT EXISTS top_10_league_leaders_history (
+            id SERIAL NOT NULL,
+            stat_category VARCHAR(100),
+            rank INTEGER,
+            player_name VARCHAR(100),
+            team VARCHAR(50),
+            value FLOAT,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "top_20_league_leaders": """
+        CREATE TABLE IF NOT EXISTS top_20_league_leaders_history (
+            id SERIAL NOT NULL,
+            stat_category VARCHAR(100),
+            rank INTEGER,
+            player_name VARCHAR(100),
+            team VARCHAR(50),
+            value FLOAT,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "rookie_league_leaders": """
+        CREATE TABLE IF NOT EXISTS rookie_league_leaders_history (
+            id SERIAL NOT NULL,
+            stat_category VARCHAR(100),
+            rank INTEGER,
+            player_name VARCHAR(100),
+            team VARCHAR(50),
+            value FLOAT,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "ratios_players": """
+        CREATE TABLE IF NOT EXISTS ratios_players_history (
+            id SERIAL NOT NULL,
+            player_name VARCHAR(100),
+            team VARCHAR(50),
+            games INTEGER,
+            minutes INTEGER,
+            fg_pct FLOAT,
+            fg3_pct FLOAT,
+            ft_pct FLOAT,
+            ppg FLOAT,
+            rpg FLOAT,
+            apg FLOAT,
+            spg FLOAT,
+            bpg FLOAT,
+            topg FLOAT,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "ratios_teams": """
+        CREATE TABLE IF NOT EXISTS ratios_teams_history (
+            id SERIAL NOT NULL,
+            team VARCHAR(50),
+            games INTEGER,
+            wins INTEGER,
+            losses INTEGER,
+            fg_pct FLOAT,
+            fg3_pct FLOAT,
+            ft_pct FLOAT,
+            ppg FLOAT,
+            rpg FLOAT,
+            apg FLOAT,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "playoff_schedule_results": """
+        CREATE TABLE IF NOT EXISTS playoff_schedule_results_history (
+            id SERIAL NOT NULL,
+            round_name VARCHAR(100),
+            game_date DATE,
+            away_team VARCHAR(50),
+            home_team VARCHAR(50),
+            away_score INTEGER,
+            home_score INTEGER,
+            series_status VARCHAR(100),
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "standings": """
+        CREATE TABLE IF NOT EXISTS standings_history (
+            id SERIAL NOT NULL,
+            conference VARCHAR(50),
+            division VARCHAR(255),
+            team VARCHAR(100),
+            wins INTEGER,
+            losses INTEGER,
+            pct FLOAT,
+            games_behind VARCHAR(30),
+            home_record VARCHAR(30),
+            road_record VARCHAR(30),
+            last_10 VARCHAR(30),
+            streak VARCHAR(30),
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "head_to_head_win_grid": """
+        CREATE TABLE IF NOT EXISTS head_to_head_win_grid_history (
+            id SERIAL NOT NULL,
+            team VARCHAR(50),
+            opponent VARCHAR(50),
+            wins INTEGER,
+            losses INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "offensive_defensive": """
+        CREATE TABLE IF NOT EXISTS offensive_defensive_history (
+            id SERIAL NOT NULL,
+            team VARCHAR(50),
+            stat_type VARCHAR(20),
+            games INTEGER,
+            fg INTEGER,
+            fga INTEGER,
+            fg_pct FLOAT,
+            fg3 INTEGER,
+            f3a INTEGER,
+            fg3_pct FLOAT,
+            ft INTEGER,
+            fta INTEGER,
+            ft_pct FLOAT,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            steals INTEGER,
+            blocks INTEGER,
+            turnovers INTEGER,
+            points INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "miscellaneous": """
+        CREATE TABLE IF NOT EXISTS miscellaneous_history (
+            id SERIAL NOT NULL,
+            stat_category VARCHAR(200),
+            value VARCHAR(200),
+            description TEXT,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "opponent_points_breakdown": """
+        CREATE TABLE IF NOT EXISTS opponent_points_breakdown_history (
+            id SERIAL NOT NULL,
+            team VARCHAR(50),
+            opp_fg INTEGER,
+            opp_fga INTEGER,
+            opp_fg_pct FLOAT,
+            opp_fg3 INTEGER,
+            opp_f3a INTEGER,
+            opp_fg3_pct FLOAT,
+            opp_ft INTEGER,
+            opp_fta INTEGER,
+            opp_ft_pct FLOAT,
+            opp_points INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "team_boxscore_lines": """
+        CREATE TABLE IF NOT EXISTS team_boxscore_lines_history (
+            id SERIAL NOT NULL,
+            game_date DATE,
+            team VARCHAR(50),
+            opponent VARCHAR(50),
+            fg INTEGER,
+            fga INTEGER,
+            fg_pct FLOAT,
+            fg3 INTEGER,
+            f3a INTEGER,
+            fg3_pct FLOAT,
+            ft INTEGER,
+            fta INTEGER,
+            ft_pct FLOAT,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            steals INTEGER,
+            blocks INTEGER,
+            turnovers INTEGER,
+            pf INTEGER,
+            points INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+    "team_cumulatives": """
+        CREATE TABLE IF NOT EXISTS team_cumulatives_history (
+            id SERIAL NOT NULL,
+            team VARCHAR(50),
+            games INTEGER,
+            fg INTEGER,
+            fga INTEGER,
+            fg_pct FLOAT,
+            fg3 INTEGER,
+            f3a INTEGER,
+            fg3_pct FLOAT,
+            ft INTEGER,
+            fta INTEGER,
+            ft_pct FLOAT,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            steals INTEGER,
+            blocks INTEGER,
+            turnovers INTEGER,
+            points INTEGER,
+            raw_line TEXT,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            scrape_run_id INTEGER NOT NULL,
+            scrape_date DATE NOT NULL,
+            PRIMARY KEY (id, scrape_date)
+        ) PARTITION BY RANGE (scrape_date)
+    """,
+}
+
+
+def _relkind(conn, name: str) -> str | None:
+    return conn.execute(
+        text("SELECT relkind FROM pg_class WHERE relname = :n AND relnamespace = 'public'::regnamespace"),
+        {"n": name},
+    ).scalar()
+
+
+def _ensure_partition(conn, history: str, day: date):
+    start = day.replace(day=1)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    conn.execute(text(
+        f'CREATE TABLE IF NOT EXISTS "{history}_y{day.year:04d}m{day.month:02d}" PARTITION OF "{history}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+
+
+def _publish(conn, history: str, run_id: int, day: date):
+    conn.execute(
+        text(
+            "INSERT INTO category_current (table_name, scrape_run_id, scrape_date, updated_at) "
+            "VALUES (:t, :run, :day, :now) "
+            "ON CONFLICT (table_name) DO UPDATE SET scrape_run_id = excluded.scrape_run_id, "
+            "scrape_date = excluded.scrape_date, updated_at = excluded.updated_at"
+        ),
+        {"t": history, "run": run_id, "day": day, "now": datetime.utcnow()},
+    )
+
+
+def _create_view(conn, history: str, view: str):
+    conn.execute(text(
+        f'CREATE OR REPLACE VIEW "{view}" AS '
+        f'SELECT * FROM "{history}" '
+        f"WHERE scrape_date = (SELECT scrape_date FROM category_current WHERE table_name = '{history}') "
+        f"AND scrape_run_id = (SELECT scrape_run_id FROM category_current WHERE table_name = '{history}')"
+    ))
+
+
+def upgrade(conn):
+    conn.execute(text(_CATEGORY_CURRENT))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_raw_data_slug_run ON raw_data (category_slug, scrape_run_id)"
+    ))
+    last_run = conn.execute(text("SELECT COALESCE(MAX(scrape_run_id), 0) FROM raw_data")).scalar()
+
+    for view, ddl in _HISTORY_TABLES.items():
+        history = f"{view}_history"
+
+        conn.execute(text(ddl))
+        conn.execute(text(
+            f'CREATE INDEX IF NOT EXISTS "ix_{history}_scrape_run_id" ON "{history}" (scrape_run_id)'
+        ))
+        conn.execute(text(f'DROP TABLE IF EXISTS "{view}__staging"'))
+
+        if _relkind(conn, view) == "r":
+            # Tabela da versão anterior: migra as linhas para o histórico
+            # (vazia — ex.: banco novo criado pela v0001 — não publica nada)
+            has_rows = conn.execute(text(f'SELECT EXISTS (SELECT 1 FROM "{view}")')).scalar()
+            if has_rows:
+                legacy_cols = conn.execute(
+                    text(
+                        "SELECT column_name FROM information_schema.columns "
+                        "WHERE table_schema = 'public' AND table_name = :t AND column_name <> 'id' "
+                        "ORDER BY ordinal_position"
+                    ),
+                    {"t": view},
+                ).scalars().all()
+                snapshot_date = conn.execute(
+                    text(f'SELECT COALESCE(MAX(scraped_at)::date, CURRENT_DATE) FROM "{view}"')
+                ).scalar()
+
+                _ensure_partition(conn, history, snapshot_date)
+                cols = ", ".join(f'"{c}"' for c in legacy_cols)
+                conn.execute(
+                    text(
+                        f'INSERT INTO "{history}" ({cols}, scrape_run_id, scrape_date) '
+                        f'SELECT {cols}, :run, :day FROM "{view}"'
+                    ),
+                    {"run": last_run, "day": snapshot_date},
+                )
+                _publish(conn, history, last_run, snapshot_date)
+            conn.execute(text(f'DROP TABLE "{view}"'))
+
+        _create_view(conn, history, view)
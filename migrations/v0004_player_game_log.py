@@ -0,0 +1,69 @@
+"""
+Game log da temporada (player_game_log), deduplicado por
+(game_date, team, player_name), já preenchido com os boxscores do histórico.
+
+DDL e carga inicial congelados como nesta versão (não usa o modelo
+PlayerGameLog nem game_log.py, que podem mudar nas próximas).
+"""
+
+from sqlalchemy import text
+
+VERSION = 4
+DESCRIPTION = "player_game_log acumulado do latest_boxscore_lines"
+
+_COLUMNS = (
+    "game_date, team, opponent, player_name, position, minutes, fg, fga, fg3, f3a, "
+    "ft, fta, off_reb, def_reb, total_reb, assists, pf, dq, steals, turnovers, "
+    "blocks, points, scrape_run_id, scraped_at"
+)
+
+
+def upgrade(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS player_game_log (
+            id SERIAL NOT NULL,
+            game_date DATE NOT NULL,
+            team VARCHAR(5) NOT NULL,
+            opponent VARCHAR(5) NOT NULL,
+            player_name VARCHAR(100) NOT NULL,
+            position VARCHAR(10),
+            minutes INTEGER,
+            fg INTEGER,
+            fga INTEGER,
+            fg3 INTEGER,
+            f3a INTEGER,
+            ft INTEGER,
+            fta INTEGER,
+            off_reb INTEGER,
+            def_reb INTEGER,
+            total_reb INTEGER,
+            assists INTEGER,
+            pf INTEGER,
+            dq INTEGER,
+            steals INTEGER,
+            turnovers INTEGER,
+            blocks INTEGER,
+            points INTEGER,
+            scrape_run_id INTEGER,
+            scraped_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_player_game_log_game UNIQUE (game_date, team, player_name)
+        )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_player_game_log_player_date "
+        "ON player_game_log (player_name, game_date DESC)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_player_game_log_team_date "
+        "ON player_game_log (team, game_date DESC)"
+    ))
+
+    # Boxscores já guardados no histórico: o primeiro run que viu o jogo vence
+    conn.execute(text(
+        f"INSERT INTO player_game_log ({_COLUMNS}) "
+        f"SELECT DISTINCT ON (game_date, team, player_name) {_COLUMNS} "
+        f"FROM latest_boxscore_lines_history "
+        f"ORDER BY game_date, team, player_name, scrape_run_id "
+        f"ON CONFLICT ON CONSTRAINT uq_player_game_log_game DO NOTHING"
+    ))
@@ -0,0 +1,85 @@
+"""
+Agregados móveis por jogador (últimos 5/10/20 jogos e temporada),
+calculados a partir do game log existente, e a view
+player_rolling_averages.
+
+DDL, recálculo e view congelados como nesta versão (não usa o modelo
+PlayerRollingStats nem rolling.py, que podem mudar nas próximas).
+window_size 0 = temporada inteira.
+"""
+
+from sqlalchemy import text
+
+VERSION = 5
+DESCRIPTION = "player_rolling_stats + view player_rolling_averages"
+
+
+def _averages(stat: str) -> str:
+    """Média, desvio padrão (populacional) e CV de uma estatística."""
+    avg = f"{stat}_sum::NUMERIC / NULLIF(games, 0)"
+    std = f"SQRT(GREATEST({stat}_sq::NUMERIC / NULLIF(games, 0) - ({avg}) ^ 2, 0))"
+    return (
+        f"ROUND({avg}, 1) AS {stat}_avg, "
+        f"ROUND({std}, 1) AS {stat}_std, "
+        f"ROUND({std} / NULLIF({avg}, 0) * 100, 1) AS {stat}_cv_pct"
+    )
+
+
+def upgrade(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS player_rolling_stats (
+            player_name VARCHAR(100) NOT NULL,
+            window_size INTEGER NOT NULL,
+            team VARCHAR(5),
+            games INTEGER NOT NULL,
+            last_game_date DATE,
+            pts_sum INTEGER NOT NULL,
+            pts_sq INTEGER NOT NULL,
+            reb_sum INTEGER NOT NULL,
+            reb_sq INTEGER NOT NULL,
+            ast_sum INTEGER NOT NULL,
+            ast_sq INTEGER NOT NULL,
+            pra_sum INTEGER NOT NULL,
+            pra_sq INTEGER NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (player_name, window_size)
+        )
+    """))
+
+    conn.execute(text("DELETE FROM player_rolling_stats"))
+    conn.execute(text("""
+        WITH g AS (
+            SELECT player_name, team, game_date,
+                   COALESCE(points, 0) AS pts,
+                   COALESCE(total_reb, 0) AS reb,
+                   COALESCE(assists, 0) AS ast,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY player_name ORDER BY game_date DESC
+                   ) AS rn
+            FROM player_game_log
+        )
+        INSERT INTO player_rolling_stats (
+            player_name, window_size, team, games, last_game_date,
+            pts_sum, pts_sq, reb_sum, reb_sq, ast_sum, ast_sq,
+            pra_sum, pra_sq, updated_at
+        )
+        SELECT g.player_name, w.size,
+               (ARRAY_AGG(g.team ORDER BY g.game_date DESC))[1],
+               COUNT(*), MAX(g.game_date),
+               SUM(g.pts), SUM(g.pts * g.pts),
+               SUM(g.reb), SUM(g.reb * g.reb),
+               SUM(g.ast), SUM(g.ast * g.ast),
+               SUM(g.pts + g.reb + g.ast),
+               SUM((g.pts + g.reb + g.ast) * (g.pts + g.reb + g.ast)),
+               NOW() AT TIME ZONE 'utc'
+        FROM g
+        JOIN (VALUES (5), (10), (20), (0)) AS w(size) ON w.size = 0 OR g.rn <= w.size
+        GROUP BY g.player_name, w.size
+    """))
+
+    conn.execute(text(
+        "CREATE OR REPLACE VIEW player_rolling_averages AS "
+        "SELECT player_name, window_size, team, games, last_game_date, "
+        + ", ".join(_averages(stat) for stat in ("pts", "reb", "ast", "pra"))
+        + " FROM player_rolling_stats"
+    ))
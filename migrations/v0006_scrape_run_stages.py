@@ -0,0 +1,34 @@
+"""
+Tempo e recursos por categoria e estágio (fetch/parse/load) de cada execução.
+
+DDL congelado da tabela como foi criada nesta versão (não usa o modelo
+ScrapeRunStage, que pode mudar nas próximas).
+"""
+
+from sqlalchemy import text
+
+VERSION = 6
+DESCRIPTION = "scrape_run_stages (métricas por estágio)"
+
+
+def upgrade(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS scrape_run_stages (
+            id SERIAL NOT NULL,
+            scrape_run_id INTEGER NOT NULL,
+            category_slug VARCHAR(100) NOT NULL,
+            stage VARCHAR(20) NOT NULL,
+            wall_seconds FLOAT,
+            bytes INTEGER,
+            lines INTEGER,
+            records INTEGER,
+            rows_written INTEGER,
+            peak_rss_mb FLOAT,
+            recorded_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id)
+        )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_scrape_run_stages_run "
+        "ON scrape_run_stages (scrape_run_id, stage)"
+    ))
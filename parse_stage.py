@@ -0,0 +1,115 @@
+"""
+Estágio de parse das categorias, opcionalmente em paralelo.
+
+Com PARSE_WORKERS > 1 os TXT são parseados em um ProcessPoolExecutor
+(os parsers são CPU-bound e o GIL segura um processo só):
+  - só o texto bruto vai para o worker (slug + str)
+  - o worker devolve lotes compactos: (colunas, [tuplas]) para cada
+    sequência de registros com as mesmas chaves, em vez de um dict por
+    registro no pickle
+  - os resultados saem na ordem em que as categorias entraram, qualquer
+    que seja o nº de workers, e no máximo `workers * 2` categorias ficam
+    em voo (memória limitada mesmo com milhares de arquivos)
+
+Com PARSE_WORKERS <= 1 nada muda em relação ao parse no próprio
+processo: records() devolve o gerador do parser (carga em streaming).
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+from config import PARSE_WORKERS
+from parser import STREAM_PARSER_MAP
+
+logger = logging.getLogger(__name__)
+
+Batch = tuple[tuple[str, ...], list[tuple]]
+
+
+# ── Worker ─────────────────────────────────────────────────────────
+def parse_batches(slug: str, text: str) -> list[Batch]:
+    """Roda no processo worker: parse completo em lotes (colunas, tuplas)."""
+    batches: list[Batch] = []
+    columns: tuple[str, ...] | None = None
+    rows: list[tuple] = []
+    for record in STREAM_PARSER_MAP[slug](text):
+        keys = tuple(record)
+        if keys != columns:
+            if rows:
+                batches.append((columns, rows))
+            columns, rows = keys, []
+        rows.append(tuple(record.values()))
+    if rows:
+        batches.append((columns, rows))
+    return batches
+
+
+def _decode(batches: list[Batch]) -> Iterator[dict]:
+    for columns, rows in batches:
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+# ── Resultado ──────────────────────────────────────────────────────
+class ParsedCategory:
+    """Resultado do parse de uma categoria; erros do parser saem em records()."""
+
+    def __init__(self, slug: str, text: str, future: Future | None = None):
+        self.slug = slug
+        self._text = text
+        self._future = future
+
+    def done(self) -> bool:
+        return self._future is None or self._future.done()
+
+    def records(self) -> Iterator[dict]:
+        if self._future is None:
+            return STREAM_PARSER_MAP[self.slug](self._text)
+        return _decode(self._future.result())
+
+
+# ── Estágio ────────────────────────────────────────────────────────
+class ParseStage:
+    """
+    Uso:
+        with ParseStage(workers) as stage:
+            for parsed in stage.map(jobs):   # jobs: (slug, texto)
+                bulk_insert(..., parsed.records(), ...)
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS):
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ParseStage":
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            logger.info(f"[PARSE] Parse em paralelo com {self.workers} processos")
+        return self
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def submit(self, slug: str, text: str) -> ParsedCategory:
+        if self._pool is None or slug not in STREAM_PARSER_MAP:
+            return ParsedCategory(slug, text)
+        return ParsedCategory(slug, text, self._pool.submit(parse_batches, slug, text))
+
+    def map(self, jobs: Iterable[tuple[str, str]]) -> Iterator[ParsedCategory]:
+        """
+        Resultados na ordem dos jobs, com até workers * 2 em voo. Os já
+        prontos saem antes de pedir o próximo job: com jobs que chegam aos
+        poucos (downloads em andamento) a carga não espera a janela encher.
+        """
+        window = self.workers * 2 if self._pool is not None else 1
+        pending: deque[ParsedCategory] = deque()
+        for slug, text in jobs:
+            pending.append(self.submit(slug, text))
+            while pending and (len(pending) >= window or pending[0].done()):
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
@@ -1,8 +1,10 @@
 """
 Parsers para cada tipo de arquivo TXT baixado do NBA Elias Stats.
 
-Cada função recebe o texto bruto (str) e retorna uma lista de dicts
-prontos para inserção via SQLAlchemy.
+Cada parser é um gerador: recebe o texto bruto (str) ou um iterável de
+linhas (ex.: arquivo aberto) e produz um dict por registro, sem montar a
+lista inteira. STREAM_PARSER_MAP mapeia slug → gerador (usado na carga em
+lotes); PARSER_MAP tem as mesmas funções devolvendo list[dict].
 
 IMPORTANTE: Os formatos são baseados nos TXT reais baixados do CDN da NBA
 (cdn.nba.com/static/json/staticData/EliasGameStats/00/*.txt).
@@ -11,6 +13,10 @@ IMPORTANTE: Os formatos são baseados nos TXT reais baixados do CDN da NBA
 import re
 import logging
 from datetime import datetime, date
+from functools import lru_cache, wraps
+from typing import Callable, Iterable, Iterator
+
+from layout import FixedLayout, Panels, TokenLayout
 
 logger = logging.getLogger(__name__)
 
@@ -35,18 +41,54 @@ def _safe_float(value: str) -> float | None:
         return None
 
 
+@lru_cache(maxsize=1024)
 def _parse_date(date_str: str) -> date | None:
-    """Converte MM/DD/YYYY para date."""
+    """Converte MM/DD/YYYY para date (cache: as linhas repetem poucas datas)."""
     try:
         return datetime.strptime(date_str.strip(), "%m/%d/%Y").date()
     except (ValueError, AttributeError):
         return None
 
 
-def _clean_lines(text: str) -> list[str]:
-    """Retorna linhas não vazias."""
-    lines = text.split("\n")
-    return [line for line in lines if line.strip()]
+def iter_lines(source: str | Iterable[str]) -> Iterator[str]:
+    """
+    Linhas de um texto (sem copiar o texto inteiro em uma lista) ou de um
+    iterável de linhas, sem o "\n" final.
+    """
+    if not isinstance(source, str):
+        for line in source:
+            yield line.rstrip("\n")
+        return
+    start = 0
+    while True:
+        end = source.find("\n", start)
+        if end < 0:
+            yield source[start:]
+            return
+        yield source[start:end]
+        start = end + 1
+
+
+def _clean_lines(source: str | Iterable[str]) -> Iterator[str]:
+    """Linhas não vazias."""
+    return (line for line in iter_lines(source) if line.strip())
+
+
+def _int_commas(value: str) -> int:
+    """"406,165" → 406165 (levanta ValueError, para uso nos layouts)."""
+    return int(value.replace(",", ""))
+
+
+def _split_name_team(raw: str) -> tuple[str, str | None]:
+    """"Doncic, LA-L" → ("Doncic", "LA-L"); sem vírgula → (raw, None)."""
+    name, sep, team = raw.rpartition(",")
+    if not sep:
+        return raw, None
+    return name.strip(), team.strip().rstrip(".")
+
+
+def _starts_upper(value: str) -> bool:
+    return bool(value) and value[0].isupper()
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -55,59 +97,35 @@ def _clean_lines(text: str) -> list[str]:
 #  DATE       TM  OPP NAME                     (POS)  G MIN  FG FGA ...
 #  02/11/2026 ATL CHA Johnson, Jalen           (F  )  1  34   7  15 ...
 # ══════════════════════════════════════════════════════════════════════
-def parse_boxscore_lines(text: str) -> list[dict]:
+def _boxscore_post(record: dict) -> dict | None:
+    # "Johnson, Jalen           (F  )" → nome + posição
+    name, sep, position = record["player_name"].rpartition("(")
+    if not sep or not position.endswith(")"):
+        return None
+    record["player_name"] = name.strip().rstrip(",").strip()
+    record["position"] = position[:-1].strip()
+    return record
+
+
+BOXSCORE_LAYOUT = TokenLayout(
+    lead=[("game_date", _parse_date), ("team", str), ("opponent", str)],
+    text="player_name",
+    tail=[
+        (name, int)
+        for name in (
+            "games", "minutes", "fg", "fga", "fg3", "f3a", "ft", "fta",
+            "off_reb", "def_reb", "total_reb", "assists", "pf", "dq",
+            "steals", "turnovers", "blocks", "points",
+        )
+    ],
+    required=("game_date",),
+    post=_boxscore_post,
+)
+
+
+def iter_boxscore_lines(source: str | Iterable[str]) -> Iterator[dict]:
     """Parse de estatísticas diárias de jogadores (boxscore lines)."""
-    records = []
-    lines = _clean_lines(text)
-
-    pattern = re.compile(
-        r"(\d{2}/\d{2}/\d{4})\s+"  # DATA
-        r"(\S+)\s+"                 # TIME
-        r"(\S+)\s+"                 # ADVERSÁRIO
-        r"(.+?)\s+"                 # NOME
-        r"\((\S+\s*)\)\s+"          # POSIÇÃO
-        r"(\d+)\s+"                 # G
-        r"(\d+)\s+"                 # MIN
-        r"(\d+)\s+(\d+)\s+"         # FG FGA
-        r"(\d+)\s+(\d+)\s+"         # FG3 F3A
-        r"(\d+)\s+(\d+)\s+"         # FT FTA
-        r"(\d+)\s+(\d+)\s+(\d+)\s+" # OFF DEF TRB
-        r"(\d+)\s+"                 # AST
-        r"(\d+)\s+(\d+)\s+"         # PF DQ
-        r"(\d+)\s+(\d+)\s+(\d+)\s+" # STL TO BLK
-        r"(\d+)"                    # PTS
-    )
-    for line in lines:
-        m = pattern.search(line)
-        if m:
-            records.append({
-                "game_date": _parse_date(m.group(1)),
-                "team": m.group(2).strip(),
-                "opponent": m.group(3).strip(),
-                "player_name": m.group(4).strip().rstrip(",").strip(),
-                "position": m.group(5).strip(),
-                "games": _safe_int(m.group(6)),
-                "minutes": _safe_int(m.group(7)),
-                "fg": _safe_int(m.group(8)),
-                "fga": _safe_int(m.group(9)),
-                "fg3": _safe_int(m.group(10)),
-                "f3a": _safe_int(m.group(11)),
-                "ft": _safe_int(m.group(12)),
-                "fta": _safe_int(m.group(13)),
-                "off_reb": _safe_int(m.group(14)),
-                "def_reb": _safe_int(m.group(15)),
-                "total_reb": _safe_int(m.group(16)),
-                "assists": _safe_int(m.group(17)),
-                "pf": _safe_int(m.group(18)),
-                "dq": _safe_int(m.group(19)),
-                "steals": _safe_int(m.group(20)),
-                "turnovers": _safe_int(m.group(21)),
-                "blocks": _safe_int(m.group(22)),
-                "points": _safe_int(m.group(23)),
-            })
-
-    logger.debug(f"[PARSER] parse_boxscore_lines: {len(records)} registros de {len(lines)} linhas")
-    return records
+    yield from BOXSCORE_LAYOUT.iter_all(_clean_lines(source))
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -115,65 +133,48 @@ def parse_boxscore_lines(text: str) -> list[dict]:
 #  Formato:
 #  Total SAC ACT Achiuwa, Precious, Sac.  48 32  973  144  288 .500  16  54 .296 ...
 # ══════════════════════════════════════════════════════════════════════
-def parse_player_cumulatives(text: str) -> list[dict]:
+def _cumulatives_post(record: dict) -> dict | None:
+    if record["scope"] not in ("Total", "Team"):
+        return None
+    return {
+        "player_name": record["player_name"].rstrip(",").strip(),
+        "team": record["team"],
+        "position": None,
+        **{
+            key: record[key]
+            for key in (
+                "games", "minutes", "fg", "fga", "fg3", "f3a", "ft", "fta",
+                "off_reb", "def_reb", "total_reb", "assists", "pf", "dq",
+                "steals", "turnovers", "blocks", "points",
+            )
+        },
+    }
+
+
+CUMULATIVES_LAYOUT = TokenLayout(
+    lead=[
+        ("scope", str),  # Total | Team
+        ("team", str),
+        ("status", str),  # ACT, TR, NWT, TRC
+    ],
+    text="player_name",
+    tail=[
+        ("games", int), ("gs", int), ("minutes", int),
+        ("fg", int), ("fga", int), ("fg_pct", str),
+        ("fg3", int), ("f3a", int), ("fg3_pct", str),
+        ("ft", int), ("fta", int), ("ft_pct", str),
+        ("off_reb", int), ("def_reb", int), ("total_reb", int),
+        ("assists", int), ("pf", int), ("dq", int),
+        ("steals", int), ("turnovers", int), ("blocks", int),
+        ("points", int), ("ppg", float), ("hi", int),
+    ],
+    post=_cumulatives_post,
+)
+
+
+def iter_player_cumulatives(source: str | Iterable[str]) -> Iterator[dict]:
     """Parse de estatísticas cumulativas de jogadores (season/rookies)."""
-    records = []
-    lines = _clean_lines(text)
-
-    pattern = re.compile(
-        r"^(Total|Team)\s+"        # SCOPE
-        r"(\S+)\s+"                # TM (sigla)
-        r"(\S+)\s+"                # RS (status: ACT, TR, NWT, TRC)
-        r"(.+?)\s+"                # NOME completo com time
-        r"(\d+)\s+"                # G
-        r"(\d+)\s+"                # GS
-        r"(\d+)\s+"                # MIN
-        r"(\d+)\s+(\d+)\s+"        # FG FGA
-        r"(\.\d+|1\.000|---)\s+"   # FG PCT
-        r"(\d+)\s+(\d+)\s+"        # FG3 FG3A
-        r"(\.\d+|1\.000|---)\s+"   # FG3 PCT
-        r"(\d+)\s+(\d+)\s+"        # FT FTA
-        r"(\.\d+|1\.000|---)\s+"   # FT PCT
-        r"(\d+)\s+(\d+)\s+(\d+)\s+"# OFF DEF TREB
-        r"(\d+)\s+"                # AST
-        r"(\d+)\s+(\d+)\s+"        # PF DQ
-        r"(\d+)\s+(\d+)\s+(\d+)\s+"# STL TO BLK
-        r"(\d+)\s+"                # PTS
-        r"([\d\.]+)\s+"            # PPG
-        r"(\d+)"                   # HI
-    )
-
-    for line in lines:
-        m = pattern.search(line)
-        if m:
-            name_raw = m.group(4).strip().rstrip(",").strip()
-            team_abbr = m.group(2).strip()
-            records.append({
-                "player_name": name_raw,
-                "team": team_abbr,
-                "position": None,
-                "games": _safe_int(m.group(5)),
-                "minutes": _safe_int(m.group(7)),
-                "fg": _safe_int(m.group(8)),
-                "fga": _safe_int(m.group(9)),
-                "fg3": _safe_int(m.group(11)),
-                "f3a": _safe_int(m.group(12)),
-                "ft": _safe_int(m.group(14)),
-                "fta": _safe_int(m.group(15)),
-                "off_reb": _safe_int(m.group(17)),
-                "def_reb": _safe_int(m.group(18)),
-                "total_reb": _safe_int(m.group(19)),
-                "assists": _safe_int(m.group(20)),
-                "pf": _safe_int(m.group(21)),
-                "dq": _safe_int(m.group(22)),
-                "steals": _safe_int(m.group(23)),
-                "turnovers": _safe_int(m.group(24)),
-                "blocks": _safe_int(m.group(25)),
-                "points": _safe_int(m.group(26)),
-            })
-
-    logger.debug(f"[PARSER] parse_player_cumulatives: {len(records)} registros de {len(lines)} linhas")
-    return records
+    yield from CUMULATIVES_LAYOUT.iter_all(_clean_lines(source))
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -181,19 +182,29 @@ def parse_player_cumulatives(text: str) -> list[dict]:
 #  Formato:
 #  Atlanta Hawks                   25    406,165 16,247    31    548,915 17,707
 # ══════════════════════════════════════════════════════════════════════
-def parse_attendance(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
-
-    pattern = re.compile(
-        r"^([A-Z][A-Za-z\s\.]+?)\s+"
-        r"(\d+)\s+"                 # HOME G
-        r"([\d,]+)\s+"              # HOME ATT
-        r"([\d,]+)\s+"              # HOME AVG
-        r"(\d+)\s+"                 # ROAD G
-        r"([\d,]+)\s+"              # ROAD ATT
-        r"([\d,]+)\s*$"             # ROAD AVG
-    )
+def _attendance_post(record: dict) -> dict | None:
+    if not _starts_upper(record["team"]):
+        return None
+    overall_g = record["home_games"] + record["road_games"]
+    overall_att = record["home_total"] + record["road_total"]
+    record["overall_games"] = overall_g
+    record["overall_total"] = overall_att
+    record["overall_avg"] = overall_att // overall_g if overall_g else None
+    return record
+
+
+ATTENDANCE_LAYOUT = TokenLayout(
+    text="team",
+    tail=[
+        ("home_games", int), ("home_total", _int_commas), ("home_avg", _int_commas),
+        ("road_games", int), ("road_total", _int_commas), ("road_avg", _int_commas),
+    ],
+    post=_attendance_post,
+)
+
+
+def iter_attendance(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
 
     for line in lines:
         stripped = line.strip()
@@ -202,36 +213,10 @@ def parse_attendance(text: str) -> list[dict]:
         if "HOME ATTENDANCE" in stripped or "ROAD ATTENDANCE" in stripped:
             continue
 
-        m = pattern.match(stripped)
-        if m:
-            team_name = m.group(1).strip()
-            home_g = _safe_int(m.group(2))
-            home_att = _safe_int(m.group(3))
-            home_avg = _safe_int(m.group(4))
-            road_g = _safe_int(m.group(5))
-            road_att = _safe_int(m.group(6))
-            road_avg = _safe_int(m.group(7))
-
-            overall_g = (home_g or 0) + (road_g or 0)
-            overall_att = (home_att or 0) + (road_att or 0)
-            overall_avg = overall_att // overall_g if overall_g else None
-
-            records.append({
-                "team": team_name,
-                "home_games": home_g,
-                "home_total": home_att,
-                "home_avg": home_avg,
-                "road_games": road_g,
-                "road_total": road_att,
-                "road_avg": road_avg,
-                "overall_games": overall_g,
-                "overall_total": overall_att,
-                "overall_avg": overall_avg,
-                "raw_line": stripped,
-            })
-
-    logger.debug(f"[PARSER] parse_attendance: {len(records)} registros de {len(lines)} linhas")
-    return records
+        record = ATTENDANCE_LAYOUT.parse(stripped)
+        if record:
+            record["raw_line"] = stripped
+            yield record
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -240,21 +225,10 @@ def parse_attendance(text: str) -> list[dict]:
 #  Atlanta        107 27 22 26 32            Daniels 21       Johnson 13       Johnson 9
 #  Charlotte      110 35 23 31 21            Miller 31        Hall 10          Ball 6
 # ══════════════════════════════════════════════════════════════════════
-def parse_scores_leaders(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
-
-    # Header da data
+def iter_scores_leaders(source: str | Iterable[str]) -> Iterator[dict]:
+    # Header da data (vem antes dos jogos; vale o primeiro encontrado)
     date_val = None
-    for line in lines:
-        dm = re.search(r"GAMES OF\s+(\w+),\s+(\w+)\s+(\d+),\s+(\d{4})", line, re.IGNORECASE)
-        if dm:
-            try:
-                date_str = f"{dm.group(2)} {dm.group(3)}, {dm.group(4)}"
-                date_val = datetime.strptime(date_str, "%B %d, %Y").date()
-            except ValueError:
-                date_val = None
-            break
+    date_seen = False
 
     # Captura linhas com time e score
     score_pattern = re.compile(
@@ -263,21 +237,33 @@ def parse_scores_leaders(text: str) -> list[dict]:
         r"(\d+)\s+(\d+)\s+(\d+)\s+(\d+)"  # Q1 Q2 Q3 Q4
     )
 
-    game_lines = []
-    for line in lines:
+    away = None
+    for line in _clean_lines(source):
+        if not date_seen:
+            dm = re.search(r"GAMES OF\s+(\w+),\s+(\w+)\s+(\d+),\s+(\d{4})", line, re.IGNORECASE)
+            if dm:
+                date_seen = True
+                try:
+                    date_str = f"{dm.group(2)} {dm.group(3)}, {dm.group(4)}"
+                    date_val = datetime.strptime(date_str, "%B %d, %Y").date()
+                except ValueError:
+                    date_val = None
+
         m = score_pattern.match(line.strip())
-        if m:
-            game_lines.append({
-                "team": m.group(1).strip(),
-                "score": _safe_int(m.group(2)),
-                "raw_line": line.strip(),
-            })
-
-    # Os jogos vêm em pares (away, home)
-    for i in range(0, len(game_lines) - 1, 2):
-        away = game_lines[i]
-        home = game_lines[i + 1]
-        records.append({
+        if not m:
+            continue
+        game = {
+            "team": m.group(1).strip(),
+            "score": _safe_int(m.group(2)),
+            "raw_line": line.strip(),
+        }
+
+        # Os jogos vêm em pares (away, home)
+        if away is None:
+            away = game
+            continue
+        home = game
+        yield {
             "game_date": date_val,
             "away_team": away["team"],
             "home_team": home["team"],
@@ -287,10 +273,8 @@ def parse_scores_leaders(text: str) -> list[dict]:
             "leader_rebounds": None,
             "leader_assists": None,
             "raw_line": f"{away['raw_line']} | {home['raw_line']}",
-        })
-
-    logger.debug(f"[PARSER] parse_scores_leaders: {len(records)} registros de {len(lines)} linhas")
-    return records
+        }
+        away = None
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -299,9 +283,8 @@ def parse_scores_leaders(text: str) -> list[dict]:
 #  Minutes -- 52, Maxey, PHI vs. ATL, 11/30 (2 OT)
 #  Fewest Field Goals -- 23, Brooklyn at NY, 1/21
 # ══════════════════════════════════════════════════════════════════════
-def parse_highs_lows(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+def iter_highs_lows(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
 
     for line in lines:
         stripped = line.strip()
@@ -335,7 +318,7 @@ def parse_highs_lows(text: str) -> list[dict]:
                     player_name = tm.group(1).strip()
                     opponent = tm.group(2).strip()
 
-            records.append({
+            yield {
                 "category": category,
                 "stat_type": stat_type,
                 "value": value,
@@ -344,10 +327,7 @@ def parse_highs_lows(text: str) -> list[dict]:
                 "opponent": opponent,
                 "game_date": None,
                 "raw_line": stripped,
-            })
-
-    logger.debug(f"[PARSER] parse_highs_lows: {len(records)} registros de {len(lines)} linhas")
-    return records
+            }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -356,18 +336,35 @@ def parse_highs_lows(text: str) -> list[dict]:
 #  SCORING AVERAGE        G   FG  FT  PTS  AVG     REBOUNDS PER GAME ...
 #  Doncic, LA-L          42  437 356 1379 32.8     Jokic, Den.       39 ...
 # ══════════════════════════════════════════════════════════════════════
-def parse_league_leaders(text: str) -> list[dict]:
-    """Parse de league leaders. Formato multi-coluna com alinhamento fixo."""
-    records = []
-    lines = _clean_lines(text)
+LEADER_CATEGORIES = (
+    "SCORING AVERAGE", "REBOUNDS PER GAME", "ASSISTS PER GAME",
+    "FIELD GOAL PCT.", "3-PT FIELD GOAL PCT.", "FREE THROW PCT.",
+    "STEALS PER GAME", "BLOCKS PER GAME", "MINUTES PER GAME",
+)
 
-    current_categories = []
 
-    header_pattern = re.compile(
-        r"(SCORING AVERAGE|REBOUNDS PER GAME|ASSISTS PER GAME|"
-        r"FIELD GOAL PCT\.|3-PT FIELD GOAL PCT\.|FREE THROW PCT\.|"
-        r"STEALS PER GAME|BLOCKS PER GAME|MINUTES PER GAME)"
-    )
+def _leader_post(record: dict) -> dict | None:
+    # Texto = "Doncic, LA-L          42  437 356 1379"; o nome vai até o
+    # primeiro espaço duplo, o resto são as colunas do painel
+    player = record["player"].split("  ", 1)[0]
+    if not player or not player[0].isalpha():
+        return None
+    record["player_name"], record["team"] = _split_name_team(player)
+    return record
+
+
+LEADER_LAYOUT = TokenLayout(
+    text="player",
+    tail=[("value", float)],
+    post=_leader_post,
+)
+
+
+def iter_league_leaders(source: str | Iterable[str]) -> Iterator[dict]:
+    """Parse de league leaders. Painéis lado a lado, um por categoria do header."""
+    lines = _clean_lines(source)
+
+    panels = None
 
     for line in lines:
         stripped = line.strip()
@@ -375,56 +372,25 @@ def parse_league_leaders(text: str) -> list[dict]:
         if stripped.startswith("INCLUDES") or stripped.startswith("ROOKIE LEADERS"):
             continue
 
-        # Checa se é uma linha de header
-        headers = header_pattern.findall(stripped)
-        if headers:
-            current_categories = headers
+        # Header: cada categoria abre um painel na sua coluna
+        if any(label in line for label in LEADER_CATEGORIES):
+            panels = Panels.from_header(line, LEADER_CATEGORIES)
             continue
 
-        if not current_categories:
+        if panels is None:
             continue
 
-        # Divide a linha em segmentos por espaçamento largo (4+ espaços)
-        segments = re.split(r"\s{4,}", stripped)
-
-        for i, segment in enumerate(segments):
-            segment = segment.strip()
-            if not segment:
-                continue
-
-            cat = current_categories[i] if i < len(current_categories) else (
-                current_categories[-1] if current_categories else None
-            )
-
-            # Extrai: "Player, Team    NUM NUM ... AVG"
-            pm = re.match(r"(.+?)\s{2,}([\d\.\s]+)$", segment)
-            if pm:
-                player_part = pm.group(1).strip()
-                nums_part = pm.group(2).strip().split()
-
-                if nums_part:
-                    value = _safe_float(nums_part[-1])
-
-                    # Separa nome e time: "Doncic, LA-L" ou "G. Antetokounmpo, Mil"
-                    name_parts = player_part.rsplit(",", 1)
-                    if len(name_parts) == 2:
-                        player_name = name_parts[0].strip()
-                        team = name_parts[1].strip().rstrip(".")
-                    else:
-                        player_name = player_part
-                        team = None
-
-                    records.append({
-                        "stat_category": cat,
-                        "rank": None,
-                        "player_name": player_name,
-                        "team": team,
-                        "value": value,
-                        "raw_line": segment.strip(),
-                    })
-
-    logger.debug(f"[PARSER] parse_league_leaders: {len(records)} registros de {len(lines)} linhas")
-    return records
+        for category, segment in panels.split(line):
+            record = LEADER_LAYOUT.parse(segment)
+            if record:
+                yield {
+                    "stat_category": category,
+                    "rank": None,
+                    "player_name": record["player_name"],
+                    "team": record["team"],
+                    "value": record["value"],
+                    "raw_line": segment.strip(),
+                }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -434,63 +400,59 @@ def parse_league_leaders(text: str) -> list[dict]:
 #  Name                     AST   TO RATIO     Name                     STL   TO RATIO
 #  Pritchard, Bos.          283   63  4.49     Wallace, OKC.            108   48  2.25
 # ══════════════════════════════════════════════════════════════════════
-def parse_ratios_players(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+# Painéis do ratios: pelo título ("Assists Per Turnover   Steals Per Turnover")
+# ou pelo header de colunas ("Name ... Name")
+RATIO_PANEL_LABELS = ("Assists Per Turnover", "Steals Per Turnover")
 
+RATIO_LAYOUT = TokenLayout(
+    text="name",
+    tail=[("val1", int), ("val2", int), ("ratio", float)],
+)
+
+
+def _ratio_segments(lines: Iterable[str]) -> Iterator[str]:
+    """(segmento, linha) de cada painel das linhas de dados do ratios."""
+    panels = None
     for line in lines:
         stripped = line.strip()
-
-        if stripped.startswith("INCLUDES") or stripped.startswith("Name"):
+        if stripped.startswith("INCLUDES"):
             continue
-        if stripped in ("Assists Per Turnover", "Steals Per Turnover"):
+        if "Per Turnover" in line:
+            panels = Panels.from_header(line, RATIO_PANEL_LABELS) or panels
             continue
-        if "Assists Per Turnover" in stripped and "Steals Per Turnover" in stripped:
+        if stripped.startswith("Name"):
+            panels = Panels.from_header(line, ("Name",)) or panels
             continue
 
-        # Dados lado a lado; divide por 4+ espaços
-        segments = re.split(r"\s{4,}", stripped)
+        for _, segment in (panels.split(line) if panels else [(None, line)]):
+            yield segment
 
-        for seg in segments:
-            seg = seg.strip()
-            if not seg or seg.startswith("Name"):
-                continue
 
-            # "Pritchard, Bos.          283   63  4.49"
-            m = re.match(r"(.+?)\s{2,}(\d+)\s+(\d+)\s+([\d\.]+)", seg)
-            if m:
-                player_raw = m.group(1).strip()
-                val1 = _safe_int(m.group(2))
-                val2 = _safe_int(m.group(3))
-                ratio = _safe_float(m.group(4))
-
-                name_parts = player_raw.rsplit(",", 1)
-                if len(name_parts) == 2:
-                    player_name = name_parts[0].strip()
-                    team = name_parts[1].strip().rstrip(".")
-                else:
-                    player_name = player_raw
-                    team = None
-
-                records.append({
-                    "player_name": player_name,
-                    "team": team,
-                    "games": None,
-                    "minutes": None,
-                    "fg_pct": None,
-                    "fg3_pct": None,
-                    "ft_pct": None,
-                    "ppg": ratio,
-                    "rpg": _safe_float(str(val1)) if val1 else None,
-                    "apg": _safe_float(str(val2)) if val2 else None,
-                    "spg": None,
-                    "bpg": None,
-                    "topg": None,
-                    "raw_line": seg.strip(),
-                })
-
-    logger.debug(f"[PARSER] parse_ratios_players: {len(records)} registros de {len(lines)} linhas")
-    return records
+def iter_ratios_players(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
+
+    for seg in _ratio_segments(lines):
+        m = RATIO_LAYOUT.parse(seg)
+        if m:
+            player_name, team = _split_name_team(m["name"])
+            val1, val2 = m["val1"], m["val2"]
+
+            yield {
+                "player_name": player_name,
+                "team": team,
+                "games": None,
+                "minutes": None,
+                "fg_pct": None,
+                "fg3_pct": None,
+                "ft_pct": None,
+                "ppg": m["ratio"],
+                "rpg": float(val1) if val1 else None,
+                "apg": float(val2) if val2 else None,
+                "spg": None,
+                "bpg": None,
+                "topg": None,
+                "raw_line": seg.strip(),
+            }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -498,47 +460,27 @@ def parse_ratios_players(text: str) -> list[dict]:
 #  Formato lado a lado:
 #  Denver                  1539  701  2.20     Oklahoma City            544  682  0.80
 # ══════════════════════════════════════════════════════════════════════
-def parse_ratios_teams(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+def iter_ratios_teams(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
 
-    for line in lines:
-        stripped = line.strip()
+    for seg in _ratio_segments(lines):
+        m = RATIO_LAYOUT.parse(seg)
+        if m and _starts_upper(m["name"]):
+            val1, val2 = m["val1"], m["val2"]
 
-        if (stripped.startswith("INCLUDES") or stripped.startswith("Name")
-                or "Assists" in stripped or "Steals" in stripped):
-            continue
-
-        segments = re.split(r"\s{4,}", stripped)
-
-        for seg in segments:
-            seg = seg.strip()
-            if not seg or seg.startswith("Name"):
-                continue
-
-            m = re.match(r"([A-Z][A-Za-z\.\s]+?)\s{2,}(\d+)\s+(\d+)\s+([\d\.]+)", seg)
-            if m:
-                team_name = m.group(1).strip()
-                val1 = _safe_int(m.group(2))
-                val2 = _safe_int(m.group(3))
-                ratio = _safe_float(m.group(4))
-
-                records.append({
-                    "team": team_name,
-                    "games": None,
-                    "wins": None,
-                    "losses": None,
-                    "fg_pct": None,
-                    "fg3_pct": None,
-                    "ft_pct": None,
-                    "ppg": ratio,
-                    "rpg": _safe_float(str(val1)) if val1 else None,
-                    "apg": _safe_float(str(val2)) if val2 else None,
-                    "raw_line": seg.strip(),
-                })
-
-    logger.debug(f"[PARSER] parse_ratios_teams: {len(records)} registros de {len(lines)} linhas")
-    return records
+            yield {
+                "team": m["name"],
+                "games": None,
+                "wins": None,
+                "losses": None,
+                "fg_pct": None,
+                "fg3_pct": None,
+                "ft_pct": None,
+                "ppg": m["ratio"],
+                "rpg": float(val1) if val1 else None,
+                "apg": float(val2) if val2 else None,
+                "raw_line": seg.strip(),
+            }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -546,9 +488,8 @@ def parse_ratios_teams(text: str) -> list[dict]:
 #  Formato:
 #  Apr 20 MIA 100 at CLE 121
 # ══════════════════════════════════════════════════════════════════════
-def parse_playoff_schedule(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+def iter_playoff_schedule(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
     current_round = None
     current_series = None
 
@@ -583,7 +524,7 @@ def parse_playoff_schedule(text: str) -> list[dict]:
             stripped
         )
         if m:
-            records.append({
+            yield {
                 "round_name": current_round,
                 "game_date": None,
                 "away_team": m.group(2).strip(),
@@ -592,10 +533,7 @@ def parse_playoff_schedule(text: str) -> list[dict]:
                 "home_score": _safe_int(m.group(5)),
                 "series_status": current_series,
                 "raw_line": stripped,
-            })
-
-    logger.debug(f"[PARSER] parse_playoff_schedule: {len(records)} registros de {len(lines)} linhas")
-    return records
+            }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -603,80 +541,58 @@ def parse_playoff_schedule(text: str) -> list[dict]:
 #  Formato lado-a-lado (East à esquerda, West à direita):
 #  Boston              35 19  .648    -  18- 9 17-10     0- 0  7-3   Won   1
 # ══════════════════════════════════════════════════════════════════════
-def parse_standings(text: str) -> list[dict]:
-    records = []
-    lines = text.split("\n")
-
-    current_east_div = None
-    current_west_div = None
-
-    for line in lines:
-        if not line.strip():
-            continue
-
+# East nas colunas 0-84, West a partir da 85
+STANDINGS_PANELS = Panels((0, 85), ("EASTERN", "WESTERN"))
+
+# Colunas de cada painel (fim de cada coluna; números alinhados à direita)
+STANDINGS_LAYOUT = FixedLayout(
+    [
+        ("team", 20, str.strip),
+        ("wins", 22, int),
+        ("losses", 25, int),
+        ("pct", 31, float),
+        ("games_behind", 36, str.strip),
+        ("home_record", 43, str.strip),
+        ("road_record", 49, str.strip),
+        ("neutral_record", 58, str.strip),
+        ("last_10", 63, str.strip),
+        ("streak_dir", 70, str.strip),  # Won | Lost
+        ("streak_n", 73, int),
+    ],
+    post=lambda r: r if r["streak_dir"] in ("Won", "Lost") and _starts_upper(r["team"]) else None,
+)
+
+
+def iter_standings(source: str | Iterable[str]) -> Iterator[dict]:
+    divisions = {"EASTERN": None, "WESTERN": None}
+
+    for line in _clean_lines(source):
         if "EASTERN CONFERENCE" in line and "WESTERN CONFERENCE" in line:
             continue
 
-        # Detecta divisões
+        # Detecta divisões (uma por painel)
         if "DIVISION" in line:
-            parts = re.findall(r"(\w[\w\s]+DIVISION)", line)
-            if len(parts) >= 2:
-                current_east_div = parts[0].strip()
-                current_west_div = parts[1].strip()
-            elif len(parts) == 1:
-                p = parts[0].strip()
-                if "ATLANTIC" in p or "CENTRAL" in p or "SOUTHEAST" in p:
-                    current_east_div = p
-                else:
-                    current_west_div = p
+            for conference, segment in STANDINGS_PANELS.split(line):
+                end = segment.find("DIVISION")
+                if end >= 0:
+                    divisions[conference] = segment[:end + len("DIVISION")].strip()
             continue
 
-        if re.match(r"^\s*W\s+L\s+PCT", line.strip()) or line.strip().startswith("Scheduled"):
+        stripped = line.strip()
+        if stripped.startswith("W ") or stripped.startswith("Scheduled"):
             continue
 
-        team_pattern = re.compile(
-            r"([A-Z][A-Za-z\.\s]+?)\s+"
-            r"(\d+)\s+(\d+)\s+"           # W L
-            r"(\.\d+)\s+"                 # PCT
-            r"([\d\.]+|-+)\s+"            # GB
-            r"(\d+\s*-\s*\d+)\s+"         # HOME
-            r"(\d+\s*-\s*\d+)\s+"         # ROAD
-            r"(\d+\s*-\s*\d+)\s+"         # NEUTRAL
-            r"(\d+\s*-\s*\d+)\s+"         # LAST-10
-            r"(Won|Lost)\s+"              # STREAK direction
-            r"(\d+)"                      # STREAK count
-        )
-
-        # Divide a linha: cols 0-84 = East, cols 85+ = West
-        left_part = line[:85] if len(line) > 85 else line
-        right_part = line[85:] if len(line) > 85 else ""
-
-        for part, conference, division in [
-            (left_part, "EASTERN", current_east_div),
-            (right_part, "WESTERN", current_west_div),
-        ]:
-            if not part.strip():
-                continue
-
-            m = team_pattern.search(part)
-            if m:
-                records.append({
-                    "conference": conference,
-                    "division": division,
-                    "team": m.group(1).strip(),
-                    "wins": _safe_int(m.group(2)),
-                    "losses": _safe_int(m.group(3)),
-                    "pct": _safe_float(m.group(4)),
-                    "games_behind": m.group(5).strip() if m.group(5).strip() != "-" else "0",
-                    "home_record": m.group(6).strip(),
-                    "road_record": m.group(7).strip(),
-                    "last_10": m.group(9).strip(),
-                    "streak": f"{m.group(10)} {m.group(11)}",
-                    "raw_line": part.strip(),
-                })
-
-    logger.debug(f"[PARSER] parse_standings: {len(records)} registros de {len(lines)} linhas")
-    return records
+        for conference, part in STANDINGS_PANELS.split(line):
+            record = STANDINGS_LAYOUT.parse(part)
+            if record:
+                record["conference"] = conference
+                record["division"] = divisions[conference]
+                if record["games_behind"] == "-":
+                    record["games_behind"] = "0"
+                record["streak"] = f"{record.pop('streak_dir')} {record.pop('streak_n')}"
+                del record["neutral_record"]
+                record["raw_line"] = part.strip()
+                yield record
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -685,9 +601,8 @@ def parse_standings(text: str) -> list[dict]:
 #     ATL   BKN   CHI   ...
 #  BOS  1 --  2  0  2  2 ...  35 19  .648   -    7-3  Won   1
 # ══════════════════════════════════════════════════════════════════════
-def parse_head_to_head(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+def iter_head_to_head(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
 
     # Extrair siglas do header (2 linhas com apenas siglas)
     team_columns = []
@@ -733,13 +648,13 @@ def parse_head_to_head(text: str) -> list[dict]:
                         w_val = _safe_int(w_tok)
                         l_val = _safe_int(l_tok)
                         if w_val is not None and l_val is not None and w_val <= 4 and l_val <= 4:
-                            records.append({
+                            yield {
                                 "team": team_abbr,
                                 "opponent": team_columns[opp_idx] if opp_idx < len(team_columns) else "?",
                                 "wins": w_val,
                                 "losses": l_val,
                                 "raw_line": stripped[:60],
-                            })
+                            }
                             tok_idx += 2
                             opp_idx += 1
                         else:
@@ -748,9 +663,6 @@ def parse_head_to_head(text: str) -> list[dict]:
                     else:
                         break
 
-    logger.debug(f"[PARSER] parse_head_to_head: {len(records)} registros de {len(lines)} linhas")
-    return records
-
 
 # ══════════════════════════════════════════════════════════════════════
 #  15. OFFENSIVE/DEFENSIVE (Teams' Statistics + Opponents')
@@ -758,9 +670,8 @@ def parse_head_to_head(text: str) -> list[dict]:
 #  TEAM     G   MADE  ATT. PCT. MADE  ATT. PCT.  MADE  ATT. PCT.   OFF. DEF. TOT. ...
 #  Den.    55   2356 4761 .495   755 1910 .395   1153 1423 .810    526 1821 2347 ...
 # ══════════════════════════════════════════════════════════════════════
-def parse_offensive_defensive(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+def iter_offensive_defensive(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
     current_type = None
 
     for line in lines:
@@ -789,7 +700,7 @@ def parse_offensive_defensive(text: str) -> list[dict]:
             try:
                 games = _safe_int(parts[1])
                 if games and 0 < games < 100:
-                    records.append({
+                    yield {
                         "team": team_abbr,
                         "stat_type": current_type,
                         "games": games,
@@ -811,14 +722,14 @@ def parse_offensive_defensive(text: str) -> list[dict]:
                         "turnovers": _safe_int(parts[18]),
                         "points": _safe_int(parts[20]),
                         "raw_line": stripped,
-                    })
+                    }
             except (ValueError, IndexError):
                 continue
         elif current_type == "DEFENSE" and len(parts) >= 19:
             try:
                 fg = _safe_int(parts[1])
                 if fg and fg > 100:
-                    records.append({
+                    yield {
                         "team": team_abbr,
                         "stat_type": current_type,
                         "games": None,
@@ -840,13 +751,10 @@ def parse_offensive_defensive(text: str) -> list[dict]:
                         "turnovers": None,
                         "points": _safe_int(parts[-3]) if len(parts) >= 19 else None,
                         "raw_line": stripped,
-                    })
+                    }
             except (ValueError, IndexError):
                 continue
 
-    logger.debug(f"[PARSER] parse_offensive_defensive: {len(records)} registros de {len(lines)} linhas")
-    return records
-
 
 # ══════════════════════════════════════════════════════════════════════
 #  16. MISCELLANEOUS
@@ -854,9 +762,8 @@ def parse_offensive_defensive(text: str) -> list[dict]:
 #  TEAM                    OWN    OPP.    OWN   OPP.    OWN   OPP. ...
 #  Atlanta               117.3  118.6    .472  .476    14.3  15.9 ...
 # ══════════════════════════════════════════════════════════════════════
-def parse_miscellaneous(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+def iter_miscellaneous(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
 
     skip_keywords = (
         "INCLUDES", "TEAM", "COMPOSITE", "* -", "REBOUND PERC",
@@ -875,15 +782,12 @@ def parse_miscellaneous(text: str) -> list[dict]:
         if m:
             team_name = m.group(1).strip()
             if len(team_name) > 2:
-                records.append({
+                yield {
                     "stat_category": "Team Miscellaneous",
                     "value": m.group(2).strip()[:200],
                     "description": None,
                     "raw_line": stripped,
-                })
-
-    logger.debug(f"[PARSER] parse_miscellaneous: {len(records)} registros de {len(lines)} linhas")
-    return records
+                }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -892,9 +796,17 @@ def parse_miscellaneous(text: str) -> list[dict]:
 #  Team                  InPaint  PerGame PctofTot   TotPts    Games   Tot/Gm
 #  New Orleans              3200   57.143   49.868     6417       56  114.589
 # ══════════════════════════════════════════════════════════════════════
-def parse_opponent_points(text: str) -> list[dict]:
-    records = []
-    lines = _clean_lines(text)
+OPPONENT_POINTS_LAYOUT = TokenLayout(
+    text="team",
+    tail=[
+        ("in_paint", int), ("per_game", float), ("pct_of_total", float),
+        ("total_points", int), ("games", int), ("per_game_total", float),
+    ],
+)
+
+
+def iter_opponent_points(source: str | Iterable[str]) -> Iterator[dict]:
+    lines = _clean_lines(source)
 
     skip_keywords = ("INCLUDES", "Team", "TOTALS", "Points-in", "Fast Break", "Second Chance")
 
@@ -904,63 +816,68 @@ def parse_opponent_points(text: str) -> list[dict]:
         if any(stripped.startswith(kw) for kw in skip_keywords):
             continue
 
-        m = re.match(
-            r"^([A-Z][A-Za-z\.\s]+?)\s{2,}(\d+)\s+([\d\.]+)\s+([\d\.]+)\s+(\d+)\s+(\d+)\s+([\d\.]+)",
-            stripped
-        )
-        if m:
-            records.append({
-                "team": m.group(1).strip(),
-                "opp_fg": _safe_int(m.group(2)),
+        m = OPPONENT_POINTS_LAYOUT.parse(stripped)
+        if m and _starts_upper(m["team"]):
+            yield {
+                "team": m["team"],
+                "opp_fg": m["in_paint"],
                 "opp_fga": None,
-                "opp_fg_pct": _safe_float(m.group(3)),
+                "opp_fg_pct": m["per_game"],
                 "opp_fg3": None,
                 "opp_f3a": None,
-                "opp_fg3_pct": _safe_float(m.group(4)),
+                "opp_fg3_pct": m["pct_of_total"],
                 "opp_ft": None,
                 "opp_fta": None,
                 "opp_ft_pct": None,
-                "opp_points": _safe_int(m.group(5)),
+                "opp_points": m["total_points"],
                 "raw_line": stripped,
-            })
-
-    logger.debug(f"[PARSER] parse_opponent_points: {len(records)} registros de {len(lines)} linhas")
-    return records
+            }
 
 
 # ══════════════════════════════════════════════════════════════════════
 #  Parser genérico — usado quando não existe parser específico
 # ══════════════════════════════════════════════════════════════════════
-def parse_generic(text: str) -> list[dict]:
+def iter_generic(source: str | Iterable[str]) -> Iterator[dict]:
     """Faz parse genérico — cada linha se torna um registro raw."""
-    records = []
-    for line in _clean_lines(text):
+    for line in _clean_lines(source):
         if not line.strip().startswith("INCLUDES") and len(line.strip()) > 3:
-            records.append({"raw_line": line.strip()})
-    return records
-
-
-# ══════════════════════════════════════════════════════════════════════
-#  Mapeamento slug → função parser
-# ══════════════════════════════════════════════════════════════════════
-PARSER_MAP = {
-    "latest_boxscore_lines": parse_boxscore_lines,
-    "alphabetical_player_cumulatives": parse_player_cumulatives,
-    "alphabetical_rookie_cumulatives": parse_player_cumulatives,
-    "attendance": parse_attendance,
-    "latest_scores_and_leaders": parse_scores_leaders,
-    "single_game_highs_lows": parse_highs_lows,
-    "top_10_league_leaders": parse_league_leaders,
-    "top_20_league_leaders": parse_league_leaders,
-    "rookie_league_leaders": parse_league_leaders,
-    "ratios_players": parse_ratios_players,
-    "ratios_teams": parse_ratios_teams,
-    "playoff_schedule_results": parse_playoff_schedule,
-    "standings": parse_standings,
-    "head_to_head_win_grid": parse_head_to_head,
-    "offensive_defensive": parse_offensive_defensive,
-    "miscellaneous": parse_miscellaneous,
-    "opponent_points_breakdown": parse_opponent_points,
-    "team_boxscore_lines": parse_boxscore_lines,
-    "team_cumulatives": parse_generic,
+            yield {"raw_line": line.strip()}
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Mapeamento slug → parser
+# ══════════════════════════════════════════════════════════════════════
+STREAM_PARSER_MAP: dict[str, Callable[..., Iterator[dict]]] = {
+    "latest_boxscore_lines": iter_boxscore_lines,
+    "alphabetical_player_cumulatives": iter_player_cumulatives,
+    "alphabetical_rookie_cumulatives": iter_player_cumulatives,
+    "attendance": iter_attendance,
+    "latest_scores_and_leaders": iter_scores_leaders,
+    "single_game_highs_lows": iter_highs_lows,
+    "top_10_league_leaders": iter_league_leaders,
+    "top_20_league_leaders": iter_league_leaders,
+    "rookie_league_leaders": iter_league_leaders,
+    "ratios_players": iter_ratios_players,
+    "ratios_teams": iter_ratios_teams,
+    "playoff_schedule_results": iter_playoff_schedule,
+    "standings": iter_standings,
+    "head_to_head_win_grid": iter_head_to_head,
+    "offensive_defensive": iter_offensive_defensive,
+    "miscellaneous": iter_miscellaneous,
+    "opponent_points_breakdown": iter_opponent_points,
+    "team_boxscore_lines": iter_boxscore_lines,
+    "team_cumulatives": iter_generic,
 }
+
+
+def _as_list(stream: Callable[..., Iterator[dict]]) -> Callable[[str], list[dict]]:
+    """Versão do gerador que devolve a lista inteira (benchmarks, testes manuais)."""
+    @wraps(stream)
+    def parse(text: str) -> list[dict]:
+        records = list(stream(text))
+        logger.debug("[PARSER] %s: %d registros", stream.__name__, len(records))
+        return records
+    return parse
+
+
+PARSER_MAP = {slug: _as_list(stream) for slug, stream in STREAM_PARSER_MAP.items()}
@@ -0,0 +1,568 @@
+"""
+Parse e carga das categorias baixadas — sem navegador.
+
+Usado pelo main.py (com os downloads em andamento, ver run_pipelined) e
+pelo ingest.py (TXT já baixados): nada aqui importa Selenium ou
+webdriver_manager.
+
+Estágios (run_pipelined), ligados por Channels de PIPELINE_QUEUE_SIZE itens:
+  download  produce(emit) numa thread "download"; o ConcurrentDownloader
+            entrega cada resultado assim que termina (o prazo cobre só os
+            downloads, não o tempo bloqueado no emit)
+  parse     thread "parse" (_parse_stage): lê download→parse e envia para
+            parse→carga ("category", ...), lotes de LOAD_BATCH_SIZE
+            registros e ("end", None) ou ("error", e)
+  carga     save_to_database, na thread de quem chamou: um savepoint por
+            categoria e uma única publicação + commit no fim
+
+Com a fila cheia, put() bloqueia: a carga lenta segura o parse, e o parse
+lento segura o emit — a memória em trânsito é limitada pelas filas, não
+pelo número de categorias.
+
+Falhas:
+  - erro de download: downloads.fail(e) → o parse repassa com fail(e) → a
+    carga relança e desfaz o run inteiro
+  - erro de parse de uma categoria: chega como ("error", e) e desfaz só o
+    savepoint dela
+  - erro na carga: rollback e cancel() nos dois Channels; o put()
+    bloqueado acorda com Cancelled, que o parse e o produtor tratam como
+    saída silenciosa, e run_pipelined espera as duas threads antes de
+    relançar
+"""
+
+import queue
+import time
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy import tuple_
+
+from config import LOAD_BATCH_SIZE, PARSE_WORKERS, PIPELINE_QUEUE_SIZE
+from database import get_session, CategoryCurrent, ScrapeRun, RawData, MODEL_MAP
+from parser import STREAM_PARSER_MAP
+from parse_stage import ParseStage
+from http_cache import content_hash
+from spool import byte_size, peak_rss_mb, read_text
+from metrics import StageMetrics
+from loader import batched, bulk_insert
+from history import ensure_partition, publish
+from game_log import SOURCE_SLUG as GAME_LOG_SOURCE, append_game_log
+from rolling import update_rolling
+
+logger = logging.getLogger(__name__)
+
+
+# ── Execuções ──────────────────────────────────────────────────────
+def start_run(started_at: datetime | None = None) -> int:
+    """Registra uma execução (scrape_runs) e devolve o id."""
+    session = get_session()
+    try:
+        run = ScrapeRun(started_at=started_at or datetime.utcnow(), status="running")
+        session.add(run)
+        session.commit()
+        return run.id
+    finally:
+        session.close()
+
+
+def finish_run(
+    run_id: int,
+    status: str,
+    categories: int = 0,
+    error: str | None = None,
+    stages: StageMetrics | None = None,
+):
+    """
+    Fecha a execução com o status final (success | error). Com `stages`,
+    grava as métricas por estágio (scrape_run_stages) na mesma transação
+    e exporta o arquivo do Prometheus (PROMETHEUS_TEXTFILE).
+    """
+    session = get_session()
+    try:
+        run = session.get(ScrapeRun, run_id)
+        if run:
+            run.status = status
+            run.finished_at = datetime.utcnow()
+            run.categories_scraped = categories
+            run.error_message = error
+            if stages is not None:
+                stages.save(session, run_id)
+            session.commit()
+    finally:
+        session.close()
+
+    if stages is not None:
+        totals = stages.totals()
+        logger.info(
+            "[METRICS] Tempo por estágio — "
+            + ", ".join(f"{stage}: {seconds:.2f}s" for stage, seconds in totals.items())
+        )
+        try:
+            stages.write_textfile(run_id, status)
+        except OSError as e:
+            logger.warning(f"[METRICS] Falha ao exportar para o Prometheus: {e}")
+
+
+# ── Filas entre estágios ──────────────────────────────────────────
+class Cancelled(Exception):
+    """O consumidor do Channel desistiu (erro no estágio seguinte)."""
+
+
+class _Failed:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_CLOSED = object()
+
+
+class Channel:
+    """
+    Fila limitada entre duas threads do pipeline. put() bloqueia com a fila
+    cheia (back-pressure: o estágio rápido espera o lento em vez de
+    acumular dados em memória). O produtor termina com close() — ou
+    fail(e), que relança `e` no consumidor —, e o consumidor que desiste
+    chama cancel(): o próximo put() — e a leitura por outra thread que
+    ainda esteja esperando itens — levanta Cancelled.
+
+    put_wait / get_wait somam o tempo bloqueado de cada lado e mostram qual
+    estágio é o gargalo.
+    """
+
+    def __init__(self, name: str, maxsize: int = PIPELINE_QUEUE_SIZE):
+        self.name = name
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+        self._cancelled = threading.Event()
+        self.put_wait = 0.0
+        self.get_wait = 0.0
+
+    def put(self, item):
+        start = time.perf_counter()
+        while True:
+            if self._cancelled.is_set():
+                raise Cancelled(self.name)
+            try:
+                self._queue.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self.put_wait += time.perf_counter() - start
+
+    def close(self):
+        self._put_final(_CLOSED)
+
+    def fail(self, error: BaseException):
+        self._put_final(_Failed(error))
+
+    def _put_final(self, marker):
+        try:
+            self.put(marker)
+        except Cancelled:
+            pass
+
+    def cancel(self):
+        self._cancelled.set()
+        # Libera um produtor bloqueado no put()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __iter__(self):
+        while True:
+            start = time.perf_counter()
+            while True:
+                try:
+                    item = self._queue.get(timeout=0.1)
+                    break
+                except queue.Empty:
+                    if self._cancelled.is_set():
+                        raise Cancelled(self.name)
+            self.get_wait += time.perf_counter() - start
+            if item is _CLOSED:
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+
+
+# ── Carga ──────────────────────────────────────────────────────────
+def loaded_source_urls() -> set[str]:
+    """URLs que já têm dado bruto no banco (base para o GET condicional)."""
+    session = get_session()
+    try:
+        return {url for (url,) in session.query(RawData.source_url).distinct() if url}
+    finally:
+        session.close()
+
+
+def previous_hashes(session, run_id: int) -> dict[str, str]:
+    """
+    Hash do conteúdo publicado de cada categoria antes deste run: o do run
+    apontado por category_current (categorias com parser e modelo) ou, nas
+    só com dado bruto, o do último salvo. O dado bruto de um run em que o
+    parse ou a carga falhou não é publicado e, por isso, não faz o mesmo
+    conteúdo contar como "sem mudanças" depois.
+    """
+    current = dict(
+        session.query(CategoryCurrent.table_name, CategoryCurrent.scrape_run_id)
+        .filter(CategoryCurrent.scrape_run_id < run_id)
+    )
+    parsed = [slug for slug in MODEL_MAP if slug in STREAM_PARSER_MAP]
+    pairs = [
+        (slug, current[MODEL_MAP[slug].__tablename__])
+        for slug in parsed
+        if MODEL_MAP[slug].__tablename__ in current
+    ]
+
+    hashes = {}
+    if pairs:
+        rows = (
+            session.query(RawData.category_slug, RawData.content_hash)
+            .filter(tuple_(RawData.category_slug, RawData.scrape_run_id).in_(pairs))
+            .distinct(RawData.category_slug)
+            .order_by(RawData.category_slug, RawData.id.desc())
+        )
+        hashes.update(rows)
+
+    rows = (
+        session.query(RawData.category_slug, RawData.content_hash)
+        .filter(RawData.scrape_run_id < run_id, RawData.category_slug.notin_(parsed))
+        .distinct(RawData.category_slug)
+        .order_by(RawData.category_slug, RawData.scrape_run_id.desc())
+    )
+    hashes.update(rows)
+    return hashes
+
+
+def _parse_stage(
+    scraped_data: Iterable[dict],
+    previous: dict[str, str],
+    run_id: int,
+    skip_unchanged: bool,
+    out: "Channel",
+    counts: dict,
+    stages: StageMetrics | None = None,
+):
+    """
+    Thread de parse: filtra as categorias e manda para a carga, por
+    categoria, ("category", (item, conteúdo, digest)), os registros em
+    lotes de LOAD_BATCH_SIZE (("records", lote)) e ("end", None) — ou
+    ("error", e) se o parse falhar no meio. Consome scraped_data conforme
+    ele chega; o conteúdo em disco (SpooledText) só é lido aqui. Registra
+    em `stages` o fetch (vindo do downloader) e o parse de cada categoria.
+    """
+    pending: deque[tuple[dict, str, str]] = deque()
+
+    def jobs():
+        for item in scraped_data:
+            category = item["category"]
+            if stages is not None and "fetch_seconds" in item:
+                stages.record(
+                    item["slug"], "fetch", item["fetch_seconds"],
+                    bytes=byte_size(item.get("content")),
+                )
+            content = read_text(item.get("content"))
+
+            if item.get("status") == "unchanged":
+                logger.info("[DB] Inalterado (304): %s — dados atuais mantidos", category)
+                counts["ok"] += 1
+                continue
+
+            if not content:
+                logger.warning("[DB] Sem conteúdo para: %s", category)
+                continue
+
+            # ── 0. Conteúdo idêntico ao da execução anterior? ──────
+            digest = content_hash(content)
+            if skip_unchanged and previous.get(item["slug"]) == digest:
+                logger.info(
+                    "[DB] Sem mudanças: %s (run #%d) — parse e carga ignorados", category, run_id
+                )
+                counts["carried"] += 1
+                counts["ok"] += 1
+                counts["kept"].add(item.get("url"))
+                continue
+            pending.append((item, content, digest))
+            yield item["slug"], content
+
+    try:
+        with ParseStage(PARSE_WORKERS) as stage:
+            for parsed in stage.map(jobs()):
+                item, content, digest = pending.popleft()
+                out.put(("category", (item, content, digest)))
+                if parsed.slug in STREAM_PARSER_MAP and parsed.slug in MODEL_MAP:
+                    # Tempo do parse = total menos a espera pela carga
+                    start, waited, records = time.perf_counter(), out.put_wait, 0
+                    try:
+                        for batch in batched(parsed.records(), LOAD_BATCH_SIZE):
+                            records += len(batch)
+                            out.put(("records", batch))
+                    except Cancelled:
+                        raise
+                    except Exception as e:
+                        out.put(("error", e))
+                        continue
+                    if stages is not None:
+                        stages.record(
+                            parsed.slug, "parse",
+                            time.perf_counter() - start - (out.put_wait - waited),
+                            lines=content.count("\n") + 1, records=records,
+                        )
+                out.put(("end", None))
+        out.close()
+    except Cancelled:
+        pass  # a carga desistiu (erro); nada mais a entregar
+    except BaseException as e:
+        out.fail(e)
+
+
+class _CategoryRecords:
+    """Registros de uma categoria, lidos da fila até o ("end", None)."""
+
+    def __init__(self, messages: Iterator[tuple[str, object]]):
+        self._messages = messages
+        self.finished = False
+
+    def __iter__(self) -> Iterator[dict]:
+        for kind, payload in self._messages:
+            if kind == "records":
+                yield from payload
+                continue
+            self.finished = True
+            if kind == "error":
+                raise payload
+            return
+        self.finished = True
+
+    def drain(self):
+        """Descarta o resto da categoria (carga interrompida por erro)."""
+        if self.finished:
+            return
+        for kind, _ in self._messages:
+            if kind in ("end", "error"):
+                break
+        self.finished = True
+
+
+def save_to_database(
+    scraped_data: Iterable[dict],
+    run_id: int,
+    skip_unchanged: bool = True,
+    stages: StageMetrics | None = None,
+    published: set[str] | None = None,
+):
+    """
+    Salva os dados coletados no banco de dados.
+
+    Para cada categoria:
+      - Categorias "unchanged" (304) são mantidas como estão
+      - Se o hash do conteúdo é igual ao do snapshot publicado da
+        categoria (ver previous_hashes), nada é gravado (sem parse nem inserts); com
+        skip_unchanged=False (reparse) a categoria é carregada mesmo assim
+      - Acrescenta o conteúdo bruto na tabela `raw_data`
+      - Faz parse e acrescenta as linhas na tabela de histórico da
+        categoria, com scrape_run_id/scrape_date deste run
+      - Boxscores do dia também entram no game log da temporada
+        (player_game_log), sem duplicar jogos já registrados, e os jogos
+        novos atualizam os agregados móveis (player_rolling_stats)
+
+    O parse roda em uma thread própria (e, com PARSE_WORKERS > 1, em
+    processos separados) e entrega os registros em lotes por uma fila
+    limitada (PIPELINE_QUEUE_SIZE): a carga da categoria N sobrepõe o parse
+    da N+1. `scraped_data` pode ser um Channel ainda sendo preenchido pelos
+    downloads (ver run_pipelined), e "content" pode ser um SpooledText (o
+    TXT em disco, lido só no parse da categoria).
+
+    Com `stages`, o tempo e o volume de fetch/parse/load de cada categoria
+    são registrados (gravados por finish_run; ver metrics.py).
+
+    Com `published`, recebe após o commit as URLs cujo conteúdo ficou
+    publicado — carregado neste run ou idêntico ao já publicado. Só os
+    validadores HTTP dessas URLs podem ir para o disco (ValidatorCache.commit).
+
+    No fim, as categorias carregadas são publicadas em category_current na
+    mesma transação: a API (views <slug>) continua vendo o snapshot
+    anterior até o commit e nunca vê dados parciais. Uma categoria cujo
+    snapshot publicado é de data mais recente que a do run (ingest de um
+    arquivo antigo) fica só no histórico (ver history.publish).
+    """
+    session = get_session()
+    engine = session.get_bind()
+    categories_ok = 0
+    loaded: list[str] = []  # tabelas de histórico com snapshot deste run
+    urls: set[str] = set()  # URLs das categorias publicadas neste run
+    # Preenchido pela thread de parse ("kept": URLs sem mudanças)
+    counts = {"ok": 0, "carried": 0, "kept": set()}
+
+    run = session.get(ScrapeRun, run_id)
+    run_date = (run.started_at if run and run.started_at else datetime.utcnow()).date()
+    snapshot = {"scrape_run_id": run_id, "scrape_date": run_date}
+
+    parsed_queue = Channel("parse→carga")
+    worker = None
+    try:
+        previous = previous_hashes(session, run_id)
+        worker = threading.Thread(
+            target=_parse_stage,
+            args=(scraped_data, previous, run_id, skip_unchanged, parsed_queue, counts, stages),
+            name="parse",
+            daemon=True,
+        )
+        worker.start()
+
+        messages = iter(parsed_queue)
+        for _, (item, content, digest) in messages:
+            category = item["category"]
+            slug = item["slug"]
+            records = _CategoryRecords(messages)
+
+            # ── 1. Salva dado bruto ────────────────────────────────
+            raw = RawData(
+                category=category,
+                category_slug=slug,
+                source_url=item.get("url", ""),
+                raw_content=content,
+                content_hash=digest,
+                scrape_run_id=run_id,
+            )
+            session.add(raw)
+            session.flush()
+            # Sem o texto na sessão até o commit: a memória do run não
+            # cresce com o número de categorias
+            session.expunge(raw)
+            logger.info("[DB] Dado bruto salvo: %s (%d chars)", category, len(content))
+
+            # ── 2. Parse e salva dados estruturados ────────────────
+            model_class = MODEL_MAP.get(slug)
+
+            if slug in STREAM_PARSER_MAP and model_class:
+                try:
+                    table_name = model_class.__tablename__
+                    ensure_partition(engine, table_name, run_date)
+                    # Tempo da carga = total menos a espera pelo parse
+                    start, waited = time.perf_counter(), parsed_queue.get_wait
+                    # Savepoint: uma carga com erro (inclusive de parse,
+                    # que chega pela fila junto com os registros) não
+                    # derruba as demais
+                    with session.begin_nested():
+                        inserted = bulk_insert(session, model_class, records, extra=snapshot)
+                        if not inserted:
+                            # TXT truncado ou layout diferente: um snapshot
+                            # vazio esvaziaria a view — mantém o anterior
+                            raise ValueError("parser retornou 0 registros")
+                        if slug == GAME_LOG_SOURCE:
+                            new_games = append_game_log(session, run_id, run_date)
+                            update_rolling(session, new_games)
+                    if stages is not None:
+                        stages.record(
+                            slug, "load",
+                            time.perf_counter() - start - (parsed_queue.get_wait - waited),
+                            rows_written=inserted,
+                        )
+                    # Parse OK: novo snapshot da categoria neste run
+                    if table_name not in loaded:
+                        loaded.append(table_name)
+                    urls.add(item.get("url"))
+                    logger.info("[DB] %d registros parsed salvos em '%s'", inserted, slug)
+                    categories_ok += 1
+                except Exception as e:
+                    logger.error("[DB] Erro no parse de %s: %s", category, e)
+                    # Ainda salva o dado bruto (já adicionado acima); a
+                    # API continua com o snapshot anterior da categoria
+                finally:
+                    records.drain()
+            else:
+                records.drain()
+                logger.info("[DB] Sem parser/modelo específico para '%s' — dado bruto salvo", slug)
+                categories_ok += 1
+                urls.add(item.get("url"))
+
+        worker.join()
+        categories_ok += counts["ok"]
+
+        # ── 3. Publica os novos snapshots + commit ─────────────────
+        publish(session, loaded, run_id, run_date)
+        session.commit()
+        if published is not None:
+            published.update(urls | counts["kept"])
+        logger.info(
+            f"[DB] Commit realizado — {categories_ok} categorias processadas "
+            f"({counts['carried']} sem mudanças)"
+        )
+        logger.debug(
+            f"[PIPELINE] Carga aguardando o parse: {parsed_queue.get_wait:.2f}s; "
+            f"parse aguardando a carga: {parsed_queue.put_wait:.2f}s"
+        )
+
+    except BaseException as e:
+        session.rollback()
+        parsed_queue.cancel()
+        if isinstance(scraped_data, Channel):
+            scraped_data.cancel()  # para os downloads também
+        logger.error(f"[DB] Erro geral ao salvar: {e}")
+        raise
+    finally:
+        if worker is not None:
+            worker.join()
+        session.close()
+
+    return categories_ok
+
+
+# ── Download → parse → carga sobrepostos ──────────────────────────
+def run_pipelined(
+    produce: Callable[[Callable[[dict], None]], object],
+    run_id: int,
+    skip_unchanged: bool = True,
+    stages: StageMetrics | None = None,
+    published: set[str] | None = None,
+) -> tuple[list[dict], int]:
+    """
+    Roda produce(emit) — os downloads — em uma thread, enquanto o parse e a
+    carga consomem cada categoria assim que ela é entregue por emit(item).
+    As filas entre os estágios são limitadas (PIPELINE_QUEUE_SIZE): quando a
+    carga não acompanha, o parse espera, e os downloads esperam no emit. O
+    tempo total fica perto do estágio mais lento, em vez da soma dos três.
+
+    Retorna (itens baixados, na ordem de entrega; categorias salvas);
+    `published` é repassado a save_to_database.
+    """
+    downloads = Channel("download→parse")
+    produced: list[dict] = []
+
+    def emit(item: dict):
+        produced.append(item)
+        downloads.put(item)
+
+    def producer():
+        try:
+            produce(emit)
+            downloads.close()
+        except Cancelled:
+            pass
+        except BaseException as e:
+            downloads.fail(e)
+
+    thread = threading.Thread(target=producer, name="download", daemon=True)
+    thread.start()
+    try:
+        categories_ok = save_to_database(downloads, run_id, skip_unchanged, stages, published)
+    except BaseException:
+        downloads.cancel()
+        raise
+    finally:
+        thread.join()
+
+    logger.info(
+        f"[PIPELINE] {len(produced)} categorias — parse aguardando downloads: "
+        f"{downloads.get_wait:.2f}s; downloads aguardando o parse: {downloads.put_wait:.2f}s"
+    )
+    peak = peak_rss_mb()
+    if peak is not None:
+        logger.info(f"[PIPELINE] Pico de memória (RSS) do processo: {peak:.1f} MiB")
+    return produced, categories_ok
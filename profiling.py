@@ -0,0 +1,295 @@
+"""
+Profiling dos estágios do pipeline, sem editar o código.
+
+    python main.py --profile sample
+    python cli.py scrape --profile cprofile --profile-stages parsers
+
+Durante o run, os estágios selecionados (--profile-stages) são envolvidos:
+  scrape_all        NBAStatsScraper.scrape_all (navegação + downloads)
+  parsers           cada função de parser.STREAM_PARSER_MAP (parse.<slug>)
+  save_to_database  pipeline.save_to_database (carga no banco)
+e cada estágio ganha um relatório em PROFILE_DIR/run_<ScrapeRun.id>/:
+  cprofile     <estágio>.pstats (python -m pstats, snakeviz) e <estágio>.txt
+               com as funções por tempo acumulado
+  sample       <estágio>.folded — pilhas amostradas a cada PROFILE_INTERVAL
+               segundos, no formato "collapsed" (flamegraph.pl, speedscope)
+  tracemalloc  <estágio>.txt — o que cresceu em memória durante o estágio,
+               por linha — e <estágio>.snapshot (tracemalloc.Snapshot.load)
+
+Limites: o cProfile mede só a thread em que o estágio roda (no Python
+3.12+ apenas um profiler fica ativo por vez; estágios simultâneos são
+pulados e contados no log); o tracemalloc é global, então o relatório de
+um estágio inclui o que outras threads alocaram no período; com
+PARSE_WORKERS > 1 os parsers rodam em outros processos e não são medidos.
+"""
+
+import os
+import sys
+import time
+import pstats
+import cProfile
+import inspect
+import logging
+import functools
+import threading
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from config import PROFILE_DIR, PROFILE_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+MODES = ("cprofile", "sample", "tracemalloc")
+STAGES = ("scrape_all", "parsers", "save_to_database")
+
+# Linhas nos relatórios em texto
+_TOP = 40
+
+
+class StageProfiler:
+    """
+    Uso:
+        with StageProfiler("sample", run_id):
+            ...   # estágios envolvidos até o fim do bloco; relatórios no __exit__
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        run_id: int,
+        stages=None,
+        root: str = PROFILE_DIR,
+        interval: float = PROFILE_INTERVAL,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Modo de profiling desconhecido: {mode} (opções: {', '.join(MODES)})")
+        self.stages = set(stages or STAGES)
+        unknown = self.stages - set(STAGES)
+        if unknown:
+            raise ValueError(f"Estágios desconhecidos: {', '.join(sorted(unknown))}")
+        self.mode = mode
+        self.directory = os.path.join(root, f"run_{run_id}")
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._restore: list = []
+        self._reports: Counter = Counter()
+        self._skipped: Counter = Counter()
+        # cprofile: um Profile por (estágio, thread), ligado/desligado a cada entrada
+        self._profiles: dict[tuple[str, int], cProfile.Profile] = {}
+        # sample: estágio ativo em cada thread e pilhas amostradas por estágio
+        self._active: dict[int, list[str]] = {}
+        self._samples: dict[str, Counter] = defaultdict(Counter)
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    # ── Instalação ─────────────────────────────────────────────────
+    def __enter__(self) -> "StageProfiler":
+        os.makedirs(self.directory, exist_ok=True)
+        if "scrape_all" in self.stages:
+            from scraper import NBAStatsScraper
+
+            self._replace(NBAStatsScraper, "scrape_all", "scrape_all")
+        if "save_to_database" in self.stages:
+            import pipeline
+
+            self._replace(pipeline, "save_to_database", "save_to_database")
+        if "parsers" in self.stages:
+            from parser import STREAM_PARSER_MAP
+
+            for slug in list(STREAM_PARSER_MAP):
+                self._replace(STREAM_PARSER_MAP, slug, f"parse.{slug}")
+
+        if self.mode == "sample":
+            self._sampler = threading.Thread(target=self._sample, name="profiler", daemon=True)
+            self._sampler.start()
+        elif self.mode == "tracemalloc":
+            tracemalloc.start(25)
+        logger.info(
+            f"[PROFILE] {self.mode} em {', '.join(sorted(self.stages))} → {self.directory}"
+        )
+        return self
+
+    def __exit__(self, *exc):
+        for restore in reversed(self._restore):
+            restore()
+        self._restore = []
+
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._write_samples()
+        elif self.mode == "cprofile":
+            self._write_profiles()
+        elif self.mode == "tracemalloc":
+            tracemalloc.stop()
+
+        if self._skipped:
+            logger.warning(
+                "[PROFILE] Estágios não medidos (outro profiler ativo): "
+                + ", ".join(f"{name} ×{n}" for name, n in sorted(self._skipped.items()))
+            )
+        logger.info(f"[PROFILE] Relatórios em {self.directory}")
+
+    def _replace(self, owner, key: str, stage: str):
+        """Troca owner.key (ou owner[key], em dicts) pela versão envolvida."""
+        if isinstance(owner, dict):
+            original = owner[key]
+            owner[key] = self.wrap(stage, original)
+            self._restore.append(lambda: owner.__setitem__(key, original))
+        else:
+            original = getattr(owner, key)
+            setattr(owner, key, self.wrap(stage, original))
+            self._restore.append(lambda: setattr(owner, key, original))
+
+    # ── Envoltórios ────────────────────────────────────────────────
+    def wrap(self, stage: str, func):
+        """Mede `func` como o estágio `stage` (geradores: cada next())."""
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator(*args, **kwargs):
+                return self._iterate(stage, func(*args, **kwargs))
+
+            return generator
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.stage(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def _iterate(self, stage: str, iterator):
+        if self.mode == "tracemalloc":
+            # Snapshot só no início e no fim do parse, não por registro
+            with self.stage(stage):
+                yield from iterator
+            return
+        try:
+            while True:
+                with self.stage(stage):
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            iterator.close()
+
+    @contextmanager
+    def stage(self, name: str):
+        if self.mode == "cprofile":
+            with self._cprofile(name):
+                yield
+        elif self.mode == "sample":
+            tid = threading.get_ident()
+            with self._lock:
+                self._active.setdefault(tid, []).append(name)
+            try:
+                yield
+            finally:
+                with self._lock:
+                    stack = self._active[tid]
+                    stack.pop()
+                    if not stack:
+                        del self._active[tid]
+        else:
+            before = tracemalloc.take_snapshot()
+            try:
+                yield
+            finally:
+                self._write_tracemalloc(name, before, tracemalloc.take_snapshot())
+
+    @contextmanager
+    def _cprofile(self, name: str):
+        profile = None
+        # Estágio dentro de outro na mesma thread: fica no relatório de fora
+        if not getattr(self._local, "profiling", False):
+            with self._lock:
+                profile = self._profiles.setdefault(
+                    (name, threading.get_ident()), cProfile.Profile()
+                )
+            try:
+                profile.enable()
+            except ValueError:  # Python 3.12+: outro profiler já ativo
+                self._skipped[name] += 1
+                profile = None
+        if profile is None:
+            yield
+            return
+        self._local.profiling = True
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._local.profiling = False
+
+    # ── Amostragem ─────────────────────────────────────────────────
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                active = {tid: names[-1] for tid, names in self._active.items()}
+            for tid, name in active.items():
+                frame = frames.get(tid)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    )
+                    frame = frame.f_back
+                if stack:
+                    self._samples[name][";".join(reversed(stack))] += 1
+
+    # ── Relatórios ─────────────────────────────────────────────────
+    def _path(self, name: str, ext: str) -> str:
+        return os.path.join(self.directory, f"{name}{ext}")
+
+    def _write_samples(self):
+        for name, stacks in sorted(self._samples.items()):
+            with open(self._path(name, ".folded"), "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            total = sum(stacks.values())
+            logger.info(
+                f"[PROFILE] {name}: {total} amostras (~{total * self.interval:.2f}s)"
+            )
+
+    def _write_profiles(self):
+        by_stage: dict[str, list[cProfile.Profile]] = defaultdict(list)
+        for (name, _), profile in self._profiles.items():
+            by_stage[name].append(profile)
+        for name, profiles in sorted(by_stage.items()):
+            try:
+                stats = pstats.Stats(*profiles)
+            except TypeError:  # nenhuma chamada registrada
+                continue
+            stats.dump_stats(self._path(name, ".pstats"))
+            with open(self._path(name, ".txt"), "w", encoding="utf-8") as f:
+                stats.stream = f
+                stats.sort_stats("cumulative").print_stats(_TOP)
+            logger.info(f"[PROFILE] {name}: {stats.total_tt:.3f}s medidos")
+
+    def _write_tracemalloc(self, name: str, before, after):
+        with self._lock:
+            self._reports[name] += 1
+            n = self._reports[name]
+        report = name if n == 1 else f"{name}-{n}"
+
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        before = before.filter_traces(ignore)
+        after = after.filter_traces(ignore)
+        growth = after.compare_to(before, "lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        with open(self._path(report, ".txt"), "w", encoding="utf-8") as f:
+            f.write(
+                f"# {name} — {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"# memória rastreada: atual {current / 2**20:.1f} MiB, "
+                f"pico {peak / 2**20:.1f} MiB (processo inteiro)\n"
+            )
+            for stat in growth[:_TOP]:
+                f.write(f"{stat}\n")
+        after.dump(self._path(report, ".snapshot"))
@@ -0,0 +1,288 @@
+"""
+Reparse — recarrega categorias a partir do conteúdo bruto salvo (raw_data).
+
+Depois de corrigir um parser há dois caminhos:
+
+  reparse   o último conteúdo de cada categoria (ou o de um run específico)
+            é parseado de novo e carregado em um novo run pelo mesmo
+            caminho do main.py, que publica o novo snapshot para a API. O
+            hash igual ao do run anterior não impede a carga
+            (skip_unchanged=False).
+
+  backfill  o histórico é corrigido no lugar: o raw_data de uma faixa de
+            runs (e categorias) é lido com cursor no servidor, parseado de
+            novo (em paralelo com PARSE_WORKERS > 1) e as linhas de cada
+            run em <slug>_history são substituídas, uma transação por run.
+            Dias de boxscore regravados refazem o game log e os agregados
+            móveis dos jogadores afetados. O último run concluído fica em
+            BACKFILL_CHECKPOINT_FILE: um backfill interrompido continua de
+            onde parou ao rodar de novo com os mesmos filtros.
+"""
+
+import os
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy import delete, select, text
+
+from config import BACKFILL_CHECKPOINT_FILE, PARSE_WORKERS
+from database import MODEL_MAP, RawData, ScrapeRun, get_engine, get_session
+from game_log import SOURCE_SLUG as GAME_LOG_SOURCE, replace_game_dates
+from history import ensure_partition
+from loader import bulk_insert
+from metrics import StageMetrics
+from parse_stage import ParseStage
+from parser import STREAM_PARSER_MAP
+from pipeline import finish_run, save_to_database, start_run
+from rolling import rebuild_rolling
+
+logger = logging.getLogger(__name__)
+
+# Linhas do raw_data buscadas por vez no cursor do servidor
+STREAM_ROWS = 8
+
+
+def stored_categories(run_id: int | None = None, slugs: list[str] | None = None) -> list[dict]:
+    """Último conteúdo bruto de cada categoria (do run `run_id`, se dado)."""
+    session = get_session()
+    try:
+        query = session.query(RawData)
+        if run_id is not None:
+            query = query.filter(RawData.scrape_run_id == run_id)
+        if slugs:
+            query = query.filter(RawData.category_slug.in_(slugs))
+        rows = (
+            query.distinct(RawData.category_slug)
+            .order_by(RawData.category_slug, RawData.scrape_run_id.desc(), RawData.id.desc())
+            .all()
+        )
+        return [
+            {
+                "category": row.category,
+                "slug": row.category_slug,
+                "url": row.source_url,
+                "content": row.raw_content,
+                "status": "ok",
+            }
+            for row in rows
+        ]
+    finally:
+        session.close()
+
+
+def reparse(run_id: int | None = None, slugs: list[str] | None = None) -> tuple[int | None, int]:
+    """Parse + carga do conteúdo salvo em um novo run; (run, categorias salvas)."""
+    items = stored_categories(run_id, slugs)
+    if not items:
+        logger.warning("[REPARSE] Nenhum conteúdo bruto encontrado")
+        return None, 0
+
+    new_run = start_run()
+    source = f"run #{run_id}" if run_id is not None else "último conteúdo de cada categoria"
+    logger.info(f"[REPARSE] Execução #{new_run}: {len(items)} categorias ({source})")
+    stages = StageMetrics()
+    try:
+        categories_ok = save_to_database(items, new_run, skip_unchanged=False, stages=stages)
+    except Exception as e:
+        finish_run(new_run, "error", error=str(e), stages=stages)
+        raise
+    finish_run(new_run, "success", categories_ok, stages=stages)
+    return new_run, categories_ok
+
+
+# ── Backfill ───────────────────────────────────────────────────────
+def backfillable_slugs() -> list[str]:
+    """Categorias com parser e tabela de histórico."""
+    return sorted(slug for slug in STREAM_PARSER_MAP if slug in MODEL_MAP)
+
+
+class Checkpoint:
+    """Último run concluído de um backfill, persistido em JSON por filtro."""
+
+    def __init__(self, path: str, key: dict):
+        self.path = path
+        self.key = key
+
+    def load(self) -> int | None:
+        """Run concluído para este filtro (None = sem progresso salvo)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[BACKFILL] Checkpoint ignorado ({self.path}): {e}")
+            return None
+        if data.get("key") != self.key:
+            logger.info("[BACKFILL] Checkpoint de outro filtro — recomeçando")
+            return None
+        return data.get("done_through")
+
+    def save(self, run_id: int):
+        """Grava o progresso de forma atômica (arquivo temporário + rename)."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        data = {
+            "key": self.key,
+            "done_through": run_id,
+            "updated_at": datetime.utcnow().isoformat(timespec="seconds"),
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def stream_raw(conn, slugs: list[str], from_run: int | None, to_run: int | None):
+    """
+    (run, slug, conteúdo) do raw_data em ordem de run, com cursor no
+    servidor (STREAM_ROWS por vez). Com mais de um conteúdo da mesma
+    categoria no run, vale o último gravado.
+    """
+    query = (
+        select(RawData.scrape_run_id, RawData.category_slug, RawData.raw_content)
+        .where(RawData.category_slug.in_(slugs), RawData.scrape_run_id.is_not(None))
+        .distinct(RawData.scrape_run_id, RawData.category_slug)
+        .order_by(RawData.scrape_run_id, RawData.category_slug, RawData.id.desc())
+    )
+    if from_run is not None:
+        query = query.where(RawData.scrape_run_id >= from_run)
+    if to_run is not None:
+        query = query.where(RawData.scrape_run_id <= to_run)
+    return conn.execution_options(stream_results=True, yield_per=STREAM_ROWS).execute(query)
+
+
+def _run_date(session, run_id: int):
+    run = session.get(ScrapeRun, run_id)
+    return (run.started_at if run and run.started_at else datetime.utcnow()).date()
+
+
+def _boxscore_dates(session, table_name: str, run_id: int, day) -> set:
+    return set(session.execute(
+        text(
+            f'SELECT DISTINCT game_date FROM "{table_name}" '
+            f"WHERE scrape_date = :day AND scrape_run_id = :run_id"
+        ),
+        {"day": day, "run_id": run_id},
+    ).scalars())
+
+
+def replace_category(session, slug: str, records, run_id: int, day) -> int:
+    """
+    Substitui as linhas do run em <slug>_history pelos registros
+    informados, na transação da sessão. Boxscores também refazem o game
+    log dos dias afetados e os agregados móveis dos seus jogadores. Zero
+    registros levantam ValueError (chame dentro de um savepoint).
+    """
+    model_class = MODEL_MAP[slug]
+    table = model_class.__table__
+    ensure_partition(session.get_bind(), table.name, day)
+
+    game_dates = set()
+    if slug == GAME_LOG_SOURCE:
+        game_dates = _boxscore_dates(session, table.name, run_id, day)
+    session.execute(
+        delete(table).where(table.c.scrape_date == day, table.c.scrape_run_id == run_id)
+    )
+    inserted = bulk_insert(
+        session, model_class, records, extra={"scrape_run_id": run_id, "scrape_date": day}
+    )
+    if not inserted:
+        # Sem registros (TXT truncado, layout diferente): o savepoint do
+        # chamador desfaz o delete e o run mantém as linhas antigas
+        raise ValueError("parser retornou 0 registros")
+    if slug == GAME_LOG_SOURCE:
+        game_dates |= _boxscore_dates(session, table.name, run_id, day)
+        players = replace_game_dates(session, game_dates)
+        rebuild_rolling(session, sorted(players))
+    return inserted
+
+
+def backfill(
+    slugs: list[str] | None = None,
+    from_run: int | None = None,
+    to_run: int | None = None,
+    workers: int = PARSE_WORKERS,
+    restart: bool = False,
+    checkpoint_path: str = BACKFILL_CHECKPOINT_FILE,
+) -> tuple[int, int]:
+    """
+    Reparse do raw_data dos runs [from_run, to_run] no próprio histórico.
+    Cada run é gravado em uma transação e marcado no checkpoint; com
+    restart=True o checkpoint é ignorado. Categorias cujo parse falha
+    mantêm as linhas antigas. Retorna (runs concluídos, registros gravados).
+    """
+    known = backfillable_slugs()
+    slugs = sorted(set(slugs)) if slugs else known
+    unknown = set(slugs) - set(known)
+    if unknown:
+        raise ValueError(f"Categorias sem parser/tabela: {', '.join(sorted(unknown))}")
+
+    key = {"slugs": slugs, "from_run": from_run, "to_run": to_run}
+    checkpoint = Checkpoint(checkpoint_path, key)
+    start = from_run
+    done_through = None if restart else checkpoint.load()
+    if done_through is not None:
+        start = done_through + 1
+        logger.info(f"[BACKFILL] Retomando após o run #{done_through}")
+
+    runs_done = total = 0
+    session = None
+    current_run = current_day = None
+    pending: deque[int] = deque()
+
+    def finish_current():
+        nonlocal runs_done, session
+        session.commit()
+        session.close()
+        session = None
+        checkpoint.save(current_run)
+        runs_done += 1
+
+    try:
+        with get_engine().connect() as reader, ParseStage(workers) as stage:
+            rows = stream_raw(reader, slugs, start, to_run)
+
+            def jobs() -> Iterator[tuple[str, str]]:
+                for run_id, slug, content in rows:
+                    pending.append(run_id)
+                    yield slug, content
+
+            for parsed in stage.map(jobs()):
+                run_id = pending.popleft()
+                if run_id != current_run:
+                    if session is not None:
+                        finish_current()
+                    session = get_session()
+                    current_run, current_day = run_id, _run_date(session, run_id)
+                    logger.info(f"[BACKFILL] Run #{run_id} ({current_day})")
+
+                try:
+                    # Savepoint: um parse com erro não derruba o run
+                    with session.begin_nested():
+                        inserted = replace_category(
+                            session, parsed.slug, parsed.records(), run_id, current_day
+                        )
+                    total += inserted
+                    logger.info(f"[BACKFILL]   {parsed.slug:<36} {inserted:>7} registros")
+                except Exception as e:
+                    logger.error(f"[BACKFILL] Erro no parse de {parsed.slug} (run #{run_id}): {e}")
+
+            if session is not None:
+                finish_current()
+    finally:
+        if session is not None:
+            session.rollback()
+            session.close()
+
+    checkpoint.clear()
+    logger.info(f"[BACKFILL] Concluído — {runs_done} runs, {total} registros regravados")
+    return runs_done, total
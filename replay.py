@@ -0,0 +1,300 @@
+"""
+Gravação e replay das respostas do site/CDN para execuções offline.
+
+Gravação (FETCH_RECORD=true): cada download do scraper (TXT do CDN e a
+página do Media Central) é salvo em RECORD_DIR com status e headers:
+    <RECORD_DIR>/<host>/<caminho da URL>              corpo (texto)
+    <RECORD_DIR>/<host>/<caminho da URL>.meta.json    url, status, headers
+
+Replay: um servidor HTTP local serve as gravações no caminho
+/<host>/<caminho>, então basta apontar NBA_STATS_URL e CDN_BASE para ele
+(o servidor imprime os valores). Os links absolutos do host original nas
+páginas HTML são reescritos para o servidor local, e os validadores
+gravados (ETag / Last-Modified) respondem 304 como o CDN. Para testes de
+desempenho e de robustez:
+  --latency/--jitter   atraso por requisição (segundos)
+  --error-rate         fração das requisições que falham com --error-status
+                       (0 = conexão fechada sem resposta)
+
+Uso:
+    python replay.py                       # serve RECORD_DIR na porta 8765
+    python replay.py --latency 0.2 --error-rate 0.1 --seed 1
+"""
+
+import os
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+from config import RECORD_DIR
+
+logger = logging.getLogger(__name__)
+
+META_SUFFIX = ".meta.json"
+# O corpo é gravado já decodificado: headers de transporte não valem no replay
+SKIPPED_HEADERS = {
+    "connection", "content-encoding", "content-length", "keep-alive",
+    "transfer-encoding", "date", "server",
+}
+
+
+def recording_path(root: str, url: str) -> str:
+    """Arquivo da gravação de uma URL (a query string é ignorada)."""
+    parsed = urlparse(url)
+    path = parsed.path.lstrip("/")
+    if not path or path.endswith("/"):
+        path += "index"
+    return os.path.join(root, parsed.netloc, *path.split("/"))
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Gravação
+# ══════════════════════════════════════════════════════════════════════
+class Recorder:
+    """Grava respostas (corpo + status + headers) para o replay."""
+
+    def __init__(self, root: str = RECORD_DIR):
+        self.root = root
+
+    def save(self, url: str, status: int, headers, content: str):
+        path = recording_path(self.root, url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": {
+                k: v for k, v in dict(headers).items() if k.lower() not in SKIPPED_HEADERS
+            },
+            "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        with open(path + META_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        logger.debug("[RECORD] %s → %s", url, path)
+
+
+def load_recordings(root: str) -> list[dict]:
+    """Metadados de todas as gravações em `root`."""
+    recordings = []
+    for folder, _, files in os.walk(root):
+        for name in files:
+            if name.endswith(META_SUFFIX):
+                with open(os.path.join(folder, name), encoding="utf-8") as f:
+                    recordings.append(json.load(f))
+    return recordings
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Replay
+# ══════════════════════════════════════════════════════════════════════
+class ReplayHandler(BaseHTTPRequestHandler):
+    server: "ReplayServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.count("requests")
+        server.delay()
+
+        status = server.injected_error()
+        if status is not None:
+            server.count("errors")
+            if status == 0:
+                self.close_connection = True
+                return
+            self.send_error(status)
+            return
+
+        path = server.resolve(self.path)
+        if path is None:
+            server.count("not_found")
+            self.send_error(404)
+            return
+
+        with open(path, encoding="utf-8") as f:
+            body = f.read()
+        try:
+            with open(path + META_SUFFIX, encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = {"status": 200, "headers": {"Content-Type": "text/plain; charset=utf-8"}}
+        headers = meta.get("headers", {})
+        lowered = {k.lower(): v for k, v in headers.items()}
+
+        # GET condicional com os validadores gravados
+        etag, modified = lowered.get("etag"), lowered.get("last-modified")
+        if (etag and self.headers.get("If-None-Match") == etag) or (
+            modified and self.headers.get("If-Modified-Since") == modified
+        ):
+            server.count("not_modified")
+            self.send_response(304)
+            for name in ("ETag", "Last-Modified"):
+                if lowered.get(name.lower()):
+                    self.send_header(name, lowered[name.lower()])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if "html" in lowered.get("content-type", ""):
+            body = server.rewrite_links(body)
+        data = body.encode("utf-8")
+
+        self.send_response(meta.get("status", 200))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug("[REPLAY] %s " + format, self.address_string(), *args)
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Servidor HTTP local que responde com as gravações de `root`."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        root: str = RECORD_DIR,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+    ):
+        super().__init__((host, port), ReplayHandler)
+        self.root = os.path.abspath(root)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.stats = {"requests": 0, "errors": 0, "not_modified": 0, "not_found": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def local_url(self, url: str) -> str:
+        """URL equivalente no servidor local (/<host>/<caminho>)."""
+        parsed = urlparse(url)
+        return f"{self.base_url}/{parsed.netloc}{parsed.path}"
+
+    def suggested_env(self) -> dict[str, str]:
+        """NBA_STATS_URL / CDN_BASE apontando para as gravações servidas."""
+        env = {}
+        for meta in load_recordings(self.root):
+            headers = {k.lower(): v for k, v in meta.get("headers", {}).items()}
+            if "html" in headers.get("content-type", ""):
+                env["NBA_STATS_URL"] = self.local_url(meta["url"])
+            elif meta["url"].endswith(".txt"):
+                env["CDN_BASE"] = self.local_url(meta["url"]).rsplit("/", 1)[0]
+        return env
+
+    # ── Usado pelo handler ─────────────────────────────────────────
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def delay(self):
+        if self.latency or self.jitter:
+            with self._lock:
+                extra = self._rng.uniform(0, self.jitter) if self.jitter else 0.0
+            time.sleep(self.latency + extra)
+
+    def injected_error(self) -> int | None:
+        if self.error_rate <= 0:
+            return None
+        with self._lock:
+            failed = self._rng.random() < self.error_rate
+        return self.error_status if failed else None
+
+    def resolve(self, request_path: str) -> str | None:
+        """Arquivo da gravação para o caminho pedido (nunca fora de root)."""
+        path = unquote(urlparse(request_path).path).lstrip("/")
+        if not path or path.endswith("/"):
+            path += "index"
+        full = os.path.realpath(os.path.join(self.root, path))
+        if not full.startswith(self.root + os.sep) or full.endswith(META_SUFFIX):
+            return None
+        return full if os.path.isfile(full) else None
+
+    def rewrite_links(self, body: str) -> str:
+        """Links absolutos para hosts gravados passam a apontar para o replay."""
+        for host in os.listdir(self.root):
+            for scheme in ("https", "http"):
+                body = body.replace(f"{scheme}://{host}/", f"{self.base_url}/{host}/")
+        return body
+
+    # ── Execução em background (benchmarks e testes) ───────────────
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="replay", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[REPLAY] Servindo {self.root} em {self.base_url}")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--root", default=RECORD_DIR, help="diretório das gravações")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.0, help="atraso fixo por requisição (s)")
+    ap.add_argument("--jitter", type=float, default=0.0, help="atraso aleatório adicional (s)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fração de requisições com erro")
+    ap.add_argument("--error-status", type=int, default=503, help="status do erro (0 = fecha a conexão)")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s │ %(levelname)-8s │ %(message)s",
+                        datefmt="%H:%M:%S")
+    if not os.path.isdir(args.root):
+        raise SystemExit(f"Sem gravações em {args.root} — rode o scraper com FETCH_RECORD=true")
+
+    server = ReplayServer(
+        args.root, args.host, args.port, args.latency, args.jitter,
+        args.error_rate, args.error_status, args.seed,
+    )
+    print(f"Replay de {server.root} em {server.base_url}")
+    for name, value in server.suggested_env().items():
+        print(f"  {name}={value}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n{server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Agregados móveis por jogador (player_rolling_stats), mantidos na ingestão.
+
+Para cada jogador e janela (últimos 5, 10, 20 jogos e temporada = 0) a
+tabela guarda o nº de jogos e as somas / somas de quadrados de pontos,
+rebotes, assistências e PRA. A view player_rolling_averages deriva
+média, desvio padrão e coeficiente de variação, e a API lê um jogador
+com um único lookup pela chave primária.
+
+Atualização incremental (update_rolling), a partir dos jogos que acabaram
+de entrar no game log:
+  - temporada: soma os jogos novos
+  - janela N: soma os jogos que entraram e subtrai os que saíram
+    (posições N.. do game log), lidos pelo índice (player_name, game_date)
+
+Se um jogo novo for mais antigo que o último já agregado (carga fora de
+ordem), os agregados do jogador são recalculados do game log
+(rebuild_rolling).
+"""
+
+import logging
+from collections import defaultdict
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+logger = logging.getLogger(__name__)
+
+WINDOWS = (5, 10, 20)
+SEASON = 0  # window_size da temporada inteira
+
+STATS = ("pts", "reb", "ast", "pra")
+
+
+def _stat_values(game: dict) -> dict:
+    pts = game.get("points") or 0
+    reb = game.get("total_reb") or 0
+    ast = game.get("assists") or 0
+    return {"pts": pts, "reb": reb, "ast": ast, "pra": pts + reb + ast}
+
+
+def _delta(entering: list[dict], leaving: list[dict]) -> dict:
+    """Variação das somas ao entrar/sair jogos de uma janela."""
+    delta = {"games": len(entering) - len(leaving)}
+    for stat in STATS:
+        delta[f"{stat}_sum"] = 0
+        delta[f"{stat}_sq"] = 0
+    for games, sign in ((entering, 1), (leaving, -1)):
+        for game in games:
+            for stat, value in _stat_values(game).items():
+                delta[f"{stat}_sum"] += sign * value
+                delta[f"{stat}_sq"] += sign * value * value
+    return delta
+
+
+# ── Recalculo completo ─────────────────────────────────────────────
+def rebuild_rolling(bind, players: list[str] | None = None) -> int:
+    """Recalcula os agregados do game log (todos ou só os jogadores informados)."""
+    if players is not None and not players:
+        return 0
+    where = "WHERE player_name IN :players" if players is not None else ""
+    params = {"players": list(players)} if players is not None else {}
+    windows = ", ".join(f"({w})" for w in (*WINDOWS, SEASON))
+
+    delete = text(f"DELETE FROM player_rolling_stats {where}")
+    insert = text(f"""
+        WITH g AS (
+            SELECT player_name, team, game_date,
+                   COALESCE(points, 0) AS pts,
+                   COALESCE(total_reb, 0) AS reb,
+                   COALESCE(assists, 0) AS ast,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY player_name ORDER BY game_date DESC
+                   ) AS rn
+            FROM player_game_log {where}
+        )
+        INSERT INTO player_rolling_stats (
+            player_name, window_size, team, games, last_game_date,
+            pts_sum, pts_sq, reb_sum, reb_sq, ast_sum, ast_sq,
+            pra_sum, pra_sq, updated_at
+        )
+        SELECT g.player_name, w.size,
+               (ARRAY_AGG(g.team ORDER BY g.game_date DESC))[1],
+               COUNT(*), MAX(g.game_date),
+               SUM(g.pts), SUM(g.pts * g.pts),
+               SUM(g.reb), SUM(g.reb * g.reb),
+               SUM(g.ast), SUM(g.ast * g.ast),
+               SUM(g.pts + g.reb + g.ast),
+               SUM((g.pts + g.reb + g.ast) * (g.pts + g.reb + g.ast)),
+               NOW() AT TIME ZONE 'utc'
+        FROM g
+        JOIN (VALUES {windows}) AS w(size) ON w.size = {SEASON} OR g.rn <= w.size
+        GROUP BY g.player_name, w.size
+    """)
+    if players is not None:
+        delete = delete.bindparams(bindparam("players", expanding=True))
+        insert = insert.bindparams(bindparam("players", expanding=True))
+
+    bind.execute(delete, params)
+    return bind.execute(insert, params).rowcount
+
+
+def create_averages_view(conn):
+    """(Re)cria a view com médias, desvio padrão (populacional) e CV por janela."""
+    columns = []
+    for stat in STATS:
+        avg = f"{stat}_sum::NUMERIC / NULLIF(games, 0)"
+        std = f"SQRT(GREATEST({stat}_sq::NUMERIC / NULLIF(games, 0) - ({avg}) ^ 2, 0))"
+        columns += [
+            f"ROUND({avg}, 1) AS {stat}_avg",
+            f"ROUND({std}, 1) AS {stat}_std",
+            f"ROUND({std} / NULLIF({avg}, 0) * 100, 1) AS {stat}_cv_pct",
+        ]
+    conn.execute(text(
+        "CREATE OR REPLACE VIEW player_rolling_averages AS "
+        "SELECT player_name, window_size, team, games, last_game_date, "
+        + ", ".join(columns)
+        + " FROM player_rolling_stats"
+    ))
+
+
+# ── Atualização incremental ────────────────────────────────────────
+def update_rolling(bind, new_games: list[dict]) -> int:
+    """
+    Aplica os jogos recém-inseridos no game log aos agregados móveis.
+    Usa a conexão/transação de quem chamou. Retorna quantos jogadores
+    foram atualizados.
+    """
+    from database import PlayerRollingStats
+
+    by_player: dict[str, list[dict]] = defaultdict(list)
+    for game in new_games:
+        by_player[game["player_name"]].append(game)
+    if not by_player:
+        return 0
+
+    names = list(by_player)
+    last_dates = dict(bind.execute(
+        text(
+            "SELECT player_name, last_game_date FROM player_rolling_stats "
+            "WHERE window_size = :season AND player_name IN :players"
+        ).bindparams(bindparam("players", expanding=True)),
+        {"season": SEASON, "players": names},
+    ).all())
+
+    # Jogos mais recentes de cada jogador (já incluindo os novos), o
+    # suficiente para saber quem sai de cada janela
+    depth = max(WINDOWS) + max(len(g) for g in by_player.values())
+    recent: dict[str, list[dict]] = defaultdict(list)
+    rows = bind.execute(
+        text(
+            "SELECT * FROM ("
+            "  SELECT player_name, team, game_date, points, total_reb, assists,"
+            "         ROW_NUMBER() OVER (PARTITION BY player_name ORDER BY game_date DESC) AS rn"
+            "  FROM player_game_log WHERE player_name IN :players"
+            ") g WHERE rn <= :depth ORDER BY player_name, rn"
+        ).bindparams(bindparam("players", expanding=True)),
+        {"players": names, "depth": depth},
+    ).mappings()
+    for row in rows:
+        recent[row["player_name"]].append(dict(row))
+
+    upserts = []
+    rebuild = []
+    for name, games in by_player.items():
+        k = len(games)
+        ordered = recent[name]
+        last_date = last_dates.get(name)
+        oldest_new = min(g["game_date"] for g in games)
+
+        if last_date is not None and oldest_new <= last_date:
+            rebuild.append(name)  # jogo fora de ordem
+            continue
+        if last_date is None and len(ordered) > k:
+            rebuild.append(name)  # jogador sem agregados, mas com jogos antigos
+            continue
+
+        latest = ordered[0]
+        for size in (*WINDOWS, SEASON):
+            if size == SEASON:
+                delta = _delta(games, [])
+            else:
+                # Janela nova = ordered[:N]; antiga = ordered[k:k+N]
+                delta = _delta(ordered[:min(k, size)], ordered[max(k, size):k + size])
+            upserts.append({
+                "player_name": name,
+                "window_size": size,
+                "team": latest["team"],
+                "last_game_date": latest["game_date"],
+                **delta,
+            })
+
+    if upserts:
+        table = PlayerRollingStats.__table__
+        stmt = pg_insert(table).values(upserts)
+        accumulate = {
+            col: table.c[col] + stmt.excluded[col]
+            for col in ("games", *(f"{s}_{kind}" for s in STATS for kind in ("sum", "sq")))
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["player_name", "window_size"],
+            set_={
+                **accumulate,
+                "team": stmt.excluded.team,
+                "last_game_date": stmt.excluded.last_game_date,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        bind.execute(stmt)
+
+    if rebuild:
+        rebuild_rolling(bind, rebuild)
+
+    logger.info(
+        f"[ROLLING] Agregados atualizados: {len(by_player) - len(rebuild)} jogadores "
+        f"incrementais, {len(rebuild)} recalculados"
+    )
+    return len(by_player)
@@ -3,15 +3,27 @@ Scraper Selenium para o NBA Media Central Game Stats.
 
 Usa as URLs diretas conhecidas do CDN (extraídas do HTML da página).
 Abre o navegador, navega pela página para estabelecer a sessão/cookies,
-depois acessa cada URL .txt usando a sessão autenticada do browser.
+depois baixa cada URL .txt com uma sessão HTTP que reaproveita os cookies
+e o User-Agent do browser (FETCH_MODE=http). O modo antigo, que abre cada
+.txt em uma aba nova, continua disponível (FETCH_MODE=browser) e é usado
+como fallback quando o CDN responde 403.
+
+Com um CookieJar (browser_cache.py) ainda válido, a partida é a quente: a
+sessão HTTP sai dos cookies guardados e a página não é aberta. Se o CDN
+recusar esses cookies (403), o Chrome abre a página uma vez, a sessão
+HTTP é renovada com os cookies novos e o download é repetido. O caminho do chromedriver
+fica em cache e o perfil do Chrome é persistente (BROWSER_PROFILE_DIR).
 """
 
 import os
 import re
 import time
 import logging
-from typing import Optional
+import threading
+from typing import Callable, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -26,7 +38,20 @@ from selenium.common.exceptions import (
 )
 from webdriver_manager.chrome import ChromeDriverManager
 
-from config import NBA_STATS_URL, HEADLESS, DOWNLOAD_DIR, CATEGORY_URLS
+from config import (
+    NBA_STATS_URL,
+    HEADLESS,
+    BROWSER_PROFILE_DIR,
+    DOWNLOAD_DIR,
+    CATEGORY_URLS,
+    FETCH_MODE,
+    HTTP_TIMEOUT,
+)
+from browser_cache import CookieJar, DriverPathCache
+from downloader import ConcurrentDownloader
+from http_cache import NOT_MODIFIED, ValidatorCache
+from replay import Recorder
+from spool import SpooledText
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +59,33 @@ logger = logging.getLogger(__name__)
 class NBAStatsScraper:
     """Scraper para NBA Media Central Game Stats usando Selenium."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        validators: Optional[ValidatorCache] = None,
+        recorder: Optional[Recorder] = None,
+        cookie_jar: Optional[CookieJar] = None,
+    ):
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+        self.http: Optional[requests.Session] = None
+        # Cache de ETag/Last-Modified (None = sempre baixa tudo)
+        self.validators = validators
+        # Gravação das respostas para replay offline (None = não grava)
+        self.recorder = recorder
+        # Cookies entre execuções (None = sempre abre a página)
+        self.cookie_jar = cookie_jar
+        self.driver_cache = DriverPathCache()
+        # Partida do último scrape_all: {"mode": "cold" | "warm", "seconds": ...}
+        self.startup: dict = {}
+        # A página já foi aberta neste run (sessão/cookies do site no Chrome)
+        self._navigated = False
+        # Sessões HTTP trocadas por refresh_session(), fechadas no stop_browser
+        self._retired: list[requests.Session] = []
+        # O WebDriver não é thread-safe: o fallback por aba é serializado
+        self._browser_lock = threading.Lock()
+        # Nomes já gravados em DOWNLOAD_DIR neste run (um arquivo por handle)
+        self._spooled: set[str] = set()
+        self._spool_lock = threading.Lock()
 
     # ── Setup / Teardown ───────────────────────────────────────────
     def start_browser(self):
@@ -56,6 +105,12 @@ class NBAStatsScraper:
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
         )
 
+        # Perfil persistente: cache da página e cookies do Chrome entre execuções
+        if BROWSER_PROFILE_DIR:
+            profile_dir = os.path.abspath(BROWSER_PROFILE_DIR)
+            os.makedirs(profile_dir, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+
         # Preferências para download
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
         prefs = {
@@ -69,8 +124,7 @@ class NBAStatsScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = self._launch_chrome(chrome_options)
 
         # Remove flag navigator.webdriver
         self.driver.execute_cdp_cmd(
@@ -81,10 +135,67 @@ class NBAStatsScraper:
         self.wait = WebDriverWait(self.driver, 30)
         logger.info("[SCRAPER] Navegador Chrome iniciado")
 
+    def _launch_chrome(self, chrome_options: Options) -> webdriver.Chrome:
+        """
+        Abre o Chrome com o chromedriver em cache; sem cache (ou se o
+        driver em cache não serve mais, ex.: Chrome atualizado) resolve de
+        novo pelo webdriver-manager, que faz a checagem de versão na rede.
+        """
+        driver_path = self.driver_cache.get()
+        if driver_path is None:
+            driver_path = self.driver_cache.resolve(ChromeDriverManager().install)
+            return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+
+        logger.info(f"[SCRAPER] chromedriver em cache: {driver_path}")
+        try:
+            return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+        except WebDriverException as e:
+            logger.warning(f"[SCRAPER] chromedriver em cache falhou ({e.msg}) — resolvendo de novo")
+            self.driver_cache.clear()
+            driver_path = self.driver_cache.resolve(ChromeDriverManager().install)
+            return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+
+    def ensure_browser(self):
+        """Inicia o Chrome se ainda não foi aberto (partida a quente)."""
+        if self.driver is None:
+            self.start_browser()
+
+    def ensure_session(self):
+        """
+        Abre a página uma vez neste run (na partida a quente o Chrome,
+        iniciado só para um fallback, ainda não tem a sessão do site) e
+        guarda os cookies novos no jar.
+        """
+        if self._navigated:
+            return
+        self.navigate_to_page()
+        if self.cookie_jar is not None:
+            self.cookie_jar.store(
+                self.driver.get_cookies(),
+                self.driver.execute_script("return navigator.userAgent;"),
+            )
+
+    def refresh_session(self):
+        """Estabelece a sessão pelo Chrome e recria a sessão HTTP com os cookies novos."""
+        self.ensure_session()
+        if self.http is not None:
+            # Outras threads podem estar usando a sessão antiga
+            self._retired.append(self.http)
+            self.http = None
+        self.build_http_session()
+
     def stop_browser(self):
-        """Fecha o navegador."""
+        """Fecha o navegador (e a sessão HTTP, se aberta)."""
+        for session in self._retired:
+            session.close()
+        self._retired = []
+        if self.http:
+            self.http.close()
+            self.http = None
         if self.driver:
             self.driver.quit()
+            self.driver = None
+            self._navigated = False
             logger.info("[SCRAPER] Navegador fechado")
 
     # ── Tratamento de popups ───────────────────────────────────────
@@ -114,6 +225,7 @@ class NBAStatsScraper:
         Navega até a página do Media Central Game Stats.
         Isso estabelece cookies/sessão necessários para acessar o CDN.
         """
+        self.ensure_browser()
         logger.info(f"[SCRAPER] Acessando {NBA_STATS_URL}")
         self.driver.get(NBA_STATS_URL)
         time.sleep(5)  # Aguarda carregamento JS
@@ -136,6 +248,13 @@ class NBAStatsScraper:
                 "mas prosseguindo com URLs diretas..."
             )
 
+        self._navigated = True
+        if self.recorder:
+            self.recorder.save(
+                NBA_STATS_URL, 200, {"Content-Type": "text/html; charset=utf-8"},
+                self.driver.page_source,
+            )
+
     # ── Descoberta dinâmica de links (fallback) ────────────────────
     def discover_links_from_page(self) -> list[dict]:
         """
@@ -168,7 +287,7 @@ class NBAStatsScraper:
                         "slug": slug,
                         "url": href,
                     })
-                    logger.info(f"  [DISCOVERED] {text} → {href}")
+                    logger.debug("  [DISCOVERED] %s → %s", text, href)
             except StaleElementReferenceException:
                 continue
 
@@ -192,7 +311,7 @@ class NBAStatsScraper:
                             "slug": slug,
                             "url": href,
                         })
-                        logger.info(f"  [DISCOVERED] {text} → {href}")
+                        logger.debug("  [DISCOVERED] %s → %s", text, href)
                 except StaleElementReferenceException:
                     continue
 
@@ -205,6 +324,7 @@ class NBAStatsScraper:
         Abre uma URL de TXT em nova aba e captura o conteúdo.
         Usa a sessão do browser (mesmo cookies) para evitar 403.
         """
+        self.ensure_session()
         try:
             # Abre em nova aba
             original_window = self.driver.current_window_handle
@@ -237,7 +357,11 @@ class NBAStatsScraper:
             time.sleep(1)
 
             if content and len(content) > 10:
-                logger.info(f"[DOWNLOAD] OK — {len(content)} chars de {url.split('/')[-1]}")
+                logger.info("[DOWNLOAD] OK — %d chars de %s", len(content), url.rsplit("/", 1)[-1])
+                if self.recorder:
+                    self.recorder.save(
+                        url, 200, {"Content-Type": "text/plain; charset=utf-8"}, content
+                    )
                 return content
             else:
                 logger.warning(f"[DOWNLOAD] Conteúdo vazio para {url}")
@@ -255,62 +379,233 @@ class NBAStatsScraper:
                 pass
             return None
 
+    # ── Download direto via HTTP (cookies do browser) ──────────────
+    def build_http_session(self) -> requests.Session:
+        """
+        Cria uma sessão HTTP keep-alive com os cookies e o User-Agent do
+        Chrome. Deve ser chamada depois de navigate_to_page(), quando a
+        sessão do site já está estabelecida — ou, na partida a quente (sem
+        Chrome aberto), usa os cookies e o User-Agent do cookie jar.
+        """
+        session = requests.Session()
+
+        if self.driver is None:
+            user_agent, cookies, source = (
+                self.cookie_jar.user_agent, self.cookie_jar.cookies, "do cookie jar"
+            )
+        else:
+            user_agent = self.driver.execute_script("return navigator.userAgent;")
+            cookies, source = self.driver.get_cookies(), "do browser"
+        session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "text/plain,text/html;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+            "Referer": NBA_STATS_URL,
+            "Origin": "https://www.nba.com",
+            "Connection": "keep-alive",
+        })
+
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+
+        # Pool de conexões: todos os TXT vêm do mesmo host do CDN
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=1)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        self.http = session
+        logger.info(
+            f"[SCRAPER] Sessão HTTP criada com {len(session.cookies)} cookies {source}"
+        )
+        return session
+
+    def download_txt_http(self, url: str):
+        """
+        Baixa o TXT direto pela sessão HTTP (gzip, keep-alive).
+        Só recorre à aba do browser quando o CDN responde 403.
+
+        Com cache de validadores, envia If-None-Match/If-Modified-Since e
+        retorna NOT_MODIFIED quando o CDN responde 304. Gravando, o GET é
+        sempre completo (um 304 deixaria a gravação sem o arquivo).
+        """
+        if self.http is None:
+            self.build_http_session()
+
+        headers = {}
+        if self.validators and not self.recorder:
+            headers = self.validators.conditional_headers(url)
+        session = self.http
+        try:
+            resp = session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        except requests.RequestException as e:
+            logger.error(f"[DOWNLOAD] Erro HTTP ao baixar {url}: {e}")
+            return None
+
+        if resp.status_code == 304:
+            logger.info("[DOWNLOAD] 304 — %s inalterado", url.rsplit("/", 1)[-1])
+            return NOT_MODIFIED
+
+        if resp.status_code == 403:
+            with self._browser_lock:
+                if not self._navigated:
+                    # Partida a quente e cookies do jar recusados: abre a
+                    # página uma vez e renova a sessão HTTP (e o jar)
+                    logger.warning(
+                        f"[DOWNLOAD] 403 em {url.split('/')[-1]} — renovando a sessão pela página"
+                    )
+                    self.refresh_session()
+                retry = self.http is not session
+            if retry:
+                # Sessão renovada depois deste GET: tenta de novo por HTTP
+                return self.download_txt_http(url)
+
+            logger.warning(
+                f"[DOWNLOAD] 403 em {url.split('/')[-1]} — usando a aba do browser"
+            )
+            # Nem os cookies da página bastaram: a próxima execução parte a frio
+            if self.cookie_jar:
+                self.cookie_jar.invalidate()
+            with self._browser_lock:
+                return self.download_txt_content(url)
+
+        if resp.status_code != 200:
+            logger.warning(f"[DOWNLOAD] HTTP {resp.status_code} para {url}")
+            return None
+
+        content = resp.text
+        if content and len(content) > 10:
+            logger.info("[DOWNLOAD] OK — %d chars de %s", len(content), url.rsplit("/", 1)[-1])
+            if self.validators:
+                self.validators.record(url, resp.headers, content)
+            if self.recorder:
+                self.recorder.save(url, resp.status_code, resp.headers, content)
+            return content
+
+        logger.warning(f"[DOWNLOAD] Conteúdo vazio para {url}")
+        return None
+
+    def download_many(
+        self, items: list[dict], on_result: Optional[Callable[[dict], None]] = None
+    ) -> list[dict]:
+        """
+        Baixa várias categorias. No modo HTTP usa o ConcurrentDownloader
+        (pool de threads); no modo browser baixa uma por vez, com pausa.
+        Salva cada TXT localmente e retorna no formato de scrape_all(), com
+        "content" apontando para o arquivo (SpooledText, lido no parse);
+        `on_result` recebe cada categoria assim que o download termina.
+        """
+        def deliver(result: dict):
+            if result["content"]:
+                result["content"] = self._save_txt_local(result["slug"], result["content"])
+            if on_result:
+                on_result(result)
+
+        if FETCH_MODE == "browser":
+            results = []
+            total = len(items)
+            for i, item in enumerate(items, 1):
+                logger.info("[%02d/%d] %s — %s", i, total, item["category"], item["url"])
+                start = time.perf_counter()
+                content = self.download_txt_content(item["url"])
+                results.append({
+                    "category": item["category"].upper(),
+                    "slug": item["slug"],
+                    "url": item["url"],
+                    "content": content,
+                    "status": "ok" if content else "error",
+                    "fetch_seconds": time.perf_counter() - start,
+                })
+                deliver(results[-1])
+                # Pausa entre downloads (abas do browser)
+                time.sleep(2)
+        else:
+            if self.http is None:
+                self.build_http_session()
+            results = ConcurrentDownloader(self.download_txt_http).download_all(
+                items, on_result=deliver
+            )
+        return results
+
     # ── Salvar TXT localmente ──────────────────────────────────────
-    def _save_txt_local(self, slug: str, content: str):
-        """Salva o conteúdo TXT em arquivo local para backup."""
+    def _save_txt_local(self, slug: str, content: str) -> SpooledText:
+        """
+        Salva o conteúdo TXT em arquivo local e devolve o handle para o
+        parse. Um slug repetido no mesmo run (categoria extra) ganha outro
+        arquivo, para não trocar o conteúdo de um handle já entregue.
+        """
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
-        filepath = os.path.join(DOWNLOAD_DIR, f"{slug}.txt")
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-        logger.info(f"[SAVE] Arquivo local: {filepath}")
+        with self._spool_lock:
+            name, n = slug, 1
+            while name in self._spooled:
+                n += 1
+                name = f"{slug}-{n}"
+            self._spooled.add(name)
+        filepath = os.path.join(DOWNLOAD_DIR, f"{name}.txt")
+        spooled = SpooledText.write(filepath, content)
+        logger.debug("[SAVE] Arquivo local: %s", filepath)
+        return spooled
 
     # ── Scrape completo ────────────────────────────────────────────
-    def scrape_all(self) -> list[dict]:
+    def scrape_all(self, on_result: Optional[Callable[[dict], None]] = None) -> list[dict]:
         """
         Executa o scraping completo:
-        1. Navega até a página (estabelece sessão/cookies)
+        1. Navega até a página (estabelece sessão/cookies) — exceto na
+           partida a quente, com os cookies do jar ainda válidos
         2. Usa as 17 URLs diretas conhecidas do CATEGORY_URLS
-        3. Para cada URL, abre em nova aba e captura o conteúdo TXT
-        4. Também busca links dinâmicos caso haja categorias extras
-
-        Retorna lista de dicts com:
-            [{"category": "...", "slug": "...", "url": "...", "content": "..."}]
+        3. Baixa os TXT em paralelo via HTTP com os cookies do browser
+           (ou um por vez em nova aba, se FETCH_MODE=browser)
+        4. Também busca links dinâmicos caso haja categorias extras (na
+           partida a quente, as vistas na última navegação)
+
+        Com `on_result`, cada categoria é entregue assim que baixada (o
+        main.py carrega no banco enquanto as demais ainda estão baixando).
+
+        Retorna lista de dicts com ("content" é um SpooledText — o TXT em
+        DOWNLOAD_DIR — ou None; ver spool.read_text):
+            [{"category": "...", "slug": "...", "url": "...", "content": ...,
+              "status": "ok" | "unchanged" | "error"}]
         """
         results = []
         urls_processed = set()
         total = len(CATEGORY_URLS)
 
-        # 1. Navega até a página para estabelecer sessão
-        self.navigate_to_page()
+        # 1. Navega até a página para estabelecer sessão (só na partida a frio)
+        start = time.perf_counter()
+        browser_mode = FETCH_MODE == "browser"
+        jar = None if browser_mode else self.cookie_jar
+        warm = jar is not None and jar.valid()
+        if warm:
+            logger.info(
+                f"[SCRAPER] Partida a quente: {len(jar.cookies)} cookies válidos por mais "
+                f"{jar.expires_in() / 60:.0f} min — página não aberta"
+            )
+        else:
+            self.navigate_to_page()
+            if jar is not None:
+                jar.store(
+                    self.driver.get_cookies(),
+                    self.driver.execute_script("return navigator.userAgent;"),
+                )
+        if not browser_mode:
+            self.build_http_session()
+        self.startup = {"mode": "warm" if warm else "cold", "seconds": time.perf_counter() - start}
+        logger.info(
+            "[SCRAPER] Partida a %s: %.1fs até o primeiro download",
+            "quente" if warm else "frio", self.startup["seconds"],
+        )
 
         # 2. Baixa todas as 17 categorias conhecidas
         logger.info("=" * 60)
         logger.info(f"[SCRAPER] Baixando {total} categorias (League Wide Stats)")
         logger.info("=" * 60)
 
-        for i, item in enumerate(CATEGORY_URLS, 1):
-            category = item["category"]
-            slug = item["slug"]
-            url = item["url"]
-
-            logger.info(f"[{i:02d}/{total}] {category}")
-            logger.info(f"         URL: {url}")
-
-            content = self.download_txt_content(url)
-
-            if content:
-                self._save_txt_local(slug, content)
-
-            results.append({
-                "category": category.upper(),
-                "slug": slug,
-                "url": url,
-                "content": content,
-            })
-            urls_processed.add(url)
-
-            # Pausa entre downloads
-            time.sleep(2)
+        results.extend(self.download_many(CATEGORY_URLS, on_result))
+        urls_processed.update(item["url"] for item in CATEGORY_URLS)
 
         # 3. Verifica se há categorias extras na página (fallback)
         logger.info("=" * 60)
@@ -318,31 +613,29 @@ class NBAStatsScraper:
         logger.info("=" * 60)
 
         try:
-            self.driver.switch_to.window(self.driver.window_handles[0])
-            self.driver.get(NBA_STATS_URL)
-            time.sleep(5)
-            self._dismiss_cookie_popup()
-            time.sleep(2)
+            if warm:
+                # Sem abrir a página: as extras vistas na última navegação
+                extras = [d for d in jar.extras if d["url"] not in urls_processed]
+                logger.info("[SCRAPER] Partida a quente — extras da última navegação (cookie jar)")
+            else:
+                self.driver.switch_to.window(self.driver.window_handles[0])
+                # No modo HTTP o browser nunca saiu da página; não precisa recarregar
+                if browser_mode or NBA_STATS_URL not in self.driver.current_url:
+                    self.driver.get(NBA_STATS_URL)
+                    time.sleep(5)
+                    self._dismiss_cookie_popup()
+                    time.sleep(2)
 
-            discovered = self.discover_links_from_page()
-            extras = [d for d in discovered if d["url"] not in urls_processed]
+                discovered = self.discover_links_from_page()
+                extras = [d for d in discovered if d["url"] not in urls_processed]
+                if jar is not None:
+                    jar.store_extras(extras)
 
             if extras:
                 logger.info(f"[SCRAPER] {len(extras)} categorias extras encontradas!")
                 for item in extras:
-                    logger.info(f"  [EXTRA] {item['category']} → {item['url']}")
-                    content = self.download_txt_content(item["url"])
-
-                    if content:
-                        self._save_txt_local(item["slug"], content)
-
-                    results.append({
-                        "category": item["category"].upper(),
-                        "slug": item["slug"],
-                        "url": item["url"],
-                        "content": content,
-                    })
-                    time.sleep(2)
+                    logger.info("  [EXTRA] %s → %s", item["category"], item["url"])
+                results.extend(self.download_many(extras, on_result))
             else:
                 logger.info("[SCRAPER] Nenhuma categoria extra encontrada")
 
@@ -350,11 +643,14 @@ class NBAStatsScraper:
             logger.warning(f"[SCRAPER] Erro ao buscar extras: {e}")
 
         # Resumo
-        ok = sum(1 for r in results if r["content"])
-        fail = sum(1 for r in results if not r["content"])
+        ok = sum(1 for r in results if r["status"] == "ok")
+        unchanged = [r for r in results if r["status"] == "unchanged"]
+        fail = sum(1 for r in results if r["status"] == "error")
         logger.info("=" * 60)
         logger.info(f"[SCRAPER] RESUMO: {len(results)} categorias total")
-        logger.info(f"         Sucesso: {ok} | Falha: {fail}")
+        logger.info(f"         Sucesso: {ok} | Inalteradas: {len(unchanged)} | Falha: {fail}")
+        for r in unchanged:
+            logger.info("         unchanged: %s", r["category"])
         logger.info("=" * 60)
 
         return results
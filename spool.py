@@ -0,0 +1,70 @@
+"""
+Conteúdo das categorias em disco, lido só quando a categoria é parseada.
+
+O scraper grava cada TXT baixado em DOWNLOAD_DIR e devolve, no campo
+"content" do resultado, um SpooledText (caminho + tamanho) em vez do
+texto: a lista de resultados do run fica leve, e o pico de memória
+depende das filas do pipeline (PIPELINE_QUEUE_SIZE), não do número de
+categorias. read_text() aceita os dois formatos (str ou SpooledText), e
+peak_rss_mb() dá o pico de memória do processo para o log do run.
+"""
+
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class SpooledText:
+    """Handle de um TXT em disco (UTF-8); read() devolve o texto."""
+
+    __slots__ = ("path", "size")
+
+    def __init__(self, path: str, size: int | None = None):
+        self.path = path
+        self.size = os.path.getsize(path) if size is None else size
+
+    @classmethod
+    def write(cls, path: str, text: str) -> "SpooledText":
+        """Grava `text` em `path` e devolve o handle."""
+        data = text.encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(data)
+        return cls(path, len(data))
+
+    def read(self) -> str:
+        with open(self.path, "rb") as f:
+            return f.read().decode("utf-8", errors="replace")
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __repr__(self) -> str:
+        return f"SpooledText({self.path!r}, {self.size} bytes)"
+
+
+def read_text(content: "str | SpooledText | None") -> str | None:
+    """Texto de um resultado de scrape_all(), lendo do disco se preciso."""
+    if isinstance(content, SpooledText):
+        return content.read()
+    return content
+
+
+def byte_size(content: "str | SpooledText | None") -> int:
+    """Tamanho em bytes (UTF-8) do conteúdo, sem ler o arquivo do disco."""
+    if isinstance(content, SpooledText):
+        return content.size
+    return len(content.encode("utf-8")) if content else 0
+
+
+def peak_rss_mb() -> float | None:
+    """Pico de memória residente do processo (MiB); None sem `resource`."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KiB; macOS, em bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor